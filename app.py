@@ -41,8 +41,13 @@ from services.indexes import (
 
 app = Flask(__name__)
 
+# Serialize jsonify() responses with orjson (falls back to stdlib json if not installed)
+from routes.json_provider import OrjsonProvider
+app.json = OrjsonProvider(app)
+
 # Blueprint registration enabled - routes now use database and proper response formats
 from routes import register_blueprints
+from routes.conditional import conditional_get
 register_blueprints(app)
 
 # Flag to prevent multiple startup checks
@@ -259,6 +264,7 @@ def api_remove_orphans():
 
 
 @app.route('/api/summary')
+@conditional_get(db.PRIVATE_DB_PATH)
 def api_summary():
     """Calculate portfolio summary statistics"""
     stocks = {s['ticker']: s for s in get_stocks()}
@@ -268,8 +274,8 @@ def api_summary():
     by_ticker = {}
     for txn in transactions:
         ticker = txn['ticker']
-        shares = int(txn['shares']) if txn['shares'] else 0
-        price = float(txn['price']) if txn['price'] else 0
+        shares = txn['_shares']
+        price = txn['_price']
         status = (txn.get('status') or '').lower()
 
         # Skip watchlist items - only include buys that are confirmed (status='done')
@@ -60,6 +60,8 @@ STOCKS_FILE = os.path.join(USER_DATA_DIR, 'stocks.csv')
 TRANSACTIONS_FILE = os.path.join(USER_DATA_DIR, 'transactions.csv')
 EXCLUDED_TICKERS_FILE = os.path.join(DATA_DIR, 'excluded_tickers.json')
 TICKER_FAILURES_FILE = os.path.join(DATA_DIR, 'ticker_failures.json')
+INDEX_CACHE_FILE = os.path.join(DATA_DIR, 'index_cache.json')
+INDEX_RESULTS_FILE = os.path.join(DATA_DIR, 'index_results.json')
 
 # ============================================================================
 # Auto-create required directories
@@ -84,6 +86,7 @@ FAILURE_THRESHOLD = _get('ticker_health.failure_threshold', 3)
 PE_RATIO_MULTIPLIER = _get('valuation.pe_ratio_multiplier', 10)
 MIN_EPS_YEARS = _get('valuation.min_eps_years', 3)
 RECOMMENDED_EPS_YEARS = _get('valuation.recommended_eps_years', 8)
+VALUATION_REFRESH_WORKERS = _get('valuation.refresh_workers', 8)
 
 # ============================================================================
 # Recommendation Scoring Weights
@@ -153,9 +156,12 @@ FMP_BATCH_INTERVAL = _get('rate_limits.fmp.batch_interval', 0.2)
 # SEC Rate Limiting
 # ============================================================================
 SEC_RATE_LIMIT = _get('rate_limits.sec.rate_limit', 0.12)
+SEC_RATE_BURST = _get('rate_limits.sec.burst', 1)
 SEC_REQUEST_TIMEOUT = _get('rate_limits.sec.request_timeout', 30)
 SEC_CIK_CACHE_DAYS = _get('rate_limits.sec.cik_cache_days', 7)
 SEC_EPS_CACHE_DAYS = _get('rate_limits.sec.eps_cache_days', 1)
+SEC_UPDATE_WORKERS = _get('rate_limits.sec.update_workers', 8)
+SEC_RESPONSE_CACHE_TTL = _get('rate_limits.sec.response_cache_ttl', 300)
 
 # ============================================================================
 # IBKR Rate Limiting
@@ -180,6 +186,8 @@ EPS_BACKOFF_BASE = _get('rate_limits.eps_backoff_base', 2)
 # Index Provider Settings
 # ============================================================================
 INDEX_PROVIDER_TIMEOUT = _get('index_providers.request_timeout', 30)
+INDEX_PROVIDER_CACHE_TTL = _get('index_providers.cache_ttl', 21600)
+INDEX_PROVIDER_HEDGE_DELAY = _get('index_providers.hedge_delay', 2.0)
 
 # ============================================================================
 # Background Scheduler Settings
@@ -213,5 +221,21 @@ STALENESS_DIVIDEND_STALE_DAYS = _get('staleness.dividend_stale_days', 30)
 # ============================================================================
 # Valid Indices
 # ============================================================================
-# Index definitions moved to services/indexes/ for single source of truth
-from services.indexes import VALID_INDICES, INDEX_NAMES as INDEX_DISPLAY_NAMES
+# Index definitions moved to services/indexes/ for single source of truth.
+# Resolved on first access (PEP 562): services.indexes imports this module,
+# so importing it here would make the two depend on import order.
+_INDEX_EXPORTS = {
+    'VALID_INDICES': 'VALID_INDICES',
+    'INDEX_DISPLAY_NAMES': 'INDEX_NAMES',
+}
+
+
+def __getattr__(name):
+    try:
+        attr = _INDEX_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    import services.indexes
+    value = getattr(services.indexes, attr)
+    globals()[name] = value
+    return value
@@ -112,9 +112,20 @@ def get_all_tracked_tickers() -> Set[str]:
 
 # --- Valuations ---
 
+# Cache for load_valuations(), keyed on the public database file signature
+# (covers writes made through any module or process)
+_valuations_cache = None  # (signature, data)
+
+
+def invalidate_valuations_cache():
+    """Drop the cached valuations so the next load reads from the database."""
+    global _valuations_cache
+    _valuations_cache = None
+
+
 def load_valuations() -> Dict:
     """
-    Load consolidated valuations.
+    Load consolidated valuations (cached until the public database changes).
 
     Returns dict with structure:
     {
@@ -123,16 +134,26 @@ def load_valuations() -> Dict:
         'version': 1
     }
     """
+    global _valuations_cache
+
+    # Take the signature before reading so a concurrent write invalidates the entry
+    signature = db.get_db_signature(db.PUBLIC_DB_PATH)
+    cached = _valuations_cache
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
     valuations = db.get_all_valuations()
 
     # Get last updated
     latest = db.get_latest_valuation_timestamp()
 
-    return {
+    data = {
         'valuations': valuations,
         'last_updated': latest,
         'version': 1
     }
+    _valuations_cache = (signature, data)
+    return data
 
 
 def get_valuation(ticker: str) -> Optional[Dict]:
@@ -143,11 +164,13 @@ def get_valuation(ticker: str) -> Optional[Dict]:
 def update_valuation(ticker: str, valuation: Dict):
     """Update valuation for a single ticker."""
     db.update_valuation(ticker, valuation)
+    invalidate_valuations_cache()
 
 
 def bulk_update_valuations(valuations: Dict[str, Dict]):
     """Bulk update multiple valuations at once."""
     db.bulk_update_valuations(valuations)
+    invalidate_valuations_cache()
 
 
 def save_single_valuation(ticker: str, valuation: Dict):
@@ -164,6 +187,7 @@ def save_single_valuation(ticker: str, valuation: Dict):
         'updated': datetime.now().isoformat()
     }
     db.update_valuation(ticker, update_data)
+    invalidate_valuations_cache()
 
 
 def get_valuations_for_index(index_name: str, index_tickers: List[str] = None) -> List[Dict]:
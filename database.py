@@ -21,13 +21,16 @@ Public Database Tables:
 - cik_mapping: Ticker to CIK mapping
 - ticker_failures: Failed ticker tracking
 - sec_filings: 10-K filing URLs
+- sec_http_meta: HTTP cache validators for SEC endpoints
 - metadata: Cache/system metadata
 """
 
+import json
 import os
 import sqlite3
+import threading
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Any
 from contextlib import contextmanager
 
 # Database paths
@@ -39,40 +42,103 @@ PUBLIC_DB_PATH = os.path.join(BASE_DIR, 'data_public', 'public.db')
 from services.indexes import VALID_INDICES, INDIVIDUAL_INDICES, INDEX_NAMES
 
 
-def _get_connection(db_path: str) -> sqlite3.Connection:
-    """Get a database connection with row factory enabled."""
+# Per-connection tuning: WAL lets readers proceed during writes, mmap serves
+# reads from the OS page cache, NORMAL sync is safe under WAL, and sorts /
+# temp indexes stay in memory.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -64000",
+)
+
+# Thread-local pool: one long-lived connection per (thread, database path)
+_local = threading.local()
+
+
+def _open_connection(db_path: str) -> sqlite3.Connection:
+    """Open a new tuned database connection with row factory enabled."""
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _get_connection(db_path: str) -> sqlite3.Connection:
+    """Get this thread's pooled connection for a database, opening it on first use."""
+    connections = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = {}
+        _local.depth = {}
+
+    conn = connections.get(db_path)
+    if conn is None:
+        conn = connections[db_path] = _open_connection(db_path)
     return conn
 
 
 @contextmanager
-def get_public_db():
-    """Context manager for public database connections."""
-    conn = _get_connection(PUBLIC_DB_PATH)
+def _connection_scope(db_path: str):
+    """
+    Yield the pooled connection for a database inside a transaction scope.
+
+    Nested scopes on the same thread share the outermost transaction: only
+    the outermost scope commits or rolls back.
+    """
+    conn = _get_connection(db_path)
+    depth = _local.depth.get(db_path, 0)
+    _local.depth[db_path] = depth + 1
     try:
         yield conn
-        conn.commit()
+        if depth == 0:
+            conn.commit()
     except Exception:
-        conn.rollback()
+        if depth == 0:
+            conn.rollback()
         raise
     finally:
-        conn.close()
+        _local.depth[db_path] = depth
+
+
+@contextmanager
+def get_public_db():
+    """Context manager for public database connections."""
+    with _connection_scope(PUBLIC_DB_PATH) as conn:
+        yield conn
 
 
 @contextmanager
 def get_private_db():
     """Context manager for private database connections."""
-    conn = _get_connection(PRIVATE_DB_PATH)
-    try:
+    with _connection_scope(PRIVATE_DB_PATH) as conn:
         yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
+
+
+def get_db_signature(db_path: str) -> Tuple:
+    """
+    Get a cheap signature that changes whenever a database file is written.
+
+    Combines SQLite's file change counter (header bytes 24-27, bumped on every
+    commit in rollback-journal mode) with (mtime_ns, size) of the database and
+    its WAL file, so no connection has to be opened.
+    """
+    signature = []
+    try:
+        with open(db_path, 'rb') as f:
+            f.seek(24)
+            signature.append(f.read(4))
+    except OSError:
+        signature.append(None)
+    for path in (db_path, db_path + '-wal'):
+        try:
+            st = os.stat(path)
+            signature.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
 
 
 # Backward compatibility alias - defaults to public database
@@ -87,6 +153,15 @@ def init_database():
     """Initialize both database schemas."""
     _init_public_database()
     _init_private_database()
+
+    # SQLite silently keeps the rollback journal where WAL is unsupported
+    # (e.g. network filesystems) - make that visible
+    for db_path in (PUBLIC_DB_PATH, PRIVATE_DB_PATH):
+        with _connection_scope(db_path) as conn:
+            journal_mode = conn.execute('PRAGMA journal_mode').fetchone()[0]
+        if journal_mode.lower() != 'wal':
+            print(f"[Database] Warning: {os.path.basename(db_path)} is using {journal_mode} journal mode, not WAL")
+
     print("[Database] Both schemas initialized successfully")
 
 
@@ -227,6 +302,16 @@ def _init_public_database():
             )
         ''')
 
+        # SEC HTTP cache validators (ETag / Last-Modified per endpoint URL)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS sec_http_meta (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                updated TEXT
+            )
+        ''')
+
         # Create indexes
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_ticker_indexes_ticker ON ticker_indexes(ticker)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_ticker_indexes_index ON ticker_indexes(index_name)')
@@ -264,6 +349,13 @@ def _init_public_database():
         if 'enabled' not in index_columns:
             cursor.execute('ALTER TABLE indexes ADD COLUMN enabled INTEGER DEFAULT 1')
 
+        # Add http_validators column to sec_companies if it doesn't exist
+        # (JSON: concept -> {etag, last_modified} for conditional SEC requests)
+        cursor.execute('PRAGMA table_info(sec_companies)')
+        sec_company_columns = {row[1] for row in cursor.fetchall()}
+        if 'http_validators' not in sec_company_columns:
+            cursor.execute('ALTER TABLE sec_companies ADD COLUMN http_validators TEXT')
+
         # Insert default indexes
         for name, (display_name, short_name) in INDEX_NAMES.items():
             cursor.execute('''
@@ -272,6 +364,15 @@ def _init_public_database():
             ''', (name, display_name, short_name))
 
 
+# Realized gain of a sell, estimated from its sale total and recorded gain_pct:
+# total_sale - total_sale / (1 + gain_pct / 100). Stored in transactions.gain_abs.
+_GAIN_ABS_EXPR = '''
+    CASE WHEN action = 'sell' AND gain_pct IS NOT NULL AND gain_pct != 0
+         THEN shares * price - shares * price / (1 + gain_pct / 100.0)
+    END
+'''
+
+
 def _init_private_database():
     """Initialize the private database schema."""
     with get_private_db() as conn:
@@ -296,13 +397,26 @@ def _init_private_database():
                 price REAL,
                 gain_pct REAL,
                 date TEXT,
-                status TEXT
+                status TEXT,
+                gain_abs REAL
             )
         ''')
 
         # Create indexes
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_transactions_ticker ON transactions(ticker)')
 
+        # Add gain_abs column to transactions if it doesn't exist
+        cursor.execute('PRAGMA table_info(transactions)')
+        transaction_columns = {row[1] for row in cursor.fetchall()}
+        if 'gain_abs' not in transaction_columns:
+            cursor.execute('ALTER TABLE transactions ADD COLUMN gain_abs REAL')
+
+        # Backfill realized gains for sells that don't have one yet (e.g. migrated rows)
+        cursor.execute(f'''
+            UPDATE transactions SET gain_abs = {_GAIN_ABS_EXPR}
+            WHERE gain_abs IS NULL AND action = 'sell'
+        ''')
+
 
 # =============================================================================
 # Ticker Status Operations
@@ -587,116 +701,77 @@ def get_valuation(ticker: str) -> Optional[Dict]:
         return None
 
 
-def update_valuation(ticker: str, valuation: Dict):
-    """Update valuation for a single ticker."""
-    ticker = ticker.upper()
+_VALUATION_UPSERT_SQL = '''
+    INSERT INTO valuations (ticker, company_name, current_price, price_source, eps_avg, eps_years,
+                           eps_source, annual_dividend, estimated_value, price_vs_value,
+                           fifty_two_week_high, fifty_two_week_low, off_high_pct,
+                           price_change_1m, price_change_3m, in_selloff, selloff_severity, updated)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(ticker) DO UPDATE SET
+        company_name = excluded.company_name,
+        current_price = excluded.current_price,
+        price_source = excluded.price_source,
+        eps_avg = excluded.eps_avg,
+        eps_years = excluded.eps_years,
+        eps_source = excluded.eps_source,
+        annual_dividend = excluded.annual_dividend,
+        estimated_value = excluded.estimated_value,
+        price_vs_value = excluded.price_vs_value,
+        fifty_two_week_high = excluded.fifty_two_week_high,
+        fifty_two_week_low = excluded.fifty_two_week_low,
+        off_high_pct = excluded.off_high_pct,
+        price_change_1m = excluded.price_change_1m,
+        price_change_3m = excluded.price_change_3m,
+        in_selloff = excluded.in_selloff,
+        selloff_severity = excluded.selloff_severity,
+        updated = excluded.updated
+'''
+
+
+def _valuation_params(ticker: str, valuation: Dict, updated: str) -> Tuple:
+    """Stamp a valuation dict and build its upsert parameters."""
     valuation['ticker'] = ticker
-    valuation['updated'] = datetime.now().isoformat()
+    valuation['updated'] = updated
+    return (
+        ticker,
+        valuation.get('company_name'),
+        valuation.get('current_price'),
+        valuation.get('price_source'),
+        valuation.get('eps_avg'),
+        valuation.get('eps_years'),
+        valuation.get('eps_source'),
+        valuation.get('annual_dividend'),
+        valuation.get('estimated_value'),
+        valuation.get('price_vs_value'),
+        valuation.get('fifty_two_week_high'),
+        valuation.get('fifty_two_week_low'),
+        valuation.get('off_high_pct'),
+        valuation.get('price_change_1m'),
+        valuation.get('price_change_3m'),
+        1 if valuation.get('in_selloff') else 0,
+        valuation.get('selloff_severity'),
+        updated
+    )
 
-    with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO valuations (ticker, company_name, current_price, price_source, eps_avg, eps_years,
-                                   eps_source, annual_dividend, estimated_value, price_vs_value,
-                                   fifty_two_week_high, fifty_two_week_low, off_high_pct,
-                                   price_change_1m, price_change_3m, in_selloff, selloff_severity, updated)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(ticker) DO UPDATE SET
-                company_name = excluded.company_name,
-                current_price = excluded.current_price,
-                price_source = excluded.price_source,
-                eps_avg = excluded.eps_avg,
-                eps_years = excluded.eps_years,
-                eps_source = excluded.eps_source,
-                annual_dividend = excluded.annual_dividend,
-                estimated_value = excluded.estimated_value,
-                price_vs_value = excluded.price_vs_value,
-                fifty_two_week_high = excluded.fifty_two_week_high,
-                fifty_two_week_low = excluded.fifty_two_week_low,
-                off_high_pct = excluded.off_high_pct,
-                price_change_1m = excluded.price_change_1m,
-                price_change_3m = excluded.price_change_3m,
-                in_selloff = excluded.in_selloff,
-                selloff_severity = excluded.selloff_severity,
-                updated = excluded.updated
-        ''', (
-            ticker,
-            valuation.get('company_name'),
-            valuation.get('current_price'),
-            valuation.get('price_source'),
-            valuation.get('eps_avg'),
-            valuation.get('eps_years'),
-            valuation.get('eps_source'),
-            valuation.get('annual_dividend'),
-            valuation.get('estimated_value'),
-            valuation.get('price_vs_value'),
-            valuation.get('fifty_two_week_high'),
-            valuation.get('fifty_two_week_low'),
-            valuation.get('off_high_pct'),
-            valuation.get('price_change_1m'),
-            valuation.get('price_change_3m'),
-            1 if valuation.get('in_selloff') else 0,
-            valuation.get('selloff_severity'),
-            valuation['updated']
-        ))
+
+def update_valuation(ticker: str, valuation: Dict):
+    """Update valuation for a single ticker."""
+    bulk_update_valuations({ticker: valuation})
 
 
 def bulk_update_valuations(valuations: Dict[str, Dict]):
-    """Bulk update multiple valuations at once."""
+    """Bulk update multiple valuations at once (single transaction)."""
+    if not valuations:
+        return
+
     now = datetime.now().isoformat()
+    params = [
+        _valuation_params(ticker.upper(), valuation, now)
+        for ticker, valuation in valuations.items()
+    ]
 
     with get_db() as conn:
-        cursor = conn.cursor()
-
-        for ticker, valuation in valuations.items():
-            ticker = ticker.upper()
-            valuation['ticker'] = ticker
-            valuation['updated'] = now
-
-            cursor.execute('''
-                INSERT INTO valuations (ticker, company_name, current_price, price_source, eps_avg, eps_years,
-                                       eps_source, annual_dividend, estimated_value, price_vs_value,
-                                       fifty_two_week_high, fifty_two_week_low, off_high_pct,
-                                       price_change_1m, price_change_3m, in_selloff, selloff_severity, updated)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(ticker) DO UPDATE SET
-                    company_name = excluded.company_name,
-                    current_price = excluded.current_price,
-                    price_source = excluded.price_source,
-                    eps_avg = excluded.eps_avg,
-                    eps_years = excluded.eps_years,
-                    eps_source = excluded.eps_source,
-                    annual_dividend = excluded.annual_dividend,
-                    estimated_value = excluded.estimated_value,
-                    price_vs_value = excluded.price_vs_value,
-                    fifty_two_week_high = excluded.fifty_two_week_high,
-                    fifty_two_week_low = excluded.fifty_two_week_low,
-                    off_high_pct = excluded.off_high_pct,
-                    price_change_1m = excluded.price_change_1m,
-                    price_change_3m = excluded.price_change_3m,
-                    in_selloff = excluded.in_selloff,
-                    selloff_severity = excluded.selloff_severity,
-                    updated = excluded.updated
-            ''', (
-                ticker,
-                valuation.get('company_name'),
-                valuation.get('current_price'),
-                valuation.get('price_source'),
-                valuation.get('eps_avg'),
-                valuation.get('eps_years'),
-                valuation.get('eps_source'),
-                valuation.get('annual_dividend'),
-                valuation.get('estimated_value'),
-                valuation.get('price_vs_value'),
-                valuation.get('fifty_two_week_high'),
-                valuation.get('fifty_two_week_low'),
-                valuation.get('off_high_pct'),
-                valuation.get('price_change_1m'),
-                valuation.get('price_change_3m'),
-                1 if valuation.get('in_selloff') else 0,
-                valuation.get('selloff_severity'),
-                valuation['updated']
-            ))
+        conn.executemany(_VALUATION_UPSERT_SQL, params)
 
 
 def get_valuations_for_index(index_name: str) -> List[Dict]:
@@ -729,6 +804,34 @@ def get_all_valuations() -> Dict[str, Dict]:
         return result
 
 
+def get_current_prices(tickers: List[str]) -> Dict[str, float]:
+    """Get stored current prices for a list of tickers in one query."""
+    if not tickers:
+        return {}
+
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            SELECT ticker, current_price FROM valuations
+            WHERE ticker IN ({','.join('?' * len(tickers))})
+        ''', [t.upper() for t in tickers])
+        return {row['ticker']: row['current_price'] for row in cursor.fetchall()}
+
+
+def get_cached_price_rows(tickers: List[str]) -> Dict[str, Dict]:
+    """Get stored price, source and update time for a list of tickers in one query."""
+    if not tickers:
+        return {}
+
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            SELECT ticker, current_price, price_source, updated FROM valuations
+            WHERE ticker IN ({','.join('?' * len(tickers))})
+        ''', [t.upper() for t in tickers])
+        return {row['ticker']: dict(row) for row in cursor.fetchall()}
+
+
 def get_undervalued_tickers(threshold: float = -20.0) -> List[Dict]:
     """Get all tickers that are undervalued by more than threshold %."""
     with get_db() as conn:
@@ -921,6 +1024,14 @@ def get_eps_history(ticker: str) -> List[Dict]:
         return [dict(r) for r in cursor.fetchall()]
 
 
+def _sec_company_from_row(row: sqlite3.Row) -> Dict:
+    """Convert a sec_companies row to a company dict (without EPS history)."""
+    result = dict(row)
+    result['sec_no_eps'] = bool(result['sec_no_eps'])
+    result['http_validators'] = json.loads(result['http_validators']) if result.get('http_validators') else {}
+    return result
+
+
 def get_sec_company(ticker: str) -> Optional[Dict]:
     """Get SEC company data for a ticker."""
     with get_db() as conn:
@@ -930,8 +1041,7 @@ def get_sec_company(ticker: str) -> Optional[Dict]:
         if not row:
             return None
 
-        result = dict(row)
-        result['sec_no_eps'] = bool(result['sec_no_eps'])
+        result = _sec_company_from_row(row)
 
         # Get EPS history
         cursor.execute('''
@@ -944,6 +1054,60 @@ def get_sec_company(ticker: str) -> Optional[Dict]:
         return result
 
 
+def get_sec_companies(tickers: List[str]) -> Dict[str, Dict]:
+    """Get SEC company data with EPS history for several tickers in two queries."""
+    if not tickers:
+        return {}
+
+    upper = [t.upper() for t in tickers]
+    placeholders = ','.join('?' * len(upper))
+
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f'SELECT * FROM sec_companies WHERE ticker IN ({placeholders})', upper)
+        companies = {}
+        for row in cursor.fetchall():
+            company = companies[row['ticker']] = _sec_company_from_row(row)
+            company['eps_history'] = []
+
+        cursor.execute(f'''
+            SELECT ticker, year, eps, filed, period_start, period_end, eps_type
+            FROM eps_history WHERE ticker IN ({placeholders})
+            ORDER BY ticker, year DESC
+        ''', upper)
+        for row in cursor.fetchall():
+            company = companies.get(row['ticker'])
+            if company is not None:
+                eps = dict(row)
+                del eps['ticker']
+                company['eps_history'].append(eps)
+
+        return companies
+
+
+def get_sec_company_updated(ticker: str) -> Optional[str]:
+    """Get just the last update timestamp of a ticker's SEC company data."""
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute('SELECT updated FROM sec_companies WHERE ticker = ?', (ticker.upper(),))
+        row = cursor.fetchone()
+        return row['updated'] if row else None
+
+
+def get_sec_companies_updated(tickers: List[str]) -> Dict[str, str]:
+    """Get last update timestamps of SEC company data for a list of tickers in one query."""
+    if not tickers:
+        return {}
+
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            SELECT ticker, updated FROM sec_companies
+            WHERE ticker IN ({','.join('?' * len(tickers))})
+        ''', [t.upper() for t in tickers])
+        return {row['ticker']: row['updated'] for row in cursor.fetchall()}
+
+
 def save_sec_company(ticker: str, data: Dict):
     """Save SEC company data for a ticker."""
     ticker = ticker.upper()
@@ -953,31 +1117,33 @@ def save_sec_company(ticker: str, data: Dict):
 
         # Upsert company record
         cursor.execute('''
-            INSERT INTO sec_companies (ticker, cik, company_name, sec_no_eps, reason, updated)
-            VALUES (?, ?, ?, ?, ?, ?)
+            INSERT INTO sec_companies (ticker, cik, company_name, sec_no_eps, reason, updated, http_validators)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
             ON CONFLICT(ticker) DO UPDATE SET
                 cik = excluded.cik,
                 company_name = excluded.company_name,
                 sec_no_eps = excluded.sec_no_eps,
                 reason = excluded.reason,
-                updated = excluded.updated
+                updated = excluded.updated,
+                http_validators = excluded.http_validators
         ''', (
             ticker,
             data.get('cik'),
             data.get('company_name'),
             1 if data.get('sec_no_eps') else 0,
             data.get('reason'),
-            data.get('updated', datetime.now().isoformat())
+            data.get('updated', datetime.now().isoformat()),
+            json.dumps(data['http_validators']) if data.get('http_validators') else None
         ))
 
         # Update EPS history
         if 'eps_history' in data:
             cursor.execute('DELETE FROM eps_history WHERE ticker = ?', (ticker,))
-            for eps in data['eps_history']:
-                cursor.execute('''
-                    INSERT INTO eps_history (ticker, year, eps, filed, period_start, period_end, eps_type)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
+            cursor.executemany('''
+                INSERT INTO eps_history (ticker, year, eps, filed, period_start, period_end, eps_type)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', [
+                (
                     ticker,
                     eps.get('year'),
                     eps.get('eps'),
@@ -985,17 +1151,27 @@ def save_sec_company(ticker: str, data: Dict):
                     eps.get('start') or eps.get('period_start'),
                     eps.get('end') or eps.get('period_end'),
                     eps.get('eps_type')
-                ))
+                )
+                for eps in data['eps_history']
+            ])
+
+
+def save_sec_companies(companies: Dict[str, Dict]):
+    """Save SEC company data for several tickers in a single transaction."""
+    with get_db():
+        for ticker, data in companies.items():
+            save_sec_company(ticker, data)
 
 
 def has_sec_eps(ticker: str) -> bool:
     """Check if we have any SEC EPS data for a ticker."""
     with get_db() as conn:
         cursor = conn.cursor()
+        # EXISTS stops at the first matching index entry instead of counting them all
         cursor.execute('''
-            SELECT COUNT(*) as count FROM eps_history WHERE ticker = ?
+            SELECT EXISTS(SELECT 1 FROM eps_history WHERE ticker = ?) as found
         ''', (ticker.upper(),))
-        return cursor.fetchone()['count'] > 0
+        return bool(cursor.fetchone()['found'])
 
 
 def get_sec_company_count() -> int:
@@ -1016,9 +1192,12 @@ def delete_sec_company(ticker: str):
         conn.commit()
 
 
-def add_new_eps_years(ticker: str, eps_list: list) -> int:
+def add_new_eps_years(ticker: str, eps_list: list, http_validators: Optional[Dict] = None) -> int:
     """
     Add only NEW EPS years that don't exist in the database.
+
+    http_validators, when given, replaces the stored per-concept HTTP
+    validators so the next conditional refresh sends current ones.
     Returns the count of new years added.
     """
     ticker = ticker.upper()
@@ -1045,10 +1224,15 @@ def add_new_eps_years(ticker: str, eps_list: list) -> int:
             if cursor.rowcount > 0:
                 added += 1
 
-        # Update the company's updated timestamp
-        cursor.execute('''
-            UPDATE sec_companies SET updated = ? WHERE ticker = ?
-        ''', (datetime.now().isoformat(), ticker))
+        # Update the company's updated timestamp (and validators, if fetched)
+        if http_validators is not None:
+            cursor.execute('''
+                UPDATE sec_companies SET updated = ?, http_validators = ? WHERE ticker = ?
+            ''', (datetime.now().isoformat(), json.dumps(http_validators) if http_validators else None, ticker))
+        else:
+            cursor.execute('''
+                UPDATE sec_companies SET updated = ? WHERE ticker = ?
+            ''', (datetime.now().isoformat(), ticker))
 
         conn.commit()
 
@@ -1099,6 +1283,35 @@ def save_sec_filings(ticker: str, filings: List[Dict]):
             ))
 
 
+def touch_sec_filings(ticker: str):
+    """Mark a ticker's stored filings as freshly checked without rewriting them."""
+    with get_db() as conn:
+        conn.execute('UPDATE sec_filings SET updated = ? WHERE ticker = ?',
+                     (datetime.now().isoformat(), ticker.upper()))
+
+
+def get_sec_http_meta(url: str) -> Optional[Dict]:
+    """Get the stored HTTP cache validators for an SEC URL."""
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute('SELECT etag, last_modified FROM sec_http_meta WHERE url = ?', (url,))
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
+
+def save_sec_http_meta(url: str, etag: Optional[str], last_modified: Optional[str]):
+    """Save HTTP cache validators returned for an SEC URL."""
+    with get_db() as conn:
+        conn.execute('''
+            INSERT INTO sec_http_meta (url, etag, last_modified, updated)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET
+                etag = excluded.etag,
+                last_modified = excluded.last_modified,
+                updated = excluded.updated
+        ''', (url, etag, last_modified, datetime.now().isoformat()))
+
+
 def get_sec_filings_last_updated(ticker: str) -> Optional[str]:
     """Get the last update timestamp for a ticker's filings."""
     with get_db() as conn:
@@ -1148,17 +1361,17 @@ def save_cik_mapping(data: Dict):
     now = datetime.now().isoformat()
 
     with get_db() as conn:
-        cursor = conn.cursor()
-
-        for ticker, info in data.get('tickers', {}).items():
-            cursor.execute('''
-                INSERT INTO cik_mapping (ticker, cik, name, updated)
-                VALUES (?, ?, ?, ?)
-                ON CONFLICT(ticker) DO UPDATE SET
-                    cik = excluded.cik,
-                    name = excluded.name,
-                    updated = excluded.updated
-            ''', (ticker, info.get('cik'), info.get('name'), now))
+        conn.executemany('''
+            INSERT INTO cik_mapping (ticker, cik, name, updated)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(ticker) DO UPDATE SET
+                cik = excluded.cik,
+                name = excluded.name,
+                updated = excluded.updated
+        ''', [
+            (ticker, info.get('cik'), info.get('name'), now)
+            for ticker, info in data.get('tickers', {}).items()
+        ])
 
 
 def get_cik_for_ticker(ticker: str) -> Optional[str]:
@@ -1414,6 +1627,14 @@ def get_stocks() -> List[Dict]:
         return [dict(row) for row in cursor.fetchall()]
 
 
+def stock_exists(ticker: str) -> bool:
+    """Check if a stock is already in the registry."""
+    with get_private_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute('SELECT 1 FROM stocks WHERE ticker = ? LIMIT 1', (ticker.upper(),))
+        return cursor.fetchone() is not None
+
+
 def add_stock(ticker: str, name: str, stock_type: str = 'stock'):
     """Add a stock to the registry."""
     with get_private_db() as conn:
@@ -1442,6 +1663,18 @@ def get_transactions() -> List[Dict]:
         return [dict(row) for row in cursor.fetchall()]
 
 
+def iter_transactions() -> Iterator[Dict]:
+    """Yield user transactions one at a time without materializing the full list."""
+    # Dedicated connection: the open cursor outlives the caller's request code
+    conn = _open_connection(PRIVATE_DB_PATH)
+    try:
+        cursor = conn.execute('SELECT * FROM transactions ORDER BY id')
+        for row in cursor:
+            yield dict(row)
+    finally:
+        conn.close()
+
+
 def get_transactions_for_ticker(ticker: str) -> List[Dict]:
     """Get transactions for a specific ticker."""
     with get_private_db() as conn:
@@ -1459,7 +1692,9 @@ def add_transaction(ticker: str, action: str, shares: int, price: float,
             INSERT INTO transactions (ticker, action, shares, price, gain_pct, date, status)
             VALUES (?, ?, ?, ?, ?, ?, ?)
         ''', (ticker.upper(), action, shares, price, gain_pct, date, status))
-        return cursor.lastrowid
+        txn_id = cursor.lastrowid
+        cursor.execute(f'UPDATE transactions SET gain_abs = {_GAIN_ABS_EXPR} WHERE id = ?', (txn_id,))
+        return txn_id
 
 
 def update_transaction(txn_id: int, updates: Dict):
@@ -1469,7 +1704,7 @@ def update_transaction(txn_id: int, updates: Dict):
         set_parts = []
         values = []
         for key, value in updates.items():
-            if key != 'id':
+            if key not in ('id', 'gain_abs'):
                 set_parts.append(f"{key} = ?")
                 values.append(value)
 
@@ -1478,6 +1713,8 @@ def update_transaction(txn_id: int, updates: Dict):
             cursor.execute(f'''
                 UPDATE transactions SET {', '.join(set_parts)} WHERE id = ?
             ''', values)
+            # Keep the denormalized realized gain in sync with the edited row
+            cursor.execute(f'UPDATE transactions SET gain_abs = {_GAIN_ABS_EXPR} WHERE id = ?', (txn_id,))
 
 
 def delete_transaction(txn_id: int):
@@ -1487,6 +1724,59 @@ def delete_transaction(txn_id: int):
         cursor.execute('DELETE FROM transactions WHERE id = ?', (txn_id,))
 
 
+def get_realized_gain_total() -> float:
+    """Sum realized gains across completed sells (precomputed gain_abs)."""
+    with get_private_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute('''
+            SELECT COALESCE(SUM(gain_abs), 0) as total
+            FROM transactions
+            WHERE action = 'sell' AND gain_abs IS NOT NULL
+        ''')
+        return cursor.fetchone()['total']
+
+
+def _realized_sells_filter(start_date: str = None, end_date: str = None) -> Tuple[str, List]:
+    """Build the WHERE clause for completed sells, optionally within a date range."""
+    where = "action = 'sell' AND gain_abs IS NOT NULL"
+    params = []
+    if start_date:
+        where += ' AND date >= ?'
+        params.append(start_date)
+    if end_date:
+        where += ' AND date <= ?'
+        params.append(end_date)
+    return where, params
+
+
+def get_realized_sells(start_date: str = None, end_date: str = None) -> List[Dict]:
+    """Get completed sells (with a gain_pct), optionally within a date range, ordered by date."""
+    where, params = _realized_sells_filter(start_date, end_date)
+    with get_private_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f'SELECT * FROM transactions WHERE {where} ORDER BY date, id', params)
+        return [dict(row) for row in cursor.fetchall()]
+
+
+def get_realized_gain_by_month(start_date: str = None, end_date: str = None) -> List[Dict]:
+    """
+    Get realized gains grouped by month (YYYY-MM), optionally within a date range.
+
+    Returns list of dicts with 'month', 'gain' and 'count' keys, ordered by month.
+    """
+    where, params = _realized_sells_filter(start_date, end_date)
+    with get_private_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            SELECT substr(date, 1, 7) as month, SUM(gain_abs) as gain, COUNT(*) as count
+            FROM transactions
+            WHERE {where} AND length(date) >= 7
+            GROUP BY month
+            ORDER BY month
+        ''', params)
+        return [dict(row) for row in cursor.fetchall()]
+
+
 def get_next_transaction_id() -> int:
     """Get the next available transaction ID."""
     with get_private_db() as conn:
@@ -147,7 +147,8 @@ def migrate_sec_companies(dry_run=False):
         print("  No SEC companies directory found, skipping.")
         return 0
 
-    files = [f for f in os.listdir(COMPANIES_DIR) if f.endswith('.json')]
+    with os.scandir(COMPANIES_DIR) as entries:
+        files = [e for e in entries if e.name.endswith('.json') and e.is_file()]
     print(f"  Found {len(files)} SEC company files to migrate")
 
     if dry_run:
@@ -155,10 +156,9 @@ def migrate_sec_companies(dry_run=False):
         return len(files)
 
     migrated = 0
-    for filename in files:
-        ticker = filename.replace('.json', '')
-        filepath = os.path.join(COMPANIES_DIR, filename)
-        data = load_json_file(filepath)
+    for entry in files:
+        ticker = entry.name.replace('.json', '')
+        data = load_json_file(entry.path)
 
         if data:
             db.save_sec_company(ticker, data)
@@ -334,11 +334,10 @@ def archive_flat_files(dry_run=False):
 
     # Archive company files
     if os.path.exists(COMPANIES_DIR):
-        company_files = [f for f in os.listdir(COMPANIES_DIR) if f.endswith('.json')]
-        for filename in company_files:
-            src = os.path.join(COMPANIES_DIR, filename)
-            dst = os.path.join(archive_companies, filename)
-            shutil.move(src, dst)
+        with os.scandir(COMPANIES_DIR) as entries:
+            company_files = [e for e in entries if e.name.endswith('.json') and e.is_file()]
+        for entry in company_files:
+            shutil.move(entry.path, os.path.join(archive_companies, entry.name))
             archived += 1
 
         # Remove empty companies directory
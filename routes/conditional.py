@@ -0,0 +1,46 @@
+"""
+Conditional GET support for read-only API routes.
+
+Routes whose output depends only on database contents can be wrapped with
+@conditional_get(...). The ETag is derived from the database file
+signatures plus the request path/query, so unchanged data is answered with
+304 Not Modified without running the view or serializing a response.
+"""
+
+import hashlib
+from functools import wraps
+
+from flask import make_response, request
+
+import database as db
+
+
+def _compute_etag(db_paths) -> str:
+    """Build an ETag from the request and the current database signatures."""
+    key = repr((request.full_path, [db.get_db_signature(path) for path in db_paths]))
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def conditional_get(*db_paths):
+    """
+    Decorate a GET view with ETag / If-None-Match handling.
+
+    Args:
+        db_paths: Database file paths the view's output depends on
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            etag = _compute_etag(db_paths)
+
+            if request.if_none_match.contains(etag):
+                response = make_response('', 304)
+                response.set_etag(etag)
+                return response
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                response.set_etag(etag)
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,56 @@
+"""
+Fast JSON provider for Flask responses.
+
+Serializes jsonify() responses with orjson when it is installed, falling
+back to Flask's default stdlib-based provider otherwise.
+"""
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _default(obj):
+    """Serialize types orjson passes through, matching Flask's default provider."""
+    return DefaultJSONProvider.default(obj)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that uses orjson for serialization.
+
+    Keeps Flask's behavior for sorted keys, HTTP-date datetimes and debug
+    indentation. Non-string dict keys (e.g. integer years) are converted to
+    strings like the stdlib encoder does.
+    """
+
+    def _options(self, indent: bool = False) -> int:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs) -> str:
+        if not HAS_ORJSON or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=_default, option=self._options()).decode()
+
+    def loads(self, s, **kwargs):
+        if not HAS_ORJSON or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if not HAS_ORJSON:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        body = orjson.dumps(obj, default=_default, option=self._options(indent)) + b'\n'
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -8,11 +8,14 @@ Handles:
 - GET /api/performance - Historical performance
 """
 
+import numpy as np
 from flask import Blueprint, jsonify, request
 from datetime import datetime, timedelta
 import data_manager
-from services.holdings import calculate_holdings, get_transactions
-from services.stock_utils import fetch_multiple_prices
+import database as db
+from .conditional import conditional_get
+from services.holdings import calculate_holdings
+from services.stock_utils import fetch_multiple_prices, get_cached_prices
 from config import PRICE_CACHE_DURATION
 
 summary_bp = Blueprint('summary', __name__, url_prefix='/api')
@@ -22,53 +25,56 @@ summary_bp = Blueprint('summary', __name__, url_prefix='/api')
 def api_prices():
     """Fetch current prices for confirmed holdings only."""
     holdings = calculate_holdings(confirmed_only=True)
-    tickers = [t for t, h in holdings.items() if h['shares'] > 0]
-    prices = fetch_multiple_prices(tickers)
+    held = [(t, h) for t, h in holdings.items() if h['shares'] > 0]
+
+    # Serve cache-hot tickers directly; only go to providers for the rest
+    prices, misses = get_cached_prices([t for t, _ in held])
+    if misses:
+        prices.update(fetch_multiple_prices(misses, skip_cache=True))
 
     # Get cached valuations for updated timestamps
-    all_valuations = data_manager.load_valuations().get('valuations', {})
+    get_valuation = data_manager.load_valuations().get('valuations', {}).get
+
+    # Stage numeric fields as arrays so the math and rounding run vectorized
+    priced = [(t, h, prices[t]) for t, h in held if prices.get(t) is not None]
+    shares = np.array([h['shares'] for _, h, _ in priced], dtype=float)
+    cost_basis = np.array([h['total_cost'] for _, h, _ in priced], dtype=float)
+    current_price = np.array([p for _, _, p in priced], dtype=float)
 
     # Calculate unrealized gains
-    results = {}
-    total_value = 0
-    total_cost = 0
-    total_gain = 0
-
-    for ticker in tickers:
-        if ticker in prices:
-            holding = holdings[ticker]
-            current_price = prices[ticker]
-            current_value = current_price * holding['shares']
-            cost_basis = holding['total_cost']
-            unrealized_gain = current_value - cost_basis
-            unrealized_pct = (unrealized_gain / cost_basis * 100) if cost_basis > 0 else 0
-
-            total_value += current_value
-            total_cost += cost_basis
-            total_gain += unrealized_gain
-
-            val = all_valuations.get(ticker, {})
-
-            results[ticker] = {
-                'price': round(current_price, 2),
-                'name': holding['name'],
-                'shares': holding['shares'],
-                'current_value': round(current_value, 2),
-                'cost_basis': round(cost_basis, 2),
-                'unrealized_gain': round(unrealized_gain, 2),
-                'unrealized_pct': round(unrealized_pct, 1),
-                'updated': val.get('updated')
-            }
+    current_value = current_price * shares
+    unrealized_gain = current_value - cost_basis
+    with np.errstate(divide='ignore', invalid='ignore'):
+        unrealized_pct = np.where(cost_basis > 0, unrealized_gain / cost_basis * 100, 0.0)
+
+    rounded = np.round(np.stack([current_price, current_value, cost_basis, unrealized_gain]), 2).tolist()
+    rounded_pct = np.round(unrealized_pct, 1).tolist()
 
+    results = {}
+    for i, (ticker, holding, _) in enumerate(priced):
+        val = get_valuation(ticker, {})
+        results[ticker] = {
+            'price': rounded[0][i],
+            'name': holding['name'],
+            'shares': holding['shares'],
+            'current_value': rounded[1][i],
+            'cost_basis': rounded[2][i],
+            'unrealized_gain': rounded[3][i],
+            'unrealized_pct': rounded_pct[i],
+            'updated': val.get('updated')
+        }
+
+    total_value, total_cost, total_gain = current_value.sum(), cost_basis.sum(), unrealized_gain.sum()
     total_pct = (total_gain / total_cost * 100) if total_cost > 0 else 0
+    totals = np.round([total_value, total_cost, total_gain], 2).tolist()
 
     return jsonify({
         'prices': results,
         'totals': {
-            'current_value': round(total_value, 2),
-            'cost_basis': round(total_cost, 2),
-            'unrealized_gain': round(total_gain, 2),
-            'unrealized_pct': round(total_pct, 1)
+            'current_value': totals[0],
+            'cost_basis': totals[1],
+            'unrealized_gain': totals[2],
+            'unrealized_pct': round(float(total_pct), 1)
         },
         'cache_duration': PRICE_CACHE_DURATION
     })
@@ -79,51 +85,18 @@ def api_prices():
 
 
 @summary_bp.route('/profit-timeline')
+@conditional_get(db.PRIVATE_DB_PATH)
 def api_profit_timeline():
     """Get timeline of realized profits."""
-    transactions = get_transactions()
-
     # Get date range from query params
     start_date = request.args.get('start')
     end_date = request.args.get('end')
 
-    # Filter to completed sells
-    sells = [t for t in transactions if t['action'] == 'sell' and t.get('gain_pct')]
-
-    # Apply date filter if provided
-    if start_date:
-        sells = [t for t in sells if t.get('date', '') >= start_date]
-    if end_date:
-        sells = [t for t in sells if t.get('date', '') <= end_date]
-
-    # Sort by date
-    sells.sort(key=lambda x: x.get('date', ''))
-
-    # Calculate monthly totals
-    monthly_totals = {}
-    for txn in sells:
-        date = txn.get('date', '')
-        if len(date) >= 7:
-            month = date[:7]  # YYYY-MM
-            if month not in monthly_totals:
-                monthly_totals[month] = {'gain': 0, 'count': 0}
-
-            shares = int(txn.get('shares', 0))
-            price = float(txn.get('price', 0))
-            gain_pct = float(txn.get('gain_pct', 0))
-
-            # Estimate gain (price * shares * gain_pct / (100 + gain_pct))
-            total_sale = shares * price
-            cost_basis = total_sale / (1 + gain_pct / 100)
-            gain = total_sale - cost_basis
-
-            monthly_totals[month]['gain'] += gain
-            monthly_totals[month]['count'] += 1
-
-    # Convert to sorted list
+    # Completed sells and their monthly totals (realized gains precomputed per row)
+    sells = db.get_realized_sells(start_date, end_date)
     timeline = [
-        {'month': k, 'gain': round(v['gain'], 2), 'transactions': v['count']}
-        for k, v in sorted(monthly_totals.items())
+        {'month': m['month'], 'gain': round(m['gain'], 2), 'transactions': m['count']}
+        for m in db.get_realized_gain_by_month(start_date, end_date)
     ]
 
     # Calculate totals
@@ -143,38 +116,22 @@ def api_profit_timeline():
 @summary_bp.route('/performance')
 def api_performance():
     """Get historical performance metrics."""
-    transactions = get_transactions()
     holdings = calculate_holdings(confirmed_only=True)
-    valuations_data = data_manager.load_valuations()
-    all_valuations = valuations_data.get('valuations', {})
 
-    # Calculate realized gains from completed sells
-    realized_gain = 0
-    for txn in transactions:
-        if txn['action'] == 'sell' and txn.get('gain_pct'):
-            shares = int(txn.get('shares', 0))
-            price = float(txn.get('price', 0))
-            gain_pct = float(txn.get('gain_pct', 0))
+    # Calculate realized gains from completed sells (aggregated in SQL)
+    realized_gain = db.get_realized_gain_total()
 
-            total_sale = shares * price
-            cost_basis = total_sale / (1 + gain_pct / 100)
-            realized_gain += total_sale - cost_basis
+    held = {t: h for t, h in holdings.items() if h['shares'] > 0}
+    current_prices = db.get_current_prices(list(held))
 
-    # Calculate unrealized gains
-    unrealized_gain = 0
-    total_invested = 0
-
-    for ticker, holding in holdings.items():
-        if holding['shares'] <= 0:
-            continue
-
-        val = all_valuations.get(ticker, {})
-        current_price = val.get('current_price', 0)
-        if current_price:
-            current_value = current_price * holding['shares']
-            cost_basis = holding['total_cost']
-            unrealized_gain += current_value - cost_basis
-            total_invested += cost_basis
+    # Calculate unrealized gains over priced holdings as arrays
+    priced = [(h, current_prices[t]) for t, h in held.items() if current_prices.get(t)]
+    shares = np.array([h['shares'] for h, _ in priced], dtype=float)
+    cost_basis = np.array([h['total_cost'] for h, _ in priced], dtype=float)
+    current_price = np.array([p for _, p in priced], dtype=float)
+
+    unrealized_gain = float((current_price * shares - cost_basis).sum())
+    total_invested = float(cost_basis.sum())
 
     total_gain = realized_gain + unrealized_gain
 
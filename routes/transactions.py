@@ -10,16 +10,30 @@ Handles:
 - POST /api/stocks - Add new stock
 """
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
 import database as db
+from .conditional import conditional_get
 
 transactions_bp = Blueprint('transactions', __name__, url_prefix='/api')
 
 
 @transactions_bp.route('/transactions')
+@conditional_get(db.PRIVATE_DB_PATH)
 def api_transactions():
-    """Get all transactions."""
-    return jsonify(db.get_transactions())
+    """Get all transactions (streamed row by row as a JSON array)."""
+    dumps = current_app.json.dumps
+
+    def generate():
+        yield '['
+        first = True
+        for txn in db.iter_transactions():
+            if not first:
+                yield ','
+            yield dumps(txn)
+            first = False
+        yield ']\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
 
 
 @transactions_bp.route('/transactions', methods=['POST'])
@@ -54,6 +68,7 @@ def delete_transaction(txn_id):
 
 
 @transactions_bp.route('/stocks')
+@conditional_get(db.PRIVATE_DB_PATH)
 def api_stocks():
     """Get all stocks."""
     return jsonify(db.get_stocks())
@@ -65,9 +80,8 @@ def add_stock():
     data = request.json
     ticker = data.get('ticker', '').upper()
 
-    # Check if ticker already exists
-    existing = db.get_stocks()
-    if any(s['ticker'] == ticker for s in existing):
+    # Check if ticker already exists (primary key lookup)
+    if db.stock_exists(ticker):
         return jsonify({'error': 'Ticker already exists'}), 400
 
     db.add_stock(
@@ -4,17 +4,18 @@ Valuation routes blueprint.
 Handles:
 - GET /api/valuation/<ticker> - Get valuation for a ticker
 - POST /api/valuation/<ticker>/refresh - Refresh valuation
+- POST /api/valuations/refresh - Refresh valuations for multiple tickers
 - GET /api/sec-metrics/<ticker> - Get SEC metrics
 - GET /api/price-history/<ticker> - Get price history for charting
 """
 
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from flask import Blueprint, jsonify, request
 import data_manager
-from services.valuation import calculate_valuation, get_validated_eps
+from services.valuation import calculate_valuation, get_validated_eps, compute_valuation_metrics
 from services.providers import get_orchestrator
-from config import PE_RATIO_MULTIPLIER, RECOMMENDED_EPS_YEARS
-from datetime import datetime, timedelta
+from config import PE_RATIO_MULTIPLIER, RECOMMENDED_EPS_YEARS, VALUATION_REFRESH_WORKERS
 
 valuation_bp = Blueprint('valuation', __name__, url_prefix='/api')
 
@@ -48,113 +49,166 @@ def api_sec_metrics(ticker):
     return jsonify(metrics)
 
 
+def _refresh_valuation(ticker):
+    """
+    Fetch fresh provider data for a ticker and build its valuation record.
+
+    The record is not saved; callers persist it (singly or in bulk).
+
+    Returns:
+        Dict with valuation, eps_data, eps_validation, selloff and formula
+    """
+    from services.activity_log import activity_log
+
+    orchestrator = get_orchestrator()
+    activity_log.log("info", "valuation", f"Refreshing {ticker}...")
+
+    # Provider calls are independent network round trips - issue them concurrently
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        price_future = executor.submit(orchestrator.fetch_price, ticker, skip_cache=True)
+        info_future = executor.submit(orchestrator.fetch_stock_info, ticker)
+        eps_future = executor.submit(get_validated_eps, ticker)
+        dividend_future = executor.submit(orchestrator.fetch_dividends, ticker)
+        selloff_future = executor.submit(orchestrator.fetch_selloff, ticker)
+
+        # Get validated EPS data using orchestrator
+        eps_data, eps_source, validation_info = eps_future.result()
+
+        # SEC company name lookup depends on the EPS source; overlap it with the rest
+        sec_future = executor.submit(orchestrator.fetch_eps, ticker) if eps_source.startswith('sec') else None
+
+        price_result = price_future.result()
+        info_result = info_future.result()
+        dividend_result = dividend_future.result()
+        selloff_result = selloff_future.result()
+        sec_result = sec_future.result() if sec_future else None
+
+    current_price = price_result.data if price_result.success else 0
+    price_source = price_result.source if price_result.success else None
+
+    # Get company info and 52-week high/low
+    if info_result.success and info_result.data:
+        info_data = info_result.data
+        company_name = info_data.company_name
+        fifty_two_week_high = info_data.fifty_two_week_high
+        fifty_two_week_low = info_data.fifty_two_week_low
+    else:
+        company_name = ticker
+        fifty_two_week_high = None
+        fifty_two_week_low = None
+
+    # Use SEC company name if available (but only if it's a real name, not just the ticker)
+    if sec_result and sec_result.success and sec_result.data and sec_result.data.company_name:
+        sec_name = sec_result.data.company_name
+        if sec_name.upper() != ticker:
+            company_name = sec_name
+
+    # Get dividend info
+    annual_dividend = 0
+    if dividend_result.success and dividend_result.data:
+        annual_dividend = dividend_result.data.annual_dividend
+
+    # Get selloff metrics
+    selloff_metrics = None
+    if selloff_result.success and selloff_result.data:
+        sd = selloff_result.data
+        selloff_metrics = {
+            'day': sd.day, 'week': sd.week, 'month': sd.month,
+            'avg_volume': sd.avg_volume, 'severity': sd.severity
+        }
+
+    # Calculate valuation
+    eps_avg, estimated_value, price_vs_value, off_high_pct = compute_valuation_metrics(
+        tuple(e['eps'] for e in eps_data), annual_dividend, current_price, fifty_two_week_high
+    )
+
+    # Build valuation record ('updated' is stamped once when the record is saved)
+    valuation = {
+        'ticker': ticker,
+        'company_name': company_name,
+        'current_price': round(current_price, 2) if current_price else None,
+        'price_source': price_source,
+        'eps_avg': round(eps_avg, 2) if eps_avg else None,
+        'eps_years': len(eps_data),
+        'eps_source': eps_source,
+        'annual_dividend': round(annual_dividend, 2),
+        'estimated_value': round(estimated_value, 2) if estimated_value else None,
+        'price_vs_value': round(price_vs_value, 1) if price_vs_value else None,
+        'fifty_two_week_high': fifty_two_week_high,
+        'fifty_two_week_low': fifty_two_week_low,
+        'off_high_pct': round(off_high_pct, 1) if off_high_pct else None,
+        'in_selloff': selloff_metrics.get('severity') in ('severe', 'high', 'moderate') if selloff_metrics else False,
+        'selloff_severity': selloff_metrics.get('severity') if selloff_metrics else None
+    }
+
+    return {
+        'valuation': valuation,
+        'eps_data': eps_data,
+        'eps_validation': validation_info,
+        'selloff': selloff_metrics,
+        'formula': f'(({round(eps_avg, 2) if eps_avg else "N/A"} avg EPS) + {round(annual_dividend, 2)} dividend) x {PE_RATIO_MULTIPLIER} = ${round(estimated_value, 2) if estimated_value else "N/A"}'
+    }
+
+
 @valuation_bp.route('/valuation/<ticker>/refresh', methods=['POST'])
 def api_valuation_refresh(ticker):
     """Refresh valuation for a specific ticker."""
     ticker = ticker.upper()
 
     try:
-        # Use provider system for price
-        from services.activity_log import activity_log
-
-        orchestrator = get_orchestrator()
-        activity_log.log("info", "valuation", f"Refreshing {ticker}...")
-        price_result = orchestrator.fetch_price(ticker, skip_cache=True)
-        current_price = price_result.data if price_result.success else 0
-        price_source = price_result.source if price_result.success else None
-
-        # Get company info and 52-week high/low
-        info_result = orchestrator.fetch_stock_info(ticker)
-        if info_result.success and info_result.data:
-            info_data = info_result.data
-            company_name = info_data.company_name
-            fifty_two_week_high = info_data.fifty_two_week_high
-            fifty_two_week_low = info_data.fifty_two_week_low
-        else:
-            company_name = ticker
-            fifty_two_week_high = None
-            fifty_two_week_low = None
-
-        # Get validated EPS data using orchestrator
-        eps_data, eps_source, validation_info = get_validated_eps(ticker)
-
-        # Use SEC company name if available (but only if it's a real name, not just the ticker)
-        if eps_source.startswith('sec'):
-            sec_result = orchestrator.fetch_eps(ticker)
-            if sec_result.success and sec_result.data and sec_result.data.company_name:
-                sec_name = sec_result.data.company_name
-                if sec_name.upper() != ticker:
-                    company_name = sec_name
-
-        # Get dividend info using orchestrator
-        dividend_result = orchestrator.fetch_dividends(ticker)
-        annual_dividend = 0
-
-        if dividend_result.success and dividend_result.data:
-            annual_dividend = dividend_result.data.annual_dividend
-
-        # Get selloff metrics via orchestrator
-        selloff_metrics = None
-        selloff_result = orchestrator.fetch_selloff(ticker)
-        if selloff_result.success and selloff_result.data:
-            sd = selloff_result.data
-            selloff_metrics = {
-                'day': sd.day, 'week': sd.week, 'month': sd.month,
-                'avg_volume': sd.avg_volume, 'severity': sd.severity
-            }
-
-        # Calculate valuation
-        eps_avg = None
-        estimated_value = None
-        price_vs_value = None
-        off_high_pct = None
-
-        if len(eps_data) > 0:
-            eps_avg = sum(e['eps'] for e in eps_data) / len(eps_data)
-            estimated_value = (eps_avg + annual_dividend) * PE_RATIO_MULTIPLIER
-
-            if current_price and current_price > 0 and estimated_value > 0:
-                price_vs_value = ((current_price - estimated_value) / estimated_value) * 100
-
-        if fifty_two_week_high and current_price:
-            off_high_pct = ((current_price - fifty_two_week_high) / fifty_two_week_high) * 100
-
-        # Build valuation record
-        valuation = {
-            'ticker': ticker,
-            'company_name': company_name,
-            'current_price': round(current_price, 2) if current_price else None,
-            'price_source': price_source,
-            'eps_avg': round(eps_avg, 2) if eps_avg else None,
-            'eps_years': len(eps_data),
-            'eps_source': eps_source,
-            'annual_dividend': round(annual_dividend, 2),
-            'estimated_value': round(estimated_value, 2) if estimated_value else None,
-            'price_vs_value': round(price_vs_value, 1) if price_vs_value else None,
-            'fifty_two_week_high': fifty_two_week_high,
-            'fifty_two_week_low': fifty_two_week_low,
-            'off_high_pct': round(off_high_pct, 1) if off_high_pct else None,
-            'in_selloff': selloff_metrics.get('severity') in ('severe', 'high', 'moderate') if selloff_metrics else False,
-            'selloff_severity': selloff_metrics.get('severity') if selloff_metrics else None,
-            'updated': datetime.now().isoformat()
-        }
+        result = _refresh_valuation(ticker)
 
         # Save to valuations
-        data_manager.update_valuation(ticker, valuation)
+        data_manager.update_valuation(ticker, result['valuation'])
 
-        return jsonify({
-            'success': True,
-            'valuation': valuation,
-            'eps_data': eps_data,
-            'eps_validation': validation_info,
-            'selloff': selloff_metrics,
-            'formula': f'(({round(eps_avg, 2) if eps_avg else "N/A"} avg EPS) + {round(annual_dividend, 2)} dividend) x {PE_RATIO_MULTIPLIER} = ${round(estimated_value, 2) if estimated_value else "N/A"}'
-        })
+        return jsonify({'success': True, **result})
 
     except Exception as e:
         return jsonify({'error': str(e), 'ticker': ticker}), 500
 
 
+@valuation_bp.route('/valuations/refresh', methods=['POST'])
+def api_valuations_refresh():
+    """
+    Refresh valuations for multiple tickers concurrently.
+
+    Tickers come from the JSON body ({"tickers": [...]}) or the
+    ?tickers=AAPL,MSFT query parameter. All results are saved in one batch.
+    """
+    req_data = request.get_json(silent=True) or {}
+    tickers = req_data.get('tickers') or request.args.get('tickers', '').split(',')
+    tickers = list(dict.fromkeys(t.strip().upper() for t in tickers if t and t.strip()))
+
+    if not tickers:
+        return jsonify({'error': 'No tickers to refresh'}), 400
+
+    def refresh_one(ticker):
+        try:
+            return ticker, _refresh_valuation(ticker)['valuation'], None
+        except Exception as e:
+            return ticker, None, str(e)
+
+    with ThreadPoolExecutor(max_workers=VALUATION_REFRESH_WORKERS) as executor:
+        results = list(executor.map(refresh_one, tickers))
+
+    valuations = {}
+    errors = {}
+    for ticker, valuation, error in results:
+        if error:
+            errors[ticker] = error
+        else:
+            valuations[ticker] = valuation
+
+    # Save all refreshed valuations in a single write
+    data_manager.bulk_update_valuations(valuations)
+
+    return jsonify({
+        'success': True,
+        'valuations': valuations,
+        'errors': errors
+    })
+
+
 @valuation_bp.route('/price-history/<ticker>')
 def api_price_history(ticker):
     """Get price history for charting."""
@@ -8,71 +8,508 @@ Data is stored in the following tables:
 - eps_history: EPS records per company
 - cik_mapping: Ticker to CIK mapping
 """
+import atexit
 import os
+import re
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from typing import NamedTuple, Optional
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import simdjson
+    HAS_SIMDJSON = True
+except ImportError:
+    HAS_SIMDJSON = False
 
 # Import database module for all operations
 import database as db
 from config import (
-    SEC_RATE_LIMIT, SEC_REQUEST_TIMEOUT,
-    SEC_CIK_CACHE_DAYS, SEC_EPS_CACHE_DAYS
+    SEC_RATE_LIMIT, SEC_RATE_BURST, SEC_REQUEST_TIMEOUT,
+    SEC_CIK_CACHE_DAYS, SEC_EPS_CACHE_DAYS, SEC_UPDATE_WORKERS, SEC_RESPONSE_CACHE_TTL
 )
 
-# SEC requires User-Agent with contact info
-SEC_HEADERS = {'User-Agent': 'FinanceApp contact@example.com'}
+# SEC requires User-Agent with contact info, and asks clients to accept
+# compressed responses (the JSON payloads shrink ~10x with gzip)
+SEC_HEADERS = {
+    'User-Agent': 'FinanceApp contact@example.com',
+    'Accept-Encoding': 'gzip, deflate',
+}
+
+
+class _RateLimitedRetry(Retry):
+    """Retry policy whose retries also take a token from the shared rate limiter"""
+
+    def sleep(self, response=None):
+        super().sleep(response)
+        rate_limit()
+
+
+# Shared session: keeps TLS connections to sec.gov alive between requests.
+# Throttling (429) and transient server errors are retried with backoff
+# (honoring Retry-After); the final response is still returned to the caller.
+_session = requests.Session()
+_session.headers.update(SEC_HEADERS)
+_session.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=SEC_UPDATE_WORKERS,
+    max_retries=_RateLimitedRetry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+))
+atexit.register(_session.close)
+
+# XBRL concepts read from companyfacts, in order of preference
+# (most specific to least)
+EPS_FIELDS = [
+    ('EarningsPerShareDiluted', 'Diluted EPS'),
+    ('EarningsPerShareBasic', 'Basic EPS'),
+    ('IncomeLossFromContinuingOperationsPerDilutedShare', 'Continuing Ops (Diluted)'),
+    ('IncomeLossFromContinuingOperationsPerBasicShare', 'Continuing Ops (Basic)'),
+]
+IFRS_EPS_FIELDS = [
+    ('DilutedEarningsLossPerShare', 'Diluted EPS (IFRS)'),
+    ('BasicEarningsLossPerShare', 'Basic EPS (IFRS)'),
+    ('BasicAndDilutedEarningsLossPerShare', 'EPS (IFRS)'),
+]
+SHARE_FIELDS = [
+    'CommonStockSharesOutstanding',
+    'WeightedAverageNumberOfDilutedSharesOutstanding',
+    'WeightedAverageNumberOfSharesOutstandingBasic',
+]
+METRICS_EPS_FIELDS = [
+    ('EarningsPerShareBasic', 'Basic EPS'),
+    ('EarningsPerShareDiluted', 'Diluted EPS'),
+    ('IncomeLossFromContinuingOperationsPerBasicShare', 'Continuing Ops (Basic)'),
+    ('IncomeLossFromContinuingOperationsPerDilutedShare', 'Continuing Ops (Diluted)'),
+    ('IncomeLossFromDiscontinuedOperationsNetOfTaxPerBasicShare', 'Discontinued Ops (Basic)'),
+    ('IncomeLossFromDiscontinuedOperationsNetOfTaxPerDilutedShare', 'Discontinued Ops (Diluted)'),
+]
+DIVIDEND_FIELDS = [
+    ('CommonStockDividendsPerShareDeclared', 'Common Stock Dividend'),
+    ('CommonStockDividendsPerShareCashPaid', 'Common Stock Dividend (Paid)'),
+]
+
+class EpsRecord(NamedTuple):
+    """Annual EPS value extracted from a filing"""
+    year: int
+    eps: float
+    filed: Optional[str]
+    start: Optional[str]
+    end: Optional[str]
+    eps_type: str
+
+
+# Full-year XBRL frame ("CY2024", not "CY2024Q1" / "CY2024Q4I"); captures the year
+_FRAME_ANNUAL_RE = re.compile(r'CY(\d{4})')
+
+
+def _latest_annual_records(records, forms=('10-K',)):
+    """
+    Pick the latest-filed full-year record for each calendar year.
+
+    Args:
+        records: XBRL fact records for one concept/unit
+        forms: Filing forms that count as annual reports
+
+    Returns:
+        Dict mapping year -> raw fact record
+    """
+    latest = {}
+    for r in records:
+        # Most facts carry no frame at all - test it before the form and the regex
+        frame = r.get('frame')
+        if not frame or r.get('form') not in forms:
+            continue
+        match = _FRAME_ANNUAL_RE.fullmatch(frame)
+        if not match:
+            continue
+        year = int(match.group(1))
+        best = latest.get(year)
+        if best is None or r.get('filed', '') > best.get('filed', ''):
+            latest[year] = r
+    return latest
+
+
+# Concepts each companyfacts consumer needs, by taxonomy
+EPS_CONCEPTS = {
+    'us-gaap': [f for f, _ in EPS_FIELDS] + ['NetIncomeLoss'] + SHARE_FIELDS,
+    'ifrs-full': [f for f, _ in IFRS_EPS_FIELDS],
+}
+METRICS_CONCEPTS = {
+    'us-gaap': [f for f, _ in METRICS_EPS_FIELDS + DIVIDEND_FIELDS],
+}
 
 # Use config values (aliased for backward compatibility)
 CIK_CACHE_DAYS = SEC_CIK_CACHE_DAYS
 EPS_CACHE_DAYS = SEC_EPS_CACHE_DAYS
 
+# Background updates commit fetched companies in batches of this size
+SAVE_BATCH_SIZE = 32
+
+
+@dataclass(slots=True)
+class SecProgress:
+    """Background update progress (fields guarded by _progress_lock)"""
+    current: int = 0
+    total: int = 0
+    ticker: str = ''
+    status: str = 'idle'
+
+
 # Module state
-sec_update_running = False
-sec_update_progress = {'current': 0, 'total': 0, 'ticker': '', 'status': 'idle'}
-last_sec_request = 0
+_progress = SecProgress()
+_progress_lock = threading.Lock()
+_update_running = threading.Event()
+_stop_event = threading.Event()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter on the monotonic clock.
+
+    Tokens refill continuously at `rate` per second up to `capacity`; each
+    acquire() takes one token, sleeping (outside the lock) until it is due.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            # A negative balance reserves a future token for this caller
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+
+# SEC fair-access limit. A full bucket plus one second of refill is the most
+# any 1s window can see, so the burst is capped to keep that within the limit.
+SEC_MAX_REQUESTS_PER_SECOND = 10
+
+_bucket = TokenBucket(
+    rate=1 / SEC_RATE_LIMIT,
+    capacity=max(1, min(SEC_RATE_BURST, int(SEC_MAX_REQUESTS_PER_SECOND - 1 / SEC_RATE_LIMIT)))
+)
 
 
 def rate_limit():
-    """Ensure we don't exceed SEC rate limits"""
-    global last_sec_request
-    elapsed = time.time() - last_sec_request
-    if elapsed < SEC_RATE_LIMIT:
-        time.sleep(SEC_RATE_LIMIT - elapsed)
-    last_sec_request = time.time()
+    """Ensure we don't exceed SEC rate limits (safe to call from multiple threads)"""
+    _bucket.acquire()
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire `ttl` seconds after being stored.
+
+    get() returns `default` for missing or expired keys, so None can be cached
+    as a real value (e.g. a concept the company does not report).
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()  # key -> (stored_monotonic, value)
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return default
+            if time.monotonic() - entry[0] > self.ttl:
+                del self.entries[key]
+                return default
+            self.entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = (time.monotonic(), value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+# Parsed XBRL responses, so fetch_company_eps and fetch_company_metrics for the
+# same company (e.g. a valuation refresh followed by the SEC metrics view)
+# share fetches instead of spending rate-limit tokens twice
+_MISSING = object()
+
+# Returned for conditional requests answered with 304 Not Modified
+NOT_MODIFIED = object()
+_concept_cache = TTLCache(maxsize=1024, ttl=SEC_RESPONSE_CACHE_TTL)
+_companyfacts_cache = TTLCache(maxsize=16, ttl=SEC_RESPONSE_CACHE_TTL)
+
+
+def _parse_json(response):
+    """Decode a JSON response body (companyfacts payloads are several MB)"""
+    if HAS_ORJSON:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+_parser_local = threading.local()
+
+
+def _parse_companyfacts(response, concepts):
+    """
+    Decode a companyfacts response keeping only the requested concepts.
+
+    With simdjson installed, the document is parsed lazily and only the
+    requested concept subtrees are converted to Python objects; the
+    hundreds of other facts in the payload are never materialized.
+
+    Args:
+        response: HTTP response for a companyfacts request
+        concepts: Dict mapping taxonomy (e.g. 'us-gaap') to concept names
+
+    Returns:
+        Dict shaped like the companyfacts payload ('entityName', 'facts')
+    """
+    if not HAS_SIMDJSON:
+        return _parse_json(response)
+
+    # Parsers reuse their buffers; one per thread since documents are
+    # only valid until the same parser parses the next one
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = _parser_local.parser = simdjson.Parser()
+
+    doc = parser.parse(response.content)
+    facts = doc.get('facts') or {}
+
+    pruned = {}
+    for taxonomy, names in concepts.items():
+        section = facts.get(taxonomy)
+        if section is None:
+            continue
+        pruned[taxonomy] = {name: section[name].as_dict() for name in names if name in section}
+
+    result = {'facts': pruned}
+    if 'entityName' in doc:
+        result['entityName'] = doc['entityName']
+    return result
+
+
+def _fetch_concept(cik, taxonomy, tag, validator=None):
+    """
+    Fetch a single XBRL concept for a company.
+
+    Args:
+        cik: Zero-padded CIK
+        taxonomy: XBRL taxonomy (e.g. 'us-gaap')
+        tag: Concept name
+        validator: Optional {'etag', 'last_modified'} from an earlier response;
+                   makes the request conditional
+
+    Returns:
+        Tuple of (concept, validator). concept is None if the company doesn't
+        report it, or NOT_MODIFIED if SEC answered 304 to a conditional request.
+        Only full-year framed facts ("CY2024") are kept in the concept's units.
+    """
+    key = (cik, taxonomy, tag)
+    cached = _concept_cache.get(key, _MISSING)
+    if cached is not _MISSING:
+        return cached
+
+    headers = {}
+    if validator:
+        if validator.get('etag'):
+            headers['If-None-Match'] = validator['etag']
+        if validator.get('last_modified'):
+            headers['If-Modified-Since'] = validator['last_modified']
+
+    rate_limit()
+    url = f"https://data.sec.gov/api/xbrl/companyconcept/CIK{cik}/{taxonomy}/{tag}.json"
+    response = _session.get(url, headers=headers, timeout=SEC_REQUEST_TIMEOUT)
+    if response.status_code == 304:
+        # Nothing to cache - the body lives with the caller's stored data
+        return NOT_MODIFIED, validator
+    if response.status_code == 404:
+        result = (None, None)
+    else:
+        response.raise_for_status()
+        etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+        new_validator = {'etag': etag, 'last_modified': last_modified} if etag or last_modified else None
+        concept = _parse_json(response)
+        # The annual extractors never read quarterly or unframed facts (most of
+        # the payload) - drop them once here rather than on every extraction
+        concept['units'] = {
+            unit: [r for r in records if _FRAME_ANNUAL_RE.fullmatch(r.get('frame') or '')]
+            for unit, records in concept.get('units', {}).items()
+        }
+        result = (concept, new_validator)
+    _concept_cache.set(key, result)
+    return result
+
+
+def _fetch_concepts(cik, concepts, validators=None):
+    """
+    Fetch several XBRL concepts through the companyconcept API.
+
+    Each concept response is a few KB, versus several MB for the full
+    companyfacts document that contains them all.
+
+    Args:
+        cik: Zero-padded CIK
+        concepts: Dict mapping taxonomy (e.g. 'us-gaap') to concept names
+        validators: Optional dict of 'taxonomy/tag' -> validator from an
+                    earlier fetch; those concepts are requested conditionally
+
+    Returns:
+        Dict shaped like the companyfacts payload ('entityName', 'facts'),
+        containing only the concepts the company reports, plus 'validators'
+        for the fetched concepts and 'not_modified' (concepts answered 304)
+    """
+    validators = validators or {}
+    wanted = [(taxonomy, tag) for taxonomy, tags in concepts.items() for tag in tags]
+    # Sequential on purpose: the token bucket serializes SEC requests anyway, and
+    # background updates already call this from SEC_UPDATE_WORKERS threads that
+    # share the session's connection pool
+    responses = [
+        _fetch_concept(cik, taxonomy, tag, validator=validators.get(f"{taxonomy}/{tag}"))
+        for taxonomy, tag in wanted
+    ]
+
+    facts = {}
+    result = {'facts': facts, 'validators': {}, 'not_modified': []}
+    for (taxonomy, tag), (concept, validator) in zip(wanted, responses):
+        key = f"{taxonomy}/{tag}"
+        if validator:
+            result['validators'][key] = validator
+        if concept is NOT_MODIFIED:
+            result['not_modified'].append(key)
+            continue
+        if not concept:
+            continue
+        facts.setdefault(taxonomy, {})[tag] = {'units': concept.get('units', {})}
+        if concept.get('entityName'):
+            result['entityName'] = concept['entityName']
+    return result
+
+
+def _fetch_companyfacts(cik, concepts):
+    """Fetch the full companyfacts document (None if SEC has no XBRL facts for the company)"""
+    key = (cik, tuple((taxonomy, tuple(names)) for taxonomy, names in concepts.items()))
+    facts = _companyfacts_cache.get(key, _MISSING)
+    if facts is not _MISSING:
+        return facts
+
+    rate_limit()
+    url = f"https://data.sec.gov/api/xbrl/companyfacts/CIK{cik}.json"
+    response = _session.get(url, timeout=SEC_REQUEST_TIMEOUT)
+    if response.status_code == 404:
+        facts = None
+    elif response.status_code != 200:
+        return None
+    else:
+        facts = _parse_companyfacts(response, concepts)
+    _companyfacts_cache.set(key, facts)
+    return facts
 
 
 # --- Metadata ---
 
+# Parsed metadata / CIK mapping, keyed on the public database file signature
+# (covers writes made through any module or process)
+_metadata_cache = None  # (signature, data)
+_cik_mapping_cache = None  # (signature, data, ticker->CIK index, refresh due at)
+
+# A failed CIK mapping refresh (e.g. SEC unreachable) is retried after this
+# long rather than on every lookup
+CIK_REFRESH_RETRY_SECONDS = 300
+_cik_refresh_lock = threading.Lock()
+_cik_refresh_attempted = None  # time.monotonic() of the last refresh attempt
+
+
 def load_metadata():
-    """Load cache metadata from database"""
-    version = db.get_metadata('sec_cache_version')
-    last_update = db.get_metadata('sec_last_full_update')
-    return {
-        'version': int(version) if version else 2,
-        'last_full_update': last_update
-    }
+    """Load cache metadata from database (cached until the database changes)"""
+    global _metadata_cache
+
+    # Take the signature before reading so a concurrent write invalidates the entry
+    signature = db.get_db_signature(db.PUBLIC_DB_PATH)
+    cached = _metadata_cache
+    if cached is None or cached[0] != signature:
+        version = db.get_metadata('sec_cache_version')
+        last_update = db.get_metadata('sec_last_full_update')
+        cached = _metadata_cache = (signature, {
+            'version': int(version) if version else 2,
+            'last_full_update': last_update
+        })
+
+    # Callers update and save the returned dict - hand out a copy
+    return dict(cached[1])
 
 
 def save_metadata(data):
     """Save cache metadata to database"""
+    global _metadata_cache
     if 'version' in data:
         db.set_metadata('sec_cache_version', str(data['version']))
     if 'last_full_update' in data:
         db.set_metadata('sec_last_full_update', data['last_full_update'])
+    _metadata_cache = None
 
 
 # --- CIK Mapping ---
 
+def _cik_mapping_entry():
+    """Get the cached (signature, mapping, index, refresh_due) entry, reloading if the database changed"""
+    global _cik_mapping_cache
+
+    signature = db.get_db_signature(db.PUBLIC_DB_PATH)
+    cached = _cik_mapping_cache
+    if cached is None or cached[0] != signature:
+        mapping = db.get_cik_mapping()
+        # Flat upper-cased ticker -> CIK lookup, built once per load
+        index = {t.upper(): info['cik'] for t, info in mapping.get('tickers', {}).items()}
+        cached = _cik_mapping_cache = (signature, mapping, index, _cik_refresh_due(mapping))
+    return cached
+
+
+def _cik_refresh_due(mapping):
+    """Epoch time at which a loaded mapping becomes due for a refresh from SEC"""
+    if mapping.get('updated'):
+        try:
+            return (datetime.fromisoformat(mapping['updated']) + timedelta(days=CIK_CACHE_DAYS)).timestamp()
+        except (ValueError, TypeError, OverflowError):
+            return 0.0
+    return 0.0 if not mapping.get('tickers') else float('inf')
+
+
 def load_cik_mapping():
-    """Load cached ticker->CIK mapping from database"""
-    return db.get_cik_mapping()
+    """Load cached ticker->CIK mapping from database (cached until the database changes)"""
+    return _cik_mapping_entry()[1]
 
 
 def save_cik_mapping(data):
     """Save ticker->CIK mapping to database"""
+    global _cik_mapping_cache
     db.save_cik_mapping(data)
+    _cik_mapping_cache = None
 
 
 def update_cik_mapping():
@@ -80,10 +517,10 @@ def update_cik_mapping():
     try:
         rate_limit()
         url = "https://www.sec.gov/files/company_tickers.json"
-        response = requests.get(url, headers=SEC_HEADERS, timeout=SEC_REQUEST_TIMEOUT)
+        response = _session.get(url, timeout=SEC_REQUEST_TIMEOUT)
 
         if response.status_code == 200:
-            raw_data = response.json()
+            raw_data = _parse_json(response)
 
             # Build ticker -> CIK lookup
             tickers = {}
@@ -108,25 +545,28 @@ def update_cik_mapping():
     return load_cik_mapping()
 
 
+def _refresh_cik_mapping():
+    """Refresh the mapping from SEC, at most once per CIK_REFRESH_RETRY_SECONDS across threads"""
+    global _cik_refresh_attempted
+
+    with _cik_refresh_lock:
+        now = time.monotonic()
+        # Another worker may have just refreshed (or failed to) while we waited
+        if _cik_refresh_attempted is not None and now - _cik_refresh_attempted < CIK_REFRESH_RETRY_SECONDS:
+            return
+        _cik_refresh_attempted = now
+        update_cik_mapping()
+
+
 def get_cik_for_ticker(ticker):
     """Get CIK for a ticker, updating mapping if needed"""
-    mapping = load_cik_mapping()
+    _, _, index, refresh_due = _cik_mapping_entry()
 
-    # Check if mapping needs refresh
-    if mapping.get('updated'):
-        try:
-            updated = datetime.fromisoformat(mapping['updated'])
-            if datetime.now() - updated > timedelta(days=CIK_CACHE_DAYS):
-                mapping = update_cik_mapping()
-        except (ValueError, TypeError):
-            mapping = update_cik_mapping()
-    elif not mapping.get('tickers'):
-        mapping = update_cik_mapping()
+    if time.time() > refresh_due:
+        _refresh_cik_mapping()
+        index = _cik_mapping_entry()[2]
 
-    ticker_info = mapping.get('tickers', {}).get(ticker.upper())
-    if ticker_info:
-        return ticker_info['cik']
-    return None
+    return index.get(ticker.upper())
 
 
 # --- Company EPS Data (now stored in database) ---
@@ -136,212 +576,199 @@ def load_company_cache(ticker):
     return db.get_sec_company(ticker)
 
 
+def load_company_caches(tickers):
+    """Load cached data for several companies at once (dict keyed by upper-cased ticker)"""
+    return db.get_sec_companies(tickers)
+
+
 def save_company_cache(ticker, data):
     """Save data for a single company to database"""
     db.save_sec_company(ticker, data)
 
 
-def fetch_company_eps(ticker, cik):
-    """Fetch EPS data from SEC EDGAR for a company"""
-    try:
-        rate_limit()
-        url = f"https://data.sec.gov/api/xbrl/companyfacts/CIK{cik}.json"
-        response = requests.get(url, headers=SEC_HEADERS, timeout=SEC_REQUEST_TIMEOUT)
+def save_company_caches(companies):
+    """Save data for several companies to database in one transaction"""
+    db.save_sec_companies(companies)
 
-        if response.status_code == 200:
-            data = response.json()
-            us_gaap = data.get('facts', {}).get('us-gaap', {})
 
-            # EPS fields to extract, in order of preference (most specific to least)
-            eps_fields = [
-                ('EarningsPerShareDiluted', 'Diluted EPS'),
-                ('EarningsPerShareBasic', 'Basic EPS'),
-                ('IncomeLossFromContinuingOperationsPerDilutedShare', 'Continuing Ops (Diluted)'),
-                ('IncomeLossFromContinuingOperationsPerBasicShare', 'Continuing Ops (Basic)'),
-            ]
-
-            def extract_annual_eps(field_name, label):
-                """Extract annual EPS from 10-K filings for a given field"""
-                if field_name not in us_gaap:
-                    return {}
-                eps_records = us_gaap[field_name].get('units', {}).get('USD/shares', [])
-                annual = {}
-                for r in eps_records:
-                    if r.get('form') == '10-K':
-                        frame = r.get('frame', '')
-                        # Full year records (not quarterly) - frame like "CY2024" not "CY2024Q1"
-                        if frame and 'Q' not in frame:
-                            # Extract year from frame (e.g., "CY2024" -> 2024)
-                            try:
-                                year = int(frame.replace('CY', ''))
-                            except ValueError:
-                                continue
-                            # Keep latest filing for each calendar year (most up-to-date data)
-                            if year not in annual or r.get('filed', '') > annual[year].get('filed', ''):
-                                annual[year] = {
-                                    'year': year,
-                                    'eps': r['val'],
-                                    'filed': r.get('filed'),
-                                    'start': r.get('start'),
-                                    'end': r.get('end'),
-                                    'eps_type': label
-                                }
-                return annual
-
-            # Extract all EPS types from US-GAAP
-            all_eps_data = {}
-            for field_name, label in eps_fields:
-                eps_data = extract_annual_eps(field_name, label)
-                for year, data in eps_data.items():
-                    if year not in all_eps_data:
-                        all_eps_data[year] = []
-                    all_eps_data[year].append(data)
-
-            # Fallback 1: Check IFRS section for foreign companies
-            if not all_eps_data:
-                ifrs = data.get('facts', {}).get('ifrs-full', {})
-                if ifrs:
-                    ifrs_eps_fields = [
-                        ('DilutedEarningsLossPerShare', 'Diluted EPS (IFRS)'),
-                        ('BasicEarningsLossPerShare', 'Basic EPS (IFRS)'),
-                        ('BasicAndDilutedEarningsLossPerShare', 'EPS (IFRS)'),
-                    ]
-
-                    def extract_ifrs_eps(field_name, label):
-                        """Extract annual EPS from IFRS filings (20-F, 40-F, or 10-K)"""
-                        if field_name not in ifrs:
-                            return {}
-                        # Check both USD/shares and other currencies
-                        units = ifrs[field_name].get('units', {})
-                        # Prefer USD, but accept EUR/GBP if USD not available
-                        for unit_key in ['USD/shares', 'EUR/shares', 'GBP/shares']:
-                            if unit_key in units:
-                                eps_records = units[unit_key]
-                                annual = {}
-                                for r in eps_records:
-                                    form = r.get('form', '')
-                                    # Accept 20-F, 40-F (foreign filer annual) or 10-K
-                                    if form in ['20-F', '40-F', '10-K']:
-                                        frame = r.get('frame', '')
-                                        if frame and 'Q' not in frame:
-                                            try:
-                                                year = int(frame.replace('CY', ''))
-                                            except ValueError:
-                                                continue
-                                            if year not in annual or r.get('filed', '') > annual[year].get('filed', ''):
-                                                currency = unit_key.split('/')[0]
-                                                annual[year] = {
-                                                    'year': year,
-                                                    'eps': r['val'],
-                                                    'filed': r.get('filed'),
-                                                    'start': r.get('start'),
-                                                    'end': r.get('end'),
-                                                    'eps_type': f"{label} ({currency})"
-                                                }
-                                if annual:
-                                    return annual
-                        return {}
+def fetch_company_eps(ticker, cik, cached=None):
+    """
+    Fetch EPS data from SEC EDGAR for a company.
+
+    Args:
+        ticker: Stock ticker
+        cik: Zero-padded CIK
+        cached: Optional stored company record (load_company_cache). Its HTTP
+                validators make the requests conditional; if SEC reports no
+                changes, the stored EPS history is returned with a fresh timestamp.
+    """
+    try:
+        # Conditional requests only help when there is stored history to fall back on
+        validators = cached.get('http_validators') if cached and cached.get('eps_history') else None
+        eps_concepts = {'us-gaap': [field for field, _ in EPS_FIELDS]}
+
+        # Most filers report the US-GAAP EPS concepts - fetch just those
+        data = _fetch_concepts(cik, eps_concepts, validators)
+        if data['not_modified']:
+            if not data['facts']:
+                return {
+                    'ticker': ticker,
+                    'cik': cik,
+                    'company_name': cached.get('company_name'),
+                    'eps_history': cached['eps_history'],
+                    'http_validators': data['validators'],
+                    'updated': datetime.now().isoformat()
+                }
+            # Only some concepts changed - the unchanged ones need their bodies too
+            data = _fetch_concepts(cik, eps_concepts)
+        us_gaap = data['facts'].get('us-gaap', {})
+
+        def extract_annual_eps(field_name, label):
+            """Extract annual EPS from 10-K filings for a given field"""
+            if field_name not in us_gaap:
+                return {}
+            eps_records = us_gaap[field_name].get('units', {}).get('USD/shares', [])
+            # Latest 10-K filing for each full calendar year (most up-to-date data)
+            return {
+                year: EpsRecord(year, r['val'], r.get('filed'), r.get('start'), r.get('end'), label)
+                for year, r in _latest_annual_records(eps_records).items()
+            }
 
-                    for field_name, label in ifrs_eps_fields:
-                        eps_data = extract_ifrs_eps(field_name, label)
-                        for year, eps_entry in eps_data.items():
-                            if year not in all_eps_data:
-                                all_eps_data[year] = []
-                            all_eps_data[year].append(eps_entry)
-
-            # Fallback 2: Calculate EPS from Net Income / Shares Outstanding
-            if not all_eps_data:
-                net_income = us_gaap.get('NetIncomeLoss', {}).get('units', {}).get('USD', [])
-                # Try multiple share fields
-                shares = None
-                for share_field in ['CommonStockSharesOutstanding',
-                                    'WeightedAverageNumberOfDilutedSharesOutstanding',
-                                    'WeightedAverageNumberOfSharesOutstandingBasic']:
-                    if share_field in us_gaap:
-                        shares = us_gaap[share_field].get('units', {}).get('shares', [])
-                        if shares:
-                            break
-
-                if net_income and shares:
-                    # Build year-indexed dicts
-                    ni_by_year = {}
-                    for r in net_income:
-                        if r.get('form') == '10-K' and r.get('fy'):
-                            fy = r['fy']
-                            if fy not in ni_by_year or r.get('filed', '') > ni_by_year[fy].get('filed', ''):
-                                ni_by_year[fy] = r
-
-                    sh_by_year = {}
-                    for r in shares:
-                        if r.get('form') == '10-K' and r.get('fy'):
-                            fy = r['fy']
-                            if fy not in sh_by_year or r.get('filed', '') > sh_by_year[fy].get('filed', ''):
-                                sh_by_year[fy] = r
-
-                    # Calculate EPS for years with both values
-                    for year in set(ni_by_year.keys()) & set(sh_by_year.keys()):
-                        ni_val = ni_by_year[year]['val']
-                        sh_val = sh_by_year[year]['val']
-                        if sh_val and sh_val > 0:
-                            calculated_eps = ni_val / sh_val
-                            if year not in all_eps_data:
-                                all_eps_data[year] = []
-                            all_eps_data[year].append({
-                                'year': year,
-                                'eps': round(calculated_eps, 2),
-                                'filed': ni_by_year[year].get('filed'),
-                                'start': ni_by_year[year].get('start'),
-                                'end': ni_by_year[year].get('end'),
-                                'eps_type': 'Calculated (NI/Shares)'
-                            })
-
-            if not all_eps_data:
+        # Extract all EPS types from US-GAAP
+        all_eps_data = {}
+        for field_name, label in EPS_FIELDS:
+            eps_data = extract_annual_eps(field_name, label)
+            for year, record in eps_data.items():
+                if year not in all_eps_data:
+                    all_eps_data[year] = []
+                all_eps_data[year].append(record)
+
+        # The fallbacks need concepts beyond the US-GAAP EPS tags - only then
+        # download the full companyfacts document
+        if not all_eps_data:
+            data = _fetch_companyfacts(cik, EPS_CONCEPTS)
+            if data is None:
                 return None
+            us_gaap = data.get('facts', {}).get('us-gaap', {})
 
-            # Sanity check and correction for EPS values
-            # Some companies (e.g., HAL) have XBRL filing errors where EPS is 1,000,000x too high
-            MAX_REASONABLE_EPS = 1000  # Berkshire A shares can have high EPS
-            LIKELY_SCALE_ERROR_MIN = 100000  # Values above this are likely scale errors
-
-            def correct_eps_value(eps_val):
-                """Attempt to correct obviously wrong EPS values"""
-                if abs(eps_val) >= LIKELY_SCALE_ERROR_MIN:
-                    # Check if dividing by 1M gives a reasonable value
-                    corrected = eps_val / 1000000
-                    if abs(corrected) <= MAX_REASONABLE_EPS:
-                        return corrected, True
-                return eps_val, False
-
-            # For each year, take the lower (more conservative) EPS value
-            annual_eps = {}
-            for fy, eps_list in all_eps_data.items():
-                # Try to correct scale errors first
-                corrected_eps = []
-                for e in eps_list:
-                    new_val, was_corrected = correct_eps_value(e['eps'])
-                    if was_corrected:
-                        print(f"[SEC] Corrected {ticker} FY{fy} EPS: {e['eps']:,.0f} -> {new_val:.2f} (likely 1M scale error)")
-                    corrected_eps.append({**e, 'eps': new_val})
-
-                # Filter out still-unreasonable EPS values
-                valid_eps = [e for e in corrected_eps if abs(e['eps']) <= MAX_REASONABLE_EPS]
-                if not valid_eps:
-                    print(f"[SEC] Warning: All EPS values for {ticker} FY{fy} exceed sanity check (values: {[e['eps'] for e in eps_list]})")
-                    continue
-                # Sort by EPS value (ascending) and take the lowest
-                valid_eps.sort(key=lambda x: x['eps'])
-                annual_eps[fy] = valid_eps[0]
-
-            # Sort by year descending
-            sorted_eps = sorted(annual_eps.values(), key=lambda x: x['year'], reverse=True)
+        # Fallback 1: Check IFRS section for foreign companies
+        if not all_eps_data:
+            ifrs = data.get('facts', {}).get('ifrs-full', {})
+            if ifrs:
+                def extract_ifrs_eps(field_name, label):
+                    """Extract annual EPS from IFRS filings (20-F, 40-F, or 10-K)"""
+                    if field_name not in ifrs:
+                        return {}
+                    # Check both USD/shares and other currencies
+                    units = ifrs[field_name].get('units', {})
+                    # Prefer USD, but accept EUR/GBP if USD not available
+                    for unit_key in ['USD/shares', 'EUR/shares', 'GBP/shares']:
+                        if unit_key in units:
+                            # Accept 20-F, 40-F (foreign filer annual) or 10-K
+                            latest = _latest_annual_records(units[unit_key], forms=('20-F', '40-F', '10-K'))
+                            if latest:
+                                eps_type = f"{label} ({unit_key.split('/')[0]})"
+                                return {
+                                    year: EpsRecord(year, r['val'], r.get('filed'), r.get('start'), r.get('end'), eps_type)
+                                    for year, r in latest.items()
+                                }
+                    return {}
 
-            return {
-                'ticker': ticker,
-                'cik': cik,
-                'company_name': data.get('entityName', ticker),
-                'eps_history': sorted_eps[:8],  # Keep up to 8 years max
-                'updated': datetime.now().isoformat()
-            }
+                for field_name, label in IFRS_EPS_FIELDS:
+                    eps_data = extract_ifrs_eps(field_name, label)
+                    for year, eps_entry in eps_data.items():
+                        if year not in all_eps_data:
+                            all_eps_data[year] = []
+                        all_eps_data[year].append(eps_entry)
+
+        # Fallback 2: Calculate EPS from Net Income / Shares Outstanding
+        if not all_eps_data:
+            net_income = us_gaap.get('NetIncomeLoss', {}).get('units', {}).get('USD', [])
+            # Try multiple share fields
+            shares = None
+            for share_field in SHARE_FIELDS:
+                if share_field in us_gaap:
+                    shares = us_gaap[share_field].get('units', {}).get('shares', [])
+                    if shares:
+                        break
+
+            if net_income and shares:
+                # Build year-indexed dicts
+                ni_by_year = {}
+                for r in net_income:
+                    if r.get('form') == '10-K' and r.get('fy'):
+                        fy = r['fy']
+                        if fy not in ni_by_year or r.get('filed', '') > ni_by_year[fy].get('filed', ''):
+                            ni_by_year[fy] = r
+
+                sh_by_year = {}
+                for r in shares:
+                    if r.get('form') == '10-K' and r.get('fy'):
+                        fy = r['fy']
+                        if fy not in sh_by_year or r.get('filed', '') > sh_by_year[fy].get('filed', ''):
+                            sh_by_year[fy] = r
+
+                # Calculate EPS for years with both values
+                for year in set(ni_by_year.keys()) & set(sh_by_year.keys()):
+                    ni_val = ni_by_year[year]['val']
+                    sh_val = sh_by_year[year]['val']
+                    if sh_val and sh_val > 0:
+                        calculated_eps = ni_val / sh_val
+                        if year not in all_eps_data:
+                            all_eps_data[year] = []
+                        ni = ni_by_year[year]
+                        all_eps_data[year].append(EpsRecord(
+                            year, round(calculated_eps, 2), ni.get('filed'), ni.get('start'), ni.get('end'),
+                            'Calculated (NI/Shares)'
+                        ))
+
+        if not all_eps_data:
+            return None
+
+        # Sanity check and correction for EPS values
+        # Some companies (e.g., HAL) have XBRL filing errors where EPS is 1,000,000x too high
+        MAX_REASONABLE_EPS = 1000  # Berkshire A shares can have high EPS
+        LIKELY_SCALE_ERROR_MIN = 100000  # Values above this are likely scale errors
+
+        def correct_eps_value(eps_val):
+            """Attempt to correct obviously wrong EPS values"""
+            if abs(eps_val) >= LIKELY_SCALE_ERROR_MIN:
+                # Check if dividing by 1M gives a reasonable value
+                corrected = eps_val / 1000000
+                if abs(corrected) <= MAX_REASONABLE_EPS:
+                    return corrected, True
+            return eps_val, False
+
+        # For each year, take the lower (more conservative) EPS value
+        annual_eps = {}
+        for fy, eps_list in all_eps_data.items():
+            # Try to correct scale errors first
+            corrected_eps = []
+            for e in eps_list:
+                new_val, was_corrected = correct_eps_value(e.eps)
+                if was_corrected:
+                    print(f"[SEC] Corrected {ticker} FY{fy} EPS: {e.eps:,.0f} -> {new_val:.2f} (likely 1M scale error)")
+                corrected_eps.append(e._replace(eps=new_val))
+
+            # Filter out still-unreasonable EPS values
+            valid_eps = [e for e in corrected_eps if abs(e.eps) <= MAX_REASONABLE_EPS]
+            if not valid_eps:
+                print(f"[SEC] Warning: All EPS values for {ticker} FY{fy} exceed sanity check (values: {[e.eps for e in eps_list]})")
+                continue
+            # Take the lowest (first one wins ties, in field preference order)
+            annual_eps[fy] = min(valid_eps, key=lambda x: x.eps)
+
+        # Sort by year descending
+        sorted_eps = sorted(annual_eps.values(), key=lambda x: x.year, reverse=True)
+
+        return {
+            'ticker': ticker,
+            'cik': cik,
+            'company_name': data.get('entityName', ticker),
+            'eps_history': [r._asdict() for r in sorted_eps[:8]],  # Keep up to 8 years max
+            'http_validators': data.get('validators'),
+            'updated': datetime.now().isoformat()
+        }
     except Exception as e:
         print(f"[SEC] Error fetching EPS for {ticker}: {e}")
 
@@ -355,97 +782,71 @@ def fetch_company_metrics(ticker, cik):
     and annual dividend data.
     """
     try:
-        rate_limit()
-        url = f"https://data.sec.gov/api/xbrl/companyfacts/CIK{cik}.json"
-        response = requests.get(url, headers=SEC_HEADERS, timeout=SEC_REQUEST_TIMEOUT)
+        # Only these concepts are read - fetch them individually rather than
+        # downloading the full companyfacts document
+        data = _fetch_concepts(cik, METRICS_CONCEPTS)
+        if not data['facts']:
+            return None
+        us_gaap = data['facts'].get('us-gaap', {})
+
+        def get_annual_values(field_name, unit='USD'):
+            """Get all annual values for a field, organized by year"""
+            if field_name not in us_gaap:
+                return {}
+            unit_key = 'USD/shares' if unit == 'USD/shares' else unit
+            records = us_gaap[field_name].get('units', {}).get(unit_key, [])
+
+            # Latest 10-K annual record (full year, not quarterly) for each year
+            return {
+                year: {
+                    'value': r.get('val'),
+                    'year': year,
+                    'period_start': r.get('start'),
+                    'period_end': r.get('end'),
+                    'filed': r.get('filed')
+                }
+                for year, r in _latest_annual_records(records).items()
+            }
 
-        if response.status_code == 200:
-            data = response.json()
-            us_gaap = data.get('facts', {}).get('us-gaap', {})
+        # Build EPS matrix: {eps_type: {year: value, ...}, ...}
+        eps_matrix = {}
+        all_years = set()
 
-            def get_annual_values(field_name, unit='USD'):
-                """Get all annual values for a field, organized by year"""
-                if field_name not in us_gaap:
-                    return {}
-                unit_key = 'USD/shares' if unit == 'USD/shares' else unit
-                records = us_gaap[field_name].get('units', {}).get(unit_key, [])
-
-                # Filter to 10-K annual records (full year, not quarterly)
-                annual = {}
-                for r in records:
-                    if r.get('form') == '10-K':
-                        frame = r.get('frame', '')
-                        # Full year records - frame like "CY2024" not "CY2024Q1"
-                        if frame and 'Q' not in frame:
-                            try:
-                                year = int(frame.replace('CY', ''))
-                            except ValueError:
-                                continue
-                            # Keep latest filing for each year
-                            if year not in annual or r.get('filed', '') > annual[year].get('filed', ''):
-                                annual[year] = {
-                                    'value': r.get('val'),
-                                    'year': year,
-                                    'period_start': r.get('start'),
-                                    'period_end': r.get('end'),
-                                    'filed': r.get('filed')
-                                }
-                return annual
-
-            # EPS fields to extract (multi-year)
-            eps_fields = [
-                ('EarningsPerShareBasic', 'Basic EPS'),
-                ('EarningsPerShareDiluted', 'Diluted EPS'),
-                ('IncomeLossFromContinuingOperationsPerBasicShare', 'Continuing Ops (Basic)'),
-                ('IncomeLossFromContinuingOperationsPerDilutedShare', 'Continuing Ops (Diluted)'),
-                ('IncomeLossFromDiscontinuedOperationsNetOfTaxPerBasicShare', 'Discontinued Ops (Basic)'),
-                ('IncomeLossFromDiscontinuedOperationsNetOfTaxPerDilutedShare', 'Discontinued Ops (Diluted)'),
-            ]
-
-            # Build EPS matrix: {eps_type: {year: value, ...}, ...}
-            eps_matrix = {}
-            all_years = set()
-
-            for field, label in eps_fields:
-                annual_data = get_annual_values(field, 'USD/shares')
-                if annual_data:
-                    eps_matrix[label] = {}
-                    for year, data_point in annual_data.items():
-                        eps_matrix[label][year] = data_point['value']
-                        all_years.add(year)
-
-            # Get years sorted ascending
-            years = sorted(all_years)
-
-            # Dividend data - CommonStockDividendsPerShareDeclared
-            dividend_fields = [
-                ('CommonStockDividendsPerShareDeclared', 'Common Stock Dividend'),
-                ('CommonStockDividendsPerShareCashPaid', 'Common Stock Dividend (Paid)'),
-            ]
-
-            dividend_matrix = {}
-            dividend_years = set()
-
-            for field, label in dividend_fields:
-                annual_data = get_annual_values(field, 'USD/shares')
-                if annual_data:
-                    dividend_matrix[label] = {}
-                    for year, data_point in annual_data.items():
-                        dividend_matrix[label][year] = data_point['value']
-                        dividend_years.add(year)
-
-            div_years = sorted(dividend_years)
+        for field, label in METRICS_EPS_FIELDS:
+            annual_data = get_annual_values(field, 'USD/shares')
+            if annual_data:
+                eps_matrix[label] = {}
+                for year, data_point in annual_data.items():
+                    eps_matrix[label][year] = data_point['value']
+                    all_years.add(year)
 
-            return {
-                'ticker': ticker,
-                'cik': cik,
-                'company_name': data.get('entityName', ticker),
-                'eps_matrix': eps_matrix,
-                'eps_years': years[-8:] if len(years) > 8 else years,  # Last 8 years
-                'dividend_matrix': dividend_matrix,
-                'dividend_years': div_years[-8:] if len(div_years) > 8 else div_years,
-                'fetched': datetime.now().isoformat()
-            }
+        # Get years sorted ascending
+        years = sorted(all_years)
+
+        # Dividend data - CommonStockDividendsPerShareDeclared
+        dividend_matrix = {}
+        dividend_years = set()
+
+        for field, label in DIVIDEND_FIELDS:
+            annual_data = get_annual_values(field, 'USD/shares')
+            if annual_data:
+                dividend_matrix[label] = {}
+                for year, data_point in annual_data.items():
+                    dividend_matrix[label][year] = data_point['value']
+                    dividend_years.add(year)
+
+        div_years = sorted(dividend_years)
+
+        return {
+            'ticker': ticker,
+            'cik': cik,
+            'company_name': data.get('entityName', ticker),
+            'eps_matrix': eps_matrix,
+            'eps_years': years[-8:] if len(years) > 8 else years,  # Last 8 years
+            'dividend_matrix': dividend_matrix,
+            'dividend_years': div_years[-8:] if len(div_years) > 8 else div_years,
+            'fetched': datetime.now().isoformat()
+        }
     except Exception as e:
         print(f"[SEC] Error fetching metrics for {ticker}: {e}")
 
@@ -453,7 +854,12 @@ def fetch_company_metrics(ticker, cik):
 
 
 def get_sec_metrics(ticker):
-    """Get SEC metrics for a ticker (fetches fresh each time for now)"""
+    """
+    Get SEC metrics for a ticker.
+
+    Not persisted; the underlying concept fetches are shared with
+    fetch_company_eps through the in-memory response cache.
+    """
     ticker = ticker.upper()
     cik = get_cik_for_ticker(ticker)
     if not cik:
@@ -482,7 +888,7 @@ def get_sec_eps(ticker, log_source=True):
     if not cik:
         return None
 
-    data = fetch_company_eps(ticker, cik)
+    data = fetch_company_eps(ticker, cik, cached)
     if data:
         data['_from_cache'] = False
         save_company_cache(ticker, data)
@@ -494,16 +900,32 @@ def get_sec_eps(ticker, log_source=True):
     return cached
 
 
-def is_cache_stale(ticker):
-    """Check if a ticker's cache needs updating"""
-    cached = load_company_cache(ticker)
-    if not cached:
-        return True
-    if not cached.get('updated'):
+def is_cache_stale(ticker, now=None):
+    """
+    Check if a ticker's cache needs updating.
+
+    Args:
+        ticker: Stock ticker symbol
+        now: Reference time; batch callers pass one value for the whole pass
+    """
+    # Only the timestamp matters - skip loading the company's EPS history
+    return _is_stale_timestamp(db.get_sec_company_updated(ticker), now or datetime.now())
+
+
+def get_stale_tickers(tickers, now=None):
+    """Return the tickers whose cache needs updating, checked with a single query"""
+    now = now or datetime.now()
+    updated = db.get_sec_companies_updated(tickers)
+    return [t for t in tickers if _is_stale_timestamp(updated.get(t.upper()), now)]
+
+
+def _is_stale_timestamp(updated_str, now):
+    """Check a cache 'updated' timestamp against EPS_CACHE_DAYS"""
+    if not updated_str:
         return True
     try:
-        updated = datetime.fromisoformat(cached['updated'])
-        return datetime.now() - updated >= timedelta(days=EPS_CACHE_DAYS)
+        updated = datetime.fromisoformat(updated_str)
+        return now - updated >= timedelta(days=EPS_CACHE_DAYS)
     except (ValueError, TypeError):
         return True
 
@@ -588,7 +1010,7 @@ def force_refresh_sec_eps(ticker):
         return existing, 0
 
     # Fetch from SEC
-    fresh_data = fetch_company_eps(ticker, cik)
+    fresh_data = fetch_company_eps(ticker, cik, existing)
 
     if not fresh_data or not fresh_data.get('eps_history'):
         if not existing:
@@ -602,6 +1024,11 @@ def force_refresh_sec_eps(ticker):
             })
         return existing, 0
 
+    # No stored record yet: save it whole (EPS rows need the company row)
+    if not existing:
+        save_company_cache(ticker, fresh_data)
+        return fresh_data, len(fresh_data['eps_history'])
+
     # Find new years we don't have
     fresh_years = {eps['year'] for eps in fresh_data['eps_history']}
     new_years = fresh_years - existing_years
@@ -609,57 +1036,88 @@ def force_refresh_sec_eps(ticker):
     if new_years:
         # Add only the new years
         new_eps = [eps for eps in fresh_data['eps_history'] if eps['year'] in new_years]
-        added = db.add_new_eps_years(ticker, new_eps)
+        added = db.add_new_eps_years(ticker, new_eps, fresh_data.get('http_validators'))
 
         # Return updated data
         updated_data = load_company_cache(ticker)
         return updated_data, added
     else:
         # No new years, just update timestamp
-        db.add_new_eps_years(ticker, [])  # Updates timestamp only
+        db.add_new_eps_years(ticker, [], fresh_data.get('http_validators'))  # Updates timestamp/validators only
         return existing, 0
 
 
 # --- Background Updates ---
 
+def _fetch_stale_ticker(ticker, cached):
+    """Fetch fresh EPS data for a ticker whose cache is stale (runs in worker threads)"""
+    if _stop_event.is_set():
+        return None
+
+    with _progress_lock:
+        _progress.ticker = ticker
+
+    cik = get_cik_for_ticker(ticker)
+    if not cik:
+        return None
+    # Stored validators let SEC answer unchanged companies with 304s
+    return fetch_company_eps(ticker, cik, cached)
+
+
 def update_sec_data_for_tickers(tickers):
     """Background update of SEC data for multiple tickers"""
-    global sec_update_running, sec_update_progress
-
-    sec_update_running = True
-    sec_update_progress = {
-        'current': 0,
-        'total': len(tickers),
-        'ticker': '',
-        'status': 'running'
-    }
+    global _progress
 
-    updated_count = 0
+    _update_running.set()
+    with _progress_lock:
+        _progress = SecProgress(total=len(tickers), status='running')
 
-    for i, ticker in enumerate(tickers):
-        if not sec_update_running:
-            sec_update_progress['status'] = 'cancelled'
-            break
+    try:
+        return _run_update(tickers)
+    finally:
+        _update_running.clear()
 
-        sec_update_progress['current'] = i + 1
-        sec_update_progress['ticker'] = ticker
 
-        # Check if we need to update this ticker
-        if is_cache_stale(ticker):
-            cik = get_cik_for_ticker(ticker)
-            if cik:
-                data = fetch_company_eps(ticker, cik)
-                if data:
-                    save_company_cache(ticker, data)
-                    updated_count += 1
+def _run_update(tickers):
+    """Fetch and save stale tickers, recording progress (body of update_sec_data_for_tickers)"""
+    updated_count = 0
+    pending = {}
+    stale = get_stale_tickers(tickers)
+    # Stored records (for their validators) loaded in bulk, not per worker
+    cached = load_company_caches(stale)
+
+    # Fresh tickers need no work - count them as done up front
+    with _progress_lock:
+        _progress.current = len(tickers) - len(stale)
+
+    # Fetches are network bound - keep several in flight; rate_limit() still
+    # enforces the global SEC request budget across all workers.
+    # Results are saved from this thread so database writes stay serialized.
+    with ThreadPoolExecutor(max_workers=SEC_UPDATE_WORKERS) as executor:
+        futures = {executor.submit(_fetch_stale_ticker, t, cached.get(t.upper())): t for t in stale}
+        for future in as_completed(futures):
+            ticker = futures[future]
+            with _progress_lock:
+                _progress.current += 1
+
+            data = future.result()
+            if data:
+                pending[ticker] = data
+                updated_count += 1
+                if len(pending) >= SAVE_BATCH_SIZE:
+                    save_company_caches(pending)
+                    pending = {}
+
+    if pending:
+        save_company_caches(pending)
 
     # Update metadata
     metadata = load_metadata()
     metadata['last_full_update'] = datetime.now().isoformat()
     save_metadata(metadata)
 
-    sec_update_progress['status'] = 'complete'
-    sec_update_running = False
+    with _progress_lock:
+        _progress.status = 'cancelled' if _stop_event.is_set() else 'complete'
 
     print(f"[SEC] Updated {updated_count} companies")
     return updated_count
@@ -667,11 +1125,12 @@ def update_sec_data_for_tickers(tickers):
 
 def start_background_update(tickers):
     """Start SEC data update in background thread"""
-    global sec_update_running
-
-    if sec_update_running:
+    if _update_running.is_set():
         return False
 
+    # Mark running before the thread starts so a second call can't slip in
+    _update_running.set()
+    _stop_event.clear()
     thread = threading.Thread(target=update_sec_data_for_tickers, args=(tickers,))
     thread.daemon = True
     thread.start()
@@ -680,13 +1139,13 @@ def start_background_update(tickers):
 
 def stop_update():
     """Stop the running update"""
-    global sec_update_running
-    sec_update_running = False
+    _stop_event.set()
 
 
 def get_update_progress():
     """Get current update progress"""
-    return sec_update_progress
+    with _progress_lock:
+        return asdict(_progress)
 
 
 def check_and_update_on_startup(tickers):
@@ -709,7 +1168,7 @@ def check_and_update_on_startup(tickers):
             update_cik_mapping()
 
     # Check which tickers need updating
-    needs_update = [t for t in tickers if is_cache_stale(t)]
+    needs_update = get_stale_tickers(tickers)
 
     if needs_update:
         print(f"[SEC] {len(needs_update)} tickers need updating, starting background update...")
@@ -752,127 +1211,97 @@ def get_eps_update_recommendations():
     - recently_updated: list of tickers with fresh data
     - details: per-ticker analysis info
     """
-    # Get all SEC companies from database
+    # Only each company's latest EPS year is analyzed - select just that row
+    # (uses the UNIQUE(ticker, year) index) instead of the full history
     with db.get_db() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             SELECT sc.ticker, sc.company_name, sc.updated,
                    eh.year, eh.eps, eh.filed, eh.period_start, eh.period_end
             FROM sec_companies sc
-            LEFT JOIN eps_history eh ON sc.ticker = eh.ticker
+            JOIN eps_history eh ON eh.ticker = sc.ticker
+                AND eh.year = (SELECT MAX(year) FROM eps_history WHERE ticker = sc.ticker)
             WHERE sc.sec_no_eps = 0
-            ORDER BY sc.ticker, eh.year DESC
+            ORDER BY sc.ticker
         ''')
         rows = cursor.fetchall()
 
     if not rows:
         return {'needs_update': [], 'recently_updated': [], 'details': {}}
 
-    # Group by ticker
-    ticker_data = {}
-    for row in rows:
-        ticker = row['ticker']
-        if ticker not in ticker_data:
-            ticker_data[ticker] = {
-                'company_name': row['company_name'],
-                'updated': row['updated'],
-                'eps_history': []
-            }
-        if row['year']:
-            ticker_data[ticker]['eps_history'].append({
-                'year': row['year'],
-                'eps': row['eps'],
-                'filed': row['filed'],
-                'start': row['period_start'],
-                'end': row['period_end']
-            })
-
-    needs_update = []
-    recently_updated = []
+    import numpy as np
+    import pandas as pd
+
+    # Parse and compare all dates column-wise instead of per ticker
+    today = pd.Timestamp(datetime.now())
+
+    fiscal_year_end = pd.to_datetime(
+        pd.Series([r['period_end'] for r in rows], dtype=object), format='%Y-%m-%d', errors='coerce')
+    cache_updated = pd.to_datetime(
+        pd.Series([r['updated'] for r in rows], dtype=object), format='ISO8601', errors='coerce')
+    next_fy_end = fiscal_year_end + pd.DateOffset(years=1)
+    expected_filing_date = next_fy_end + pd.Timedelta(days=75)
+    days_since_fy_end = (today - next_fy_end).dt.days
+
+    # Determine if new filing might be available
+    has_fy_end = fiscal_year_end.notna().to_numpy()
+    filing_due = (has_fy_end & (days_since_fy_end > 75)).to_numpy()
+    outdated = filing_due & (cache_updated < expected_filing_date).to_numpy()
+    pending = has_fy_end & ~filing_due & (days_since_fy_end > 0).to_numpy()
+    stale = ~has_fy_end & (
+        cache_updated.isna() | (today - cache_updated >= pd.Timedelta(days=EPS_CACHE_DAYS))
+    ).to_numpy()
+
+    needs_mask = outdated | stale
+    recent_mask = ~needs_mask & ~pending
+
+    # Sort needs_update by priority (high > medium > stale, then days since FY end)
+    days = days_since_fy_end.fillna(0).astype(int).to_numpy()
+    priority_score = np.where(outdated, np.where(days > 120, 1000, 500) + days, 0)
+    needs_idx = np.flatnonzero(needs_mask)
+    needs_idx = needs_idx[np.argsort(-priority_score[needs_idx], kind='stable')]
+
+    tickers = [r['ticker'] for r in rows]
+    needs_update = [tickers[i] for i in needs_idx]
+    recently_updated = [tickers[i] for i in np.flatnonzero(recent_mask)]
+
+    # Build per-ticker details
+    fye_text = fiscal_year_end.dt.strftime('%b %d, %Y').tolist()
+    next_text = next_fy_end.dt.strftime('%b %d, %Y').tolist()
+    expected_text = expected_filing_date.dt.strftime('%b %d, %Y').tolist()
+    days = days.tolist()
     details = {}
-    today = datetime.now()
-
-    for ticker, data in ticker_data.items():
-        if not data['eps_history']:
-            continue
-
-        latest_eps = data['eps_history'][0]
 
+    for i, row in enumerate(rows):
         ticker_info = {
-            'ticker': ticker,
-            'company_name': data.get('company_name', ticker),
-            'latest_fy': latest_eps.get('year'),
-            'fiscal_year_end': latest_eps.get('end'),
-            'last_filing_date': latest_eps.get('filed'),
-            'cache_updated': data.get('updated'),
+            'ticker': row['ticker'],
+            'company_name': row['company_name'],
+            'latest_fy': row['year'],
+            'fiscal_year_end': row['period_end'],
+            'last_filing_date': row['filed'],
+            'cache_updated': row['updated'],
             'status': 'current',
             'reason': None
         }
 
-        # Parse dates
-        fiscal_year_end = None
-        if latest_eps.get('end'):
-            try:
-                fiscal_year_end = datetime.strptime(latest_eps['end'], '%Y-%m-%d')
-                ticker_info['fiscal_year_end_parsed'] = fiscal_year_end.strftime('%b %d, %Y')
-            except ValueError:
-                pass
-
-        cache_updated = None
-        if data.get('updated'):
-            try:
-                cache_updated = datetime.fromisoformat(data['updated'])
-            except ValueError:
-                pass
-
-        # Determine if new filing might be available
-        if fiscal_year_end:
-            next_fy_end = fiscal_year_end.replace(year=fiscal_year_end.year + 1)
-            expected_filing_date = next_fy_end + timedelta(days=75)
-            ticker_info['next_fy_end'] = next_fy_end.strftime('%b %d, %Y')
-            ticker_info['expected_filing'] = expected_filing_date.strftime('%b %d, %Y')
-
-            days_since_fy_end = (today - next_fy_end).days
-
-            if days_since_fy_end > 75:
-                if cache_updated and cache_updated < expected_filing_date:
-                    ticker_info['status'] = 'update_recommended'
-                    ticker_info['reason'] = f'FY{latest_eps.get("year")+1} 10-K likely available'
-                    ticker_info['days_since_fy_end'] = days_since_fy_end
-                    ticker_info['priority'] = 'high' if days_since_fy_end > 120 else 'medium'
-                    needs_update.append(ticker)
-                else:
-                    recently_updated.append(ticker)
-            elif days_since_fy_end > 0:
-                ticker_info['status'] = 'pending'
-                ticker_info['reason'] = f'FY ended {days_since_fy_end} days ago'
-            else:
-                ticker_info['status'] = 'current'
-                recently_updated.append(ticker)
-        else:
-            if is_cache_stale(ticker):
-                ticker_info['status'] = 'stale'
-                ticker_info['reason'] = 'Cache is stale'
-                needs_update.append(ticker)
-            else:
-                recently_updated.append(ticker)
-
-        details[ticker] = ticker_info
-
-    # Sort needs_update by priority
-    needs_update_with_priority = []
-    for ticker in needs_update:
-        info = details[ticker]
-        priority_score = 0
-        if info.get('priority') == 'high':
-            priority_score = 1000
-        elif info.get('priority') == 'medium':
-            priority_score = 500
-        priority_score += info.get('days_since_fy_end', 0)
-        needs_update_with_priority.append((ticker, priority_score))
-
-    needs_update_with_priority.sort(key=lambda x: x[1], reverse=True)
-    needs_update = [t[0] for t in needs_update_with_priority]
+        if has_fy_end[i]:
+            ticker_info['fiscal_year_end_parsed'] = fye_text[i]
+            ticker_info['next_fy_end'] = next_text[i]
+            ticker_info['expected_filing'] = expected_text[i]
+
+        if outdated[i]:
+            ticker_info['status'] = 'update_recommended'
+            ticker_info['reason'] = f'FY{row["year"] + 1} 10-K likely available'
+            ticker_info['days_since_fy_end'] = days[i]
+            ticker_info['priority'] = 'high' if days[i] > 120 else 'medium'
+        elif pending[i]:
+            ticker_info['status'] = 'pending'
+            ticker_info['reason'] = f'FY ended {days[i]} days ago'
+        elif stale[i]:
+            ticker_info['status'] = 'stale'
+            ticker_info['reason'] = 'Cache is stale'
+
+        details[row['ticker']] = ticker_info
 
     return {
         'needs_update': needs_update,
@@ -890,18 +1319,36 @@ def get_eps_update_recommendations():
 FILINGS_CACHE_DAYS = 7  # Check for new filings weekly
 
 
-def fetch_10k_filings(ticker, cik):
-    """Fetch 10-K filing URLs from SEC submissions API"""
+def fetch_10k_filings(ticker, cik, conditional=False):
+    """
+    Fetch 10-K filing URLs from SEC submissions API.
+
+    With conditional=True the request carries the validators saved from the
+    last successful fetch, and NOT_MODIFIED is returned if SEC answers 304.
+    """
     try:
-        rate_limit()
         url = f"https://data.sec.gov/submissions/CIK{cik}.json"
-        response = requests.get(url, headers=SEC_HEADERS, timeout=SEC_REQUEST_TIMEOUT)
+        headers = {}
+        validator = db.get_sec_http_meta(url) if conditional else None
+        if validator:
+            if validator.get('etag'):
+                headers['If-None-Match'] = validator['etag']
+            if validator.get('last_modified'):
+                headers['If-Modified-Since'] = validator['last_modified']
 
+        rate_limit()
+        response = _session.get(url, headers=headers, timeout=SEC_REQUEST_TIMEOUT)
+
+        if response.status_code == 304:
+            return NOT_MODIFIED
         if response.status_code != 200:
             print(f"[SEC] Failed to fetch submissions for {ticker}: {response.status_code}")
             return []
 
-        data = response.json()
+        data = _parse_json(response)
+        etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+        if etag or last_modified:
+            db.save_sec_http_meta(url, etag, last_modified)
         filings = data.get('filings', {}).get('recent', {})
 
         if not filings:
@@ -982,10 +1429,15 @@ def get_10k_filings(ticker):
     if not cik:
         return []
 
-    filings = fetch_10k_filings(ticker, cik)
+    # With filings stored, ask SEC only for changes since the last fetch
+    cached = db.get_sec_filings(ticker)
+    filings = fetch_10k_filings(ticker, cik, conditional=bool(cached))
+    if filings is NOT_MODIFIED:
+        db.touch_sec_filings(ticker)
+        return db.get_sec_filings(ticker)
     if filings:
         db.save_sec_filings(ticker, filings)
         return filings
 
     # Return stale cache if fetch failed
-    return db.get_sec_filings(ticker)
+    return cached
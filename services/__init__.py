@@ -2,41 +2,66 @@
 Services module for the Finance App.
 
 Contains business logic extracted from app.py for better modularity and testability.
+
+Re-exported names are resolved lazily (PEP 562): a submodule is imported the
+first time one of its names is accessed, so importing one service does not
+load all the others.
 """
 
-from .stock_utils import (
-    fetch_stock_price,
-    fetch_multiple_prices,
-    get_stock_info
-)
-
-from .holdings import (
-    calculate_fifo_cost_basis,
-    calculate_holdings,
-    HoldingsService
-)
-
-from .valuation import (
-    get_validated_eps,
-    calculate_valuation
-)
-
-from .recommendations import (
-    score_stock,
-    get_top_recommendations
-)
-
-from .screener import (
-    ScreenerService,
-    get_progress as get_screener_progress,  # Alias for backward compatibility
-    is_running as is_screener_running,  # Alias for backward compatibility
-    is_running,
-    get_progress,
-    stop,
-    run_screener,
-    run_quick_price_update,
-    run_smart_update,
-    run_global_refresh
-)
+import importlib
 
+# Imported eagerly (stdlib-only): the name shadows its own submodule, which a
+# lazy lookup would see bound on the package after any `services.activity_log` import
 from .activity_log import activity_log
+
+# Exported name -> (submodule, attribute in that submodule)
+_EXPORTS = {
+    # stock_utils
+    'fetch_stock_price': ('stock_utils', 'fetch_stock_price'),
+    'fetch_multiple_prices': ('stock_utils', 'fetch_multiple_prices'),
+    'get_cached_prices': ('stock_utils', 'get_cached_prices'),
+    'get_stock_info': ('stock_utils', 'get_stock_info'),
+
+    # holdings
+    'calculate_fifo_cost_basis': ('holdings', 'calculate_fifo_cost_basis'),
+    'calculate_holdings': ('holdings', 'calculate_holdings'),
+    'HoldingsService': ('holdings', 'HoldingsService'),
+
+    # valuation
+    'get_validated_eps': ('valuation', 'get_validated_eps'),
+    'calculate_valuation': ('valuation', 'calculate_valuation'),
+    'compute_valuation_metrics': ('valuation', 'compute_valuation_metrics'),
+
+    # recommendations
+    'score_stock': ('recommendations', 'score_stock'),
+    'get_top_recommendations': ('recommendations', 'get_top_recommendations'),
+
+    # screener
+    'ScreenerService': ('screener', 'ScreenerService'),
+    'get_screener_progress': ('screener', 'get_progress'),  # Alias for backward compatibility
+    'is_screener_running': ('screener', 'is_running'),  # Alias for backward compatibility
+    'is_running': ('screener', 'is_running'),
+    'get_progress': ('screener', 'get_progress'),
+    'stop': ('screener', 'stop'),
+    'run_screener': ('screener', 'run_screener'),
+    'run_quick_price_update': ('screener', 'run_quick_price_update'),
+    'run_smart_update': ('screener', 'run_smart_update'),
+    'run_global_refresh': ('screener', 'run_global_refresh'),
+}
+
+__all__ = list(_EXPORTS) + ['activity_log']
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), attr)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -19,16 +19,62 @@ Usage:
 """
 
 import json
+import os
+import sys
 import time
 import threading
-from collections import deque
+from queue import Empty, Full, Queue
 from datetime import datetime
 from typing import Optional, List, Dict, Generator
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Console echo of log entries (set ACTIVITY_LOG_STDOUT=0 to disable); ANSI
+# colors only when stdout is a terminal, e.g. not under `docker logs`
+_LOG_TO_CONSOLE = os.environ.get('ACTIVITY_LOG_STDOUT', '1') != '0'
+_USE_COLOR = bool(getattr(sys.stdout, 'isatty', None) and sys.stdout.isatty())
+
+
+def _to_json(payload: Dict) -> str:
+    """Serialize a payload to compact JSON (via orjson when available)."""
+    return orjson.dumps(payload).decode() if HAS_ORJSON else json.dumps(payload, separators=(',', ':'))
+
+
+def _sse_event(event: str, data: str) -> str:
+    """Format already-serialized JSON data as an SSE event."""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+def _sse_log_events(batch: List[str]) -> str:
+    """Format serialized log entries as one `log` event, or one `log_batch` array event."""
+    if len(batch) == 1:
+        return _sse_event('log', batch[0])
+    return _sse_event('log_batch', '[' + ','.join(batch) + ']')
+
 
 class ActivityLogManager:
     """Thread-safe activity log with SSE streaming support."""
 
+    # Seconds between SSE heartbeat events
+    HEARTBEAT_INTERVAL = 15
+
+    # Burst coalescing: once a subscriber finds more than one entry queued, it keeps
+    # collecting for up to BATCH_INTERVAL seconds (max BATCH_MAX entries) and sends
+    # them as a single `log_batch` event. Isolated entries are sent immediately.
+    BATCH_INTERVAL = 0.05
+    BATCH_MAX = 200
+
+    # Entries buffered per subscriber; a stalled client loses the oldest ones
+    SUBSCRIBER_QUEUE_SIZE = 1000
+
+    # Released subscriber queues kept for reuse across reconnects
+    QUEUE_POOL_SIZE = 32
+
     # Log level constants
     DEBUG = 'debug'
     INFO = 'info'
@@ -56,11 +102,29 @@ class ActivityLogManager:
         Args:
             max_entries: Maximum number of log entries to retain (ring buffer size)
         """
-        self._logs = deque(maxlen=max_entries)
+        # Ring buffer stored column-wise; slot _write_idx is written next and the
+        # newest _count slots are live. Entry dicts are only rebuilt on read.
+        self._max_entries = max_entries
+        self._timestamps = [None] * max_entries
+        self._levels = [None] * max_entries
+        self._sources = [None] * max_entries
+        self._messages = [None] * max_entries
+        self._tickers = [None] * max_entries
+        self._payloads = [None] * max_entries  # serialized JSON per entry
+        self._write_idx = 0
+        self._count = 0
         self._lock = threading.Lock()
-        self._subscribers = []
+        self._subscribers = {}  # subscriber id -> queue
         self._subscriber_lock = threading.Lock()
         self._next_subscriber_id = 0
+        self._queue_pool = []  # free list of empty subscriber queues
+
+        # Console prefix per level, formatted once
+        reset = self.COLORS['RESET'] if _USE_COLOR else ''
+        self._level_labels = {
+            level: f"{self.COLORS[level] if _USE_COLOR else ''}[{level.upper()}]{reset}"
+            for level in self.VALID_LEVELS
+        }
 
     def log(self, level: str, source: str, message: str, ticker: Optional[str] = None) -> None:
         """
@@ -72,10 +136,10 @@ class ActivityLogManager:
             message: Log message
             ticker: Optional ticker symbol associated with this log entry
         """
-        # Validate level
+        # Validate level; levels and sources repeat, so keep one shared string each
         level = level.lower()
-        if level not in self.VALID_LEVELS:
-            level = self.INFO
+        level = sys.intern(level) if level in self.VALID_LEVELS else self.INFO
+        source = sys.intern(source)
 
         # Create log entry
         entry = {
@@ -86,23 +150,39 @@ class ActivityLogManager:
             'ticker': ticker
         }
 
+        # Serialize once; the same JSON serves live and late subscribers
+        data = _to_json(entry)
+
         # Add to ring buffer (thread-safe)
         with self._lock:
-            self._logs.append(entry)
+            i = self._write_idx
+            self._timestamps[i] = entry['timestamp']
+            self._levels[i] = level
+            self._sources[i] = source
+            self._messages[i] = message
+            self._tickers[i] = ticker
+            self._payloads[i] = data
+            self._write_idx = (i + 1) % self._max_entries
+            self._count = min(self._count + 1, self._max_entries)
 
         # Print to console with color
         self._print_to_console(entry)
 
         # Notify all subscribers (thread-safe)
-        self._notify_subscribers(entry)
+        self._notify_subscribers(data)
+
+    def _recent_slots(self, n: int) -> List[int]:
+        """Ring buffer slots of the newest n entries, oldest first (caller holds _lock)."""
+        n = max(min(n, self._count), 0)
+        start = self._write_idx - n
+        return [(start + k) % self._max_entries for k in range(n)]
 
     def _print_to_console(self, entry: Dict) -> None:
         """Print log entry to console with color formatting."""
-        level = entry['level']
-        color = self.COLORS.get(level, '')
-        reset = self.COLORS['RESET']
+        if not _LOG_TO_CONSOLE:
+            return
 
-        level_str = f"{color}[{level.upper()}]{reset}"
+        level_str = self._level_labels[entry['level']]
         source_str = f"[{entry['source']}]"
 
         # Include ticker if present
@@ -112,27 +192,45 @@ class ActivityLogManager:
         else:
             print(f"[ActivityLog] {level_str} {source_str} {entry['message']}")
 
-    def _notify_subscribers(self, entry: Dict) -> None:
-        """Send log entry to all active SSE subscribers."""
-        # Format as SSE event
-        event_data = json.dumps(entry)
-        sse_message = f"event: log\ndata: {event_data}\n\n"
-
+    def _notify_subscribers(self, data: str) -> None:
+        """Queue a serialized log entry for all active SSE subscribers."""
         with self._subscriber_lock:
             # Send to all subscribers, remove any that fail
             dead_subscribers = []
 
-            for subscriber_id, queue in self._subscribers:
+            for subscriber_id, queue in self._subscribers.items():
                 try:
-                    queue.append(sse_message)
+                    try:
+                        queue.put_nowait(data)
+                    except Full:
+                        # Slow consumer: drop its oldest entry rather than block or grow
+                        try:
+                            queue.get_nowait()
+                        except Empty:
+                            pass
+                        queue.put_nowait(data)
                 except Exception:
                     # Subscriber is dead, mark for removal
-                    dead_subscribers.append((subscriber_id, queue))
+                    dead_subscribers.append(subscriber_id)
 
             # Remove dead subscribers
-            for dead_sub in dead_subscribers:
-                if dead_sub in self._subscribers:
-                    self._subscribers.remove(dead_sub)
+            for subscriber_id in dead_subscribers:
+                self._subscribers.pop(subscriber_id, None)
+
+    def _acquire_queue(self) -> Queue:
+        """Take an empty subscriber queue from the pool, or create one (caller holds _subscriber_lock)."""
+        return self._queue_pool.pop() if self._queue_pool else Queue(maxsize=self.SUBSCRIBER_QUEUE_SIZE)
+
+    def _release_queue(self, subscriber_queue: Queue) -> None:
+        """Drain an unregistered subscriber queue and return it to the pool (caller holds _subscriber_lock)."""
+        if len(self._queue_pool) >= self.QUEUE_POOL_SIZE:
+            return
+        try:
+            while True:
+                subscriber_queue.get_nowait()
+        except Empty:
+            pass
+        self._queue_pool.append(subscriber_queue)
 
     def subscribe(self) -> Generator[str, None, None]:
         """
@@ -140,50 +238,51 @@ class ActivityLogManager:
 
         Yields SSE-formatted events including:
         - Initial batch of recent logs
-        - New log entries as they occur
+        - New log entries as they occur (bursts coalesced into `log_batch` events)
         - Heartbeat events every 15 seconds
 
         Returns:
             Generator yielding SSE event strings
         """
-        # Create a queue for this subscriber
-        subscriber_queue = deque()
-
-        # Register subscriber
+        # Register subscriber with a (pooled) queue
         with self._subscriber_lock:
+            subscriber_queue = self._acquire_queue()
             subscriber_id = self._next_subscriber_id
             self._next_subscriber_id += 1
-            self._subscribers.append((subscriber_id, subscriber_queue))
+            self._subscribers[subscriber_id] = subscriber_queue
 
         try:
-            # Send initial batch of recent logs
-            recent_logs = self.get_recent(20)
-            for entry in recent_logs:
-                event_data = json.dumps(entry)
-                yield f"event: log\ndata: {event_data}\n\n"
+            # Send initial batch of recent logs (already serialized)
+            with self._lock:
+                recent = [self._payloads[i] for i in self._recent_slots(20)]
+            if recent:
+                yield _sse_log_events(recent)
 
             # Send initial heartbeat
-            yield f"event: heartbeat\ndata: {json.dumps({'timestamp': datetime.now().isoformat()})}\n\n"
+            yield _sse_event('heartbeat', _to_json({'timestamp': datetime.now().isoformat()}))
 
-            last_heartbeat = time.time()
+            last_heartbeat = time.monotonic()
 
-            # Stream new events as they arrive
+            # Block until an event arrives or the next heartbeat is due -
+            # new events go out immediately and idle streams cost no wakeups
             while True:
-                # Check for new messages in queue
-                if subscriber_queue:
-                    # Pop and send all queued messages
-                    while subscriber_queue:
-                        message = subscriber_queue.popleft()
-                        yield message
-
-                # Send heartbeat every 15 seconds
-                current_time = time.time()
-                if current_time - last_heartbeat >= 15:
-                    yield f"event: heartbeat\ndata: {json.dumps({'timestamp': datetime.now().isoformat()})}\n\n"
-                    last_heartbeat = current_time
-
-                # Small sleep to prevent CPU spinning
-                time.sleep(0.1)
+                wait = self.HEARTBEAT_INTERVAL - (time.monotonic() - last_heartbeat)
+                try:
+                    batch = [subscriber_queue.get(timeout=max(wait, 0))]
+                except Empty:
+                    yield _sse_event('heartbeat', _to_json({'timestamp': datetime.now().isoformat()}))
+                    last_heartbeat = time.monotonic()
+                    continue
+
+                # More entries already waiting means a burst is underway
+                if not subscriber_queue.empty():
+                    deadline = time.monotonic() + self.BATCH_INTERVAL
+                    while len(batch) < self.BATCH_MAX:
+                        try:
+                            batch.append(subscriber_queue.get(timeout=max(deadline - time.monotonic(), 0)))
+                        except Empty:
+                            break
+                yield _sse_log_events(batch)
 
         except GeneratorExit:
             # Client disconnected, clean up
@@ -192,11 +291,10 @@ class ActivityLogManager:
             # Log error but don't crash
             print(f"[ActivityLog] [ERROR] SSE subscriber error: {e}")
         finally:
-            # Unregister subscriber
+            # Unregister subscriber; once out of the map no notifier can reach the queue
             with self._subscriber_lock:
-                subscriber_entry = (subscriber_id, subscriber_queue)
-                if subscriber_entry in self._subscribers:
-                    self._subscribers.remove(subscriber_entry)
+                self._subscribers.pop(subscriber_id, None)
+                self._release_queue(subscriber_queue)
 
     def get_recent(self, n: int = 20) -> List[Dict]:
         """
@@ -210,13 +308,25 @@ class ActivityLogManager:
         """
         with self._lock:
             # Return last n entries (or all if fewer than n)
-            logs_list = list(self._logs)
-            return logs_list[-n:] if len(logs_list) > n else logs_list
+            return [
+                {
+                    'timestamp': self._timestamps[i],
+                    'level': self._levels[i],
+                    'source': self._sources[i],
+                    'message': self._messages[i],
+                    'ticker': self._tickers[i]
+                }
+                for i in self._recent_slots(n)
+            ]
 
     def clear(self) -> None:
         """Clear all log entries."""
         with self._lock:
-            self._logs.clear()
+            for column in (self._timestamps, self._levels, self._sources,
+                           self._messages, self._tickers, self._payloads):
+                column[:] = [None] * self._max_entries
+            self._write_idx = 0
+            self._count = 0
 
         # Notify subscribers about clear
         clear_event = {
@@ -226,9 +336,10 @@ class ActivityLogManager:
             'message': 'Activity log cleared',
             'ticker': None
         }
-        self._notify_subscribers(clear_event)
+        self._notify_subscribers(_to_json(clear_event))
 
-        print("[ActivityLog] [INFO] [system] Activity log cleared")
+        if _LOG_TO_CONSOLE:
+            print("[ActivityLog] [INFO] [system] Activity log cleared")
 
     def get_subscriber_count(self) -> int:
         """Get the number of active SSE subscribers."""
@@ -238,7 +349,7 @@ class ActivityLogManager:
     def get_log_count(self) -> int:
         """Get the current number of log entries."""
         with self._lock:
-            return len(self._logs)
+            return self._count
 
 
 # Module-level singleton instance
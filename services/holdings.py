@@ -11,6 +11,7 @@ This module now uses SQLite database for all data storage.
 
 import os
 import sys
+from collections import defaultdict
 
 # Add parent directory for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
@@ -18,67 +19,165 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 import database as db
 
 
+# Loader name -> (private database signature, rows)
+_rows_cache = {}
+
+
+def _cached_rows(loader, prepare=None):
+    """Return loader() rows (passed through prepare), cached until the private database changes."""
+    # Take the signature before reading so a concurrent write invalidates the entry
+    signature = db.get_db_signature(db.PRIVATE_DB_PATH)
+    cached = _rows_cache.get(loader.__name__)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    rows = loader()
+    if prepare is not None:
+        prepare(rows)
+    _rows_cache[loader.__name__] = (signature, rows)
+    return rows
+
+
+def _add_typed_amounts(transactions):
+    """Store shares/price coerced to numbers as `_shares`/`_price` on each row."""
+    for txn in transactions:
+        txn['_shares'] = int(txn['shares']) if txn['shares'] else 0
+        txn['_price'] = float(txn['price']) if txn['price'] else 0
+
+
 def get_stocks():
-    """Load stocks from database."""
-    return db.get_stocks()
+    """Load stocks from database (shared cached list - do not mutate)."""
+    return _cached_rows(db.get_stocks)
 
 
 def get_transactions():
-    """Load transactions from database."""
-    return db.get_transactions()
+    """
+    Load transactions from database (shared cached list - do not mutate).
+
+    Each row also carries `_shares` (int) and `_price` (float), coerced once per load.
+    """
+    return _cached_rows(db.get_transactions, _add_typed_amounts)
+
 
+# Tickers with at most this many buy lots are matched with plain Python lists;
+# below this size NumPy's per-call overhead outweighs the vectorized math
+_SMALL_LOT_COUNT = 8
 
-def calculate_fifo_cost_basis(ticker, transactions):
+
+def _consume_lots_small(remaining, lot_prices, head, n_lots, shares, lots_used):
+    """Take `shares` from the open lots in order (list version); returns the total cost."""
+    total_cost = 0
+    for i in range(head, n_lots):
+        if shares <= 0:
+            break
+        left = remaining[i]
+        if left <= 0:
+            continue
+        take = left if left < shares else shares
+        total_cost += take * lot_prices[i]
+        remaining[i] = left - take
+        shares -= take
+        if lots_used is not None:
+            lots_used.append({'shares': take, 'price': lot_prices[i]})
+    return total_cost
+
+
+def _consume_lots_array(remaining, lot_prices, head, n_lots, shares, lots_used):
+    """Take `shares` from the open lots in order (NumPy version); returns the total cost."""
+    import numpy as np
+
+    available = np.maximum(remaining[head:n_lots], 0)
+    csum = available.cumsum()
+    # Last lot touched by this sell (all lots if it oversells)
+    end = min(int(np.searchsorted(csum, shares)) + 1, len(csum))
+    take = np.minimum(available[:end], shares - (csum[:end] - available[:end]))
+
+    remaining[head:head + end] -= take
+    if lots_used is not None:
+        used = np.flatnonzero(take > 0)
+        lots_used.extend(
+            {'shares': t, 'price': p}
+            for t, p in zip(take[used].tolist(), lot_prices[head + used].tolist())
+        )
+    return float((take * lot_prices[head:head + end]).sum())
+
+
+def calculate_fifo_cost_basis(ticker, transactions, include_lot_detail=True):
     """
     Calculate FIFO cost basis for sells.
 
     Args:
-        ticker: Stock ticker symbol
-        transactions: List of transaction dicts
+        ticker: Stock ticker symbol; rows for other tickers are ignored
+        transactions: List of transaction dicts, in order (rows from
+            get_transactions, or raw rows from the db module). Passing only
+            this ticker's rows, as calculate_holdings does, avoids a copy.
+        include_lot_detail: Include the per-lot breakdown ('lots_used') in
+            each sell's basis info
 
     Returns:
         Tuple of (sell_basis dict, remaining_lots list)
         - sell_basis: Dict mapping transaction id to cost basis info for sells
         - remaining_lots: List of lots with remaining shares
     """
+    # Callers that group by ticker pass pre-filtered rows; only copy when needed
+    if any(txn['ticker'] != ticker for txn in transactions):
+        transactions = [txn for txn in transactions if txn['ticker'] == ticker]
+
     # Build list of lots (buys) in order
     lots = []  # Each lot: {'shares': n, 'price': p, 'remaining': n}
     sell_basis = {}  # txn_id -> {'cost_basis': total_cost, 'shares': n, 'avg_cost_per_share': p}
 
-    for txn in transactions:
-        if txn['ticker'] != ticker:
-            continue
+    # Lot state as parallel sequences; sells consume a contiguous prefix, so `head`
+    # marks the first lot that may still have shares and `n_lots` the buys seen so far
+    buy_count = sum(1 for txn in transactions if txn['action'] == 'buy')
+    if buy_count <= _SMALL_LOT_COUNT:
+        remaining = [0] * buy_count
+        lot_prices = [0] * buy_count
+        consume_lots = _consume_lots_small
+    else:
+        import numpy as np
+        remaining = np.zeros(buy_count, dtype=np.int64)
+        lot_prices = np.zeros(buy_count, dtype=np.float64)
+        consume_lots = _consume_lots_array
+    head = n_lots = 0
 
-        shares = int(txn['shares']) if txn['shares'] else 0
-        price = float(txn['price']) if txn['price'] else 0
+    for txn in transactions:
+        # Rows from get_transactions() carry pre-coerced amounts; raw db rows don't
+        shares = txn.get('_shares')
+        if shares is None:
+            shares = int(txn['shares']) if txn['shares'] else 0
+        price = txn.get('_price')
+        if price is None:
+            price = float(txn['price']) if txn['price'] else 0
 
         if txn['action'] == 'buy':
             lots.append({'shares': shares, 'price': price, 'remaining': shares})
+            remaining[n_lots] = shares
+            lot_prices[n_lots] = price
+            n_lots += 1
         elif txn['action'] == 'sell':
             # Use FIFO to determine cost basis
-            shares_to_sell = shares
             total_cost = 0
-            lots_used = []
-
-            for lot in lots:
-                if shares_to_sell <= 0:
-                    break
-                if lot['remaining'] <= 0:
-                    continue
+            lots_used = [] if include_lot_detail else None
 
-                take = min(lot['remaining'], shares_to_sell)
-                total_cost += take * lot['price']
-                lot['remaining'] -= take
-                shares_to_sell -= take
-                lots_used.append({'shares': take, 'price': lot['price']})
+            if shares > 0 and head < n_lots:
+                total_cost = consume_lots(remaining, lot_prices, head, n_lots, shares, lots_used)
+                # Skip past lots this sell emptied
+                while head < n_lots and remaining[head] <= 0:
+                    head += 1
 
             avg_cost = total_cost / shares if shares > 0 else 0
             sell_basis[txn['id']] = {
                 'cost_basis': total_cost,
                 'shares': shares,
                 'avg_cost_per_share': avg_cost,
-                'lots_used': lots_used
             }
+            if include_lot_detail:
+                sell_basis[txn['id']]['lots_used'] = lots_used
+
+    # Write the remaining shares back to the lot dicts
+    for lot, left in zip(lots, remaining if isinstance(remaining, list) else remaining.tolist()):
+        lot['remaining'] = left
 
     return sell_basis, lots
 
@@ -97,7 +196,7 @@ def calculate_holdings(confirmed_only=False):
     transactions = get_transactions()
 
     # Group transactions by ticker, optionally filtering buys by status
-    by_ticker = {}
+    by_ticker = defaultdict(list)
     for txn in transactions:
         # If confirmed_only, skip buy transactions that aren't 'done'
         if confirmed_only and txn['action'] == 'buy':
@@ -105,15 +204,12 @@ def calculate_holdings(confirmed_only=False):
             if status != 'done':
                 continue
 
-        ticker = txn['ticker']
-        if ticker not in by_ticker:
-            by_ticker[ticker] = []
-        by_ticker[ticker].append(txn)
+        by_ticker[txn['ticker']].append(txn)
 
     holdings = {}
     for ticker, ticker_txns in by_ticker.items():
         # Calculate FIFO cost basis for this ticker
-        sell_basis, remaining_lots = calculate_fifo_cost_basis(ticker, ticker_txns)
+        sell_basis, remaining_lots = calculate_fifo_cost_basis(ticker, ticker_txns, include_lot_detail=False)
 
         # Calculate remaining shares and cost basis
         total_shares = sum(lot['remaining'] for lot in remaining_lots)
@@ -133,9 +229,10 @@ def calculate_holdings(confirmed_only=False):
         # Add transactions with computed gain percentages for sells
         for txn in ticker_txns:
             txn_copy = dict(txn)
+            del txn_copy['_shares'], txn_copy['_price']
             if txn['action'] == 'sell' and txn['id'] in sell_basis:
                 basis = sell_basis[txn['id']]
-                sell_price = float(txn['price']) if txn['price'] else 0
+                sell_price = txn['_price']
                 if basis['avg_cost_per_share'] > 0:
                     gain_pct = ((sell_price - basis['avg_cost_per_share']) / basis['avg_cost_per_share']) * 100
                     txn_copy['computed_gain_pct'] = round(gain_pct, 1)
@@ -169,28 +266,25 @@ class HoldingsService:
         """Get a summary of all holdings."""
         holdings = calculate_holdings(confirmed_only=True)
 
+        # Filter and accumulate in one pass
         total_cost = 0
-        total_shares_by_ticker = {}
-
-        for ticker, holding in holdings.items():
-            if holding['shares'] > 0:
-                total_cost += holding['total_cost']
-                total_shares_by_ticker[ticker] = holding['shares']
-
-        return {
-            'total_tickers': len([h for h in holdings.values() if h['shares'] > 0]),
-            'total_cost_basis': round(total_cost, 2),
-            'holdings': {
-                ticker: {
+        summary_holdings = {}
+        for ticker, h in holdings.items():
+            if h['shares'] > 0:
+                total_cost += h['total_cost']
+                summary_holdings[ticker] = {
                     'shares': h['shares'],
                     'avg_cost': round(h['avg_cost'], 2),
                     'total_cost': round(h['total_cost'], 2)
                 }
-                for ticker, h in holdings.items() if h['shares'] > 0
-            }
+
+        return {
+            'total_tickers': len(summary_holdings),
+            'total_cost_basis': round(total_cost, 2),
+            'holdings': summary_holdings
         }
 
-    def get_sell_candidates(self, valuations, threshold_overvalued=10, threshold_gain=30):
+    def get_sell_candidates(self, valuations, threshold_overvalued=10, threshold_gain=30, holdings=None):
         """
         Identify stocks that should be considered for selling.
 
@@ -198,11 +292,14 @@ class HoldingsService:
             valuations: Dict of valuation data by ticker
             threshold_overvalued: % above fair value to flag
             threshold_gain: % gain from cost basis to flag
+            holdings: Confirmed holdings already computed by the caller
+                (calculated if omitted)
 
         Returns:
             List of sell candidate dicts
         """
-        holdings = calculate_holdings(confirmed_only=True)
+        if holdings is None:
+            holdings = calculate_holdings(confirmed_only=True)
         candidates = []
 
         for ticker, holding in holdings.items():
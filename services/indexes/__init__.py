@@ -12,6 +12,7 @@ from .providers import (
     IndexOrchestrator,
     get_index_orchestrator,
     fetch_index_tickers as fetch_index_tickers_from_provider,
+    fetch_all_index_tickers,
 )
 
 # Re-export from registry
@@ -35,6 +36,7 @@ __all__ = [
     'IndexOrchestrator',
     'get_index_orchestrator',
     'fetch_index_tickers_from_provider',
+    'fetch_all_index_tickers',
     # Registry
     'IndexDefinition',
     'IndexRegistry',
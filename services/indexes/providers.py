@@ -6,15 +6,33 @@ architecture for fetching index constituents from multiple sources with
 automatic fallback when a source fails or returns stale data.
 """
 
+import atexit
+import itertools
+import json
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from io import StringIO
 
-from config import INDEX_PROVIDER_TIMEOUT
+from config import (
+    INDEX_PROVIDER_TIMEOUT, INDEX_PROVIDER_CACHE_TTL, INDEX_PROVIDER_HEDGE_DELAY, INDEX_CACHE_FILE,
+    INDEX_RESULTS_FILE
+)
+
+try:
+    import lxml.html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
 
 
 # =============================================================================
@@ -53,6 +71,179 @@ def _read_html_safe(html_content: str, **kwargs) -> list:
     return pd.read_html(StringIO(html_content), **kwargs)
 
 
+def _cell_text(cell) -> str:
+    """Whitespace-normalized text of a table cell."""
+    return ' '.join(cell.text_content().split())
+
+
+def _cell_span(cell, attr: str) -> int:
+    """colspan/rowspan of a cell (1 when missing or malformed)."""
+    try:
+        return max(int(cell.get(attr, 1)), 1)
+    except ValueError:
+        return 1
+
+
+class _HtmlTable:
+    """
+    Column access to one HTML <table> via lxml, without building a DataFrame.
+
+    Header rows are found the way pd.read_html does (<thead>, else leading
+    all-<th> rows); only the cells of a requested column are extracted.
+    """
+
+    def __init__(self, element):
+        # Like pd.read_html(displayed_only=True), drop hidden content (including
+        # hidden rows) once, before any rows or headers are collected
+        for hidden in element.xpath('.//style | .//*[contains(translate(@style, " ", ""), "display:none")]'):
+            hidden.drop_tree()
+
+        header_rows = element.xpath('./thead/tr')
+        body_rows = element.xpath('./tbody/tr | ./tr')
+        if not header_rows:
+            while body_rows and all(c.tag == 'th' for c in body_rows[0].xpath('./td | ./th')):
+                header_rows.append(body_rows.pop(0))
+        self._body_rows = body_rows + element.xpath('./tfoot/tr')
+
+        self.columns = []
+        if header_rows:
+            for cell in header_rows[0].xpath('./td | ./th'):
+                self.columns.extend([_cell_text(cell)] * _cell_span(cell, 'colspan'))
+
+    def __getitem__(self, name: str) -> List[str]:
+        """Text of every body cell in a column ('' for missing cells)."""
+        idx = self.columns.index(name)
+
+        values = []
+        pending = {}  # column -> [rows left, text] for cells spanning down
+        for row in self._body_rows:
+            cells = iter(row.xpath('./td | ./th'))
+            col, value = 0, ''
+            while col <= idx:
+                if col in pending:
+                    span = pending[col]
+                    text, width = span[1], 1
+                    span[0] -= 1
+                    if span[0] == 0:
+                        del pending[col]
+                else:
+                    cell = next(cells, None)
+                    if cell is None:
+                        break
+                    text, width = _cell_text(cell), _cell_span(cell, 'colspan')
+                    rowspan = _cell_span(cell, 'rowspan')
+                    if rowspan > 1:
+                        for c in range(col, col + width):
+                            pending[c] = [rowspan - 1, text]
+                if col + width > idx:
+                    value = text
+                col += width
+            values.append(value)
+        return values
+
+
+class _FrameTable:
+    """_HtmlTable interface over a pd.read_html() DataFrame (fallback without lxml)."""
+
+    def __init__(self, frame: pd.DataFrame):
+        self._frame = frame
+        self.columns = list(frame.columns)
+
+    def __getitem__(self, name: str) -> List[str]:
+        return ['' if pd.isna(v) else str(v) for v in self._frame[name].tolist()]
+
+
+def _read_html_tables(html_content: str) -> list:
+    """
+    Return the tables of an HTML page, indexed the same way as pd.read_html().
+
+    With lxml the page is only parsed into a tree; cells are read on demand
+    from the column that is actually needed.
+    """
+    if not HAS_LXML:
+        return [_FrameTable(frame) for frame in _read_html_safe(html_content)]
+
+    parser = lxml.html.HTMLParser(encoding='utf-8')
+    doc = lxml.html.document_fromstring(html_content.encode('utf-8'), parser=parser)
+    tables = []
+    for element in doc.xpath('//table[.//text()[normalize-space()]]'):
+        if 'display:none' in element.get('style', '').replace(' ', ''):
+            continue
+        table = _HtmlTable(element)
+        # pd.read_html skips tables without any rows
+        if table.columns or table._body_rows:
+            tables.append(table)
+    return tables
+
+
+class _LineStream:
+    """Read-only text file over an iterator of lines, so pd.read_csv can consume a stream."""
+
+    def __init__(self, lines):
+        self._lines = iter(lines)
+        self._buffer = ''
+
+    def read(self, size: int = -1) -> str:
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        while size < 0 or length < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            chunks.append(line)
+            chunks.append('\n')
+            length += len(line) + 1
+        data = ''.join(chunks)
+        if 0 <= size < length:
+            data, self._buffer = data[:size], data[size:]
+        else:
+            self._buffer = ''
+        return data
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> str:
+        # Left over from a partial read(); it always ends on a line boundary
+        if self._buffer:
+            end = self._buffer.find('\n') + 1 or len(self._buffer)
+            line, self._buffer = self._buffer[:end], self._buffer[end:]
+            return line
+        return next(self._lines) + '\n'
+
+
+# =============================================================================
+# Constituent Page Cache
+# =============================================================================
+
+# URL -> {'etag', 'last_modified', 'tickers', 'timestamp'}, persisted to INDEX_CACHE_FILE
+_page_cache: Optional[Dict[str, Dict]] = None
+_page_cache_lock = threading.Lock()
+
+
+def _load_page_cache() -> Dict[str, Dict]:
+    """Load the constituent page cache from disk (once per process)."""
+    global _page_cache
+    if _page_cache is None:
+        try:
+            with open(INDEX_CACHE_FILE, 'r') as f:
+                _page_cache = json.load(f)
+        except (OSError, ValueError):
+            _page_cache = {}
+    return _page_cache
+
+
+def _save_page_cache() -> None:
+    """Write the constituent page cache to disk atomically."""
+    tmp_path = INDEX_CACHE_FILE + '.tmp'
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(_page_cache, f)
+        os.replace(tmp_path, INDEX_CACHE_FILE)
+    except OSError as e:
+        print(f"[IndexCache] Error saving: {e}")
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
@@ -104,12 +295,13 @@ class IndexProvider(ABC):
         pass
 
     @abstractmethod
-    def fetch_constituents(self, index_id: str) -> IndexResult:
+    def fetch_constituents(self, index_id: str, force_refresh: bool = False) -> IndexResult:
         """
         Fetch current constituents for an index.
 
         Args:
             index_id: Index identifier (e.g., 'sp500', 'russell2000')
+            force_refresh: Contact the source even if a cached copy is fresh
 
         Returns:
             IndexResult with tickers list on success
@@ -128,6 +320,100 @@ class IndexProvider(ABC):
         """Normalize ticker symbol (e.g., BRK.B -> BRK-B)."""
         return ticker.replace('.', '-').upper().strip()
 
+    def _normalize_tickers(self, column: pd.Series, exclude_prefix: Optional[str] = None) -> Tuple[List[str], int]:
+        """
+        Vectorized _normalize_ticker over a DataFrame column.
+
+        Missing/blank values (and tickers starting with exclude_prefix) are
+        dropped in a single mask; duplicates are removed, keeping the first.
+
+        Returns:
+            (tickers, number of duplicates removed)
+        """
+        tickers = column.astype('string').str.replace('.', '-', regex=False).str.upper().str.strip()
+        keep = tickers.notna() & tickers.ne('')
+        if exclude_prefix:
+            keep &= ~tickers.str.startswith(exclude_prefix)
+        tickers = tickers[keep.fillna(False)]
+        unique = tickers.drop_duplicates()
+        return unique.tolist(), len(tickers) - len(unique)
+
+    def _normalize_ticker_list(self, values: List[str], exclude: frozenset = frozenset({''})) -> Tuple[List[str], int]:
+        """
+        _normalize_tickers for a parsed HTML column (a plain list of cell text).
+
+        Normalizes, drops any value in exclude (a set lookup per ticker) and
+        removes duplicates, keeping the first.
+
+        Returns:
+            (tickers, number of duplicates removed)
+        """
+        tickers = [t for t in map(self._normalize_ticker, values) if t not in exclude]
+        unique = list(dict.fromkeys(tickers))
+        return unique, len(tickers) - len(unique)
+
+    def _conditional_fetch(self, url: str, force_refresh: bool = False) -> Tuple[Optional[List[str]], Optional[requests.Response]]:
+        """
+        Fetch a constituent page unless the on-disk cache can answer.
+
+        Cached tickers are reused without a request while younger than
+        INDEX_PROVIDER_CACHE_TTL (unless force_refresh); otherwise the page is
+        revalidated with If-None-Match / If-Modified-Since and a 304 reuses
+        them as well.
+
+        Returns:
+            (cached tickers, None) on a cache hit, (None, response) when the
+            page must be parsed (store the result with _cache_tickers)
+        """
+        with _page_cache_lock:
+            cached = _load_page_cache().get(url)
+
+        if cached and not force_refresh and time.time() - cached['timestamp'] < INDEX_PROVIDER_CACHE_TTL:
+            return list(cached['tickers']), None
+
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        resp = _session.get(url, headers=headers, timeout=INDEX_PROVIDER_TIMEOUT)
+        if resp.status_code == 304 and cached:
+            with _page_cache_lock:
+                cached['timestamp'] = time.time()
+                _save_page_cache()
+            return list(cached['tickers']), None
+
+        resp.raise_for_status()
+        return None, resp
+
+    def _cache_tickers(self, url: str, resp: requests.Response, tickers: List[str]) -> None:
+        """Remember parsed tickers together with the page's cache validators."""
+        with _page_cache_lock:
+            _load_page_cache()[url] = {
+                'etag': resp.headers.get('ETag'),
+                'last_modified': resp.headers.get('Last-Modified'),
+                'tickers': list(tickers),  # the caller returns its own list
+                'timestamp': time.time(),
+            }
+            _save_page_cache()
+
+
+# Shared session: keeps connections to each provider host alive across fetches
+# and index refreshes. Transient gateway errors are retried with backoff; the
+# final response is still returned to the caller.
+_session = requests.Session()
+_session.headers.update(IndexProvider.HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+)
+_session.mount('http://', _adapter)
+_session.mount('https://', _adapter)
+atexit.register(_session.close)
+
 
 # =============================================================================
 # Wikipedia Provider
@@ -173,7 +459,7 @@ class WikipediaIndexProvider(IndexProvider):
     def supported_indexes(self) -> List[str]:
         return list(self.INDEX_CONFIG.keys())
 
-    def fetch_constituents(self, index_id: str) -> IndexResult:
+    def fetch_constituents(self, index_id: str, force_refresh: bool = False) -> IndexResult:
         if index_id not in self.INDEX_CONFIG:
             return IndexResult(
                 success=False,
@@ -185,10 +471,16 @@ class WikipediaIndexProvider(IndexProvider):
         url, table_idx, col_name = self.INDEX_CONFIG[index_id]
 
         try:
-            resp = requests.get(url, headers=self.HEADERS, timeout=INDEX_PROVIDER_TIMEOUT)
-            resp.raise_for_status()
+            cached, resp = self._conditional_fetch(url, force_refresh)
+            if cached is not None:
+                return IndexResult(
+                    success=True,
+                    tickers=cached,
+                    source=self.name,
+                    metadata={'url': url, 'count': len(cached), 'cached': True}
+                )
 
-            tables = _read_html_safe(resp.text)
+            tables = _read_html_tables(resp.text)
             if table_idx >= len(tables):
                 return IndexResult(
                     success=False,
@@ -206,14 +498,15 @@ class WikipediaIndexProvider(IndexProvider):
                     error=f"Column '{col_name}' not found. Available: {list(table.columns)}"
                 )
 
-            tickers = [self._normalize_ticker(t) for t in table[col_name].tolist()]
-            tickers = [t for t in tickers if t]  # Remove empty
+            tickers, dedup_removed = self._normalize_ticker_list(table[col_name])
+            if tickers:
+                self._cache_tickers(url, resp, tickers)
 
             return IndexResult(
                 success=True,
                 tickers=tickers,
                 source=self.name,
-                metadata={'url': url, 'count': len(tickers)}
+                metadata={'url': url, 'count': len(tickers), 'dedup_removed': dedup_removed}
             )
 
         except requests.RequestException as e:
@@ -250,6 +543,9 @@ class SlickchartsIndexProvider(IndexProvider):
         'dow30': ('https://www.slickcharts.com/dowjones', 'Symbol'),
     }
 
+    # Cell values that are not tickers (blank, or pandas' NaN rendered as text)
+    EXCLUDED_VALUES = frozenset({'', 'NAN'})
+
     @property
     def name(self) -> str:
         return 'slickcharts'
@@ -262,7 +558,7 @@ class SlickchartsIndexProvider(IndexProvider):
     def supported_indexes(self) -> List[str]:
         return list(self.INDEX_CONFIG.keys())
 
-    def fetch_constituents(self, index_id: str) -> IndexResult:
+    def fetch_constituents(self, index_id: str, force_refresh: bool = False) -> IndexResult:
         if index_id not in self.INDEX_CONFIG:
             return IndexResult(
                 success=False,
@@ -274,10 +570,16 @@ class SlickchartsIndexProvider(IndexProvider):
         url, col_name = self.INDEX_CONFIG[index_id]
 
         try:
-            resp = requests.get(url, headers=self.HEADERS, timeout=INDEX_PROVIDER_TIMEOUT)
-            resp.raise_for_status()
+            cached, resp = self._conditional_fetch(url, force_refresh)
+            if cached is not None:
+                return IndexResult(
+                    success=True,
+                    tickers=cached,
+                    source=self.name,
+                    metadata={'url': url, 'count': len(cached), 'cached': True}
+                )
 
-            tables = _read_html_safe(resp.text)
+            tables = _read_html_tables(resp.text)
             if not tables:
                 return IndexResult(
                     success=False,
@@ -301,14 +603,15 @@ class SlickchartsIndexProvider(IndexProvider):
                     error=f"No table with '{col_name}' column found"
                 )
 
-            tickers = [self._normalize_ticker(str(t)) for t in table[col_name].tolist()]
-            tickers = [t for t in tickers if t and t != 'NAN']
+            tickers, dedup_removed = self._normalize_ticker_list(table[col_name], self.EXCLUDED_VALUES)
+            if tickers:
+                self._cache_tickers(url, resp, tickers)
 
             return IndexResult(
                 success=True,
                 tickers=tickers,
                 source=self.name,
-                metadata={'url': url, 'count': len(tickers)}
+                metadata={'url': url, 'count': len(tickers), 'dedup_removed': dedup_removed}
             )
 
         except Exception as e:
@@ -342,6 +645,9 @@ class iSharesIndexProvider(IndexProvider):
         ),
     }
 
+    # Holdings column used to keep equities only
+    ASSET_CLASS_COL = 'Asset Class'
+
     @property
     def name(self) -> str:
         return 'ishares'
@@ -354,7 +660,7 @@ class iSharesIndexProvider(IndexProvider):
     def supported_indexes(self) -> List[str]:
         return list(self.ETF_CONFIG.keys())
 
-    def fetch_constituents(self, index_id: str) -> IndexResult:
+    def fetch_constituents(self, index_id: str, force_refresh: bool = False) -> IndexResult:
         if index_id not in self.ETF_CONFIG:
             return IndexResult(
                 success=False,
@@ -366,37 +672,42 @@ class iSharesIndexProvider(IndexProvider):
         url, ticker_col = self.ETF_CONFIG[index_id]
 
         try:
-            resp = requests.get(url, headers=self.HEADERS, timeout=INDEX_PROVIDER_TIMEOUT)
-            resp.raise_for_status()
-
-            # iShares CSV has metadata rows at the top
-            lines = resp.text.split('\n')
-
-            # Find the header row (starts with "Ticker,")
-            data_start = 0
-            as_of_date = None
-            for i, line in enumerate(lines):
-                if line.startswith('Fund Holdings as of,'):
-                    as_of_date = line.split(',')[1].strip('"')
-                if line.startswith('Ticker,'):
-                    data_start = i
-                    break
-
-            if data_start == 0:
-                return IndexResult(
-                    success=False,
-                    tickers=[],
-                    source=self.name,
-                    error="Could not find header row in iShares CSV"
+            with _session.get(url, timeout=INDEX_PROVIDER_TIMEOUT, stream=True) as resp:
+                resp.raise_for_status()
+                resp.encoding = resp.encoding or 'utf-8'
+
+                # iShares CSV has metadata rows at the top; read lines only up to
+                # the header row (starts with "Ticker,")
+                lines = resp.iter_lines(decode_unicode=True)
+                header = None
+                as_of_date = None
+                for line in lines:
+                    if line.startswith('Fund Holdings as of,'):
+                        as_of_date = line.split(',')[1].strip('"')
+                    if line.startswith('Ticker,'):
+                        header = line
+                        break
+
+                if header is None:
+                    return IndexResult(
+                        success=False,
+                        tickers=[],
+                        source=self.name,
+                        error="Could not find header row in iShares CSV"
+                    )
+
+                # Parse the rest straight from the response stream, materializing
+                # only the ticker and asset class columns
+                wanted = {ticker_col, self.ASSET_CLASS_COL}
+                df = pd.read_csv(
+                    _LineStream(itertools.chain([header], lines)),
+                    usecols=lambda column: column in wanted,
+                    dtype={ticker_col: 'string'}
                 )
 
-            # Parse from data start
-            csv_data = '\n'.join(lines[data_start:])
-            df = pd.read_csv(StringIO(csv_data))
-
             # Filter to equities only (exclude cash, derivatives)
-            if 'Asset Class' in df.columns:
-                df = df[df['Asset Class'] == 'Equity']
+            if self.ASSET_CLASS_COL in df.columns:
+                df = df[df[self.ASSET_CLASS_COL] == 'Equity']
 
             if ticker_col not in df.columns:
                 return IndexResult(
@@ -406,8 +717,7 @@ class iSharesIndexProvider(IndexProvider):
                     error=f"Column '{ticker_col}' not found in CSV"
                 )
 
-            tickers = [self._normalize_ticker(str(t)) for t in df[ticker_col].tolist()]
-            tickers = [t for t in tickers if t and t != 'NAN' and not t.startswith('-')]
+            tickers, dedup_removed = self._normalize_tickers(df[ticker_col], exclude_prefix='-')
 
             return IndexResult(
                 success=True,
@@ -416,6 +726,7 @@ class iSharesIndexProvider(IndexProvider):
                 metadata={
                     'url': url,
                     'count': len(tickers),
+                    'dedup_removed': dedup_removed,
                     'as_of_date': as_of_date
                 }
             )
@@ -460,7 +771,7 @@ class GitHubIndexProvider(IndexProvider):
     def supported_indexes(self) -> List[str]:
         return list(self.INDEX_CONFIG.keys())
 
-    def fetch_constituents(self, index_id: str) -> IndexResult:
+    def fetch_constituents(self, index_id: str, force_refresh: bool = False) -> IndexResult:
         if index_id not in self.INDEX_CONFIG:
             return IndexResult(
                 success=False,
@@ -472,10 +783,15 @@ class GitHubIndexProvider(IndexProvider):
         url, col_name, last_update = self.INDEX_CONFIG[index_id]
 
         try:
-            resp = requests.get(url, headers=self.HEADERS, timeout=INDEX_PROVIDER_TIMEOUT)
+            resp = _session.get(url, timeout=INDEX_PROVIDER_TIMEOUT)
             resp.raise_for_status()
 
-            df = pd.read_csv(StringIO(resp.text))
+            # Only the ticker column is materialized
+            df = pd.read_csv(
+                StringIO(resp.text),
+                usecols=lambda column: column == col_name,
+                dtype={col_name: 'string'}
+            )
 
             if col_name not in df.columns:
                 return IndexResult(
@@ -485,8 +801,7 @@ class GitHubIndexProvider(IndexProvider):
                     error=f"Column '{col_name}' not found"
                 )
 
-            tickers = [self._normalize_ticker(str(t)) for t in df[col_name].tolist()]
-            tickers = [t for t in tickers if t]
+            tickers, dedup_removed = self._normalize_tickers(df[col_name])
 
             return IndexResult(
                 success=True,
@@ -495,6 +810,7 @@ class GitHubIndexProvider(IndexProvider):
                 metadata={
                     'url': url,
                     'count': len(tickers),
+                    'dedup_removed': dedup_removed,
                     'last_update': last_update,
                     'warning': f'Source last updated {last_update} - data may be stale'
                 }
@@ -521,6 +837,13 @@ class IndexOrchestrator:
     Tracks provider health and can skip failing providers.
     """
 
+    # Circuit breaker: open after 3 failures within an hour; retry after a
+    # cooldown that doubles on each failed test request, up to 15 minutes
+    BREAKER_FAILURE_THRESHOLD = 3
+    BREAKER_FAILURE_WINDOW = 3600
+    BREAKER_COOLDOWN = 60
+    BREAKER_MAX_COOLDOWN = 900
+
     # Provider priority order per index
     # First provider is tried first, then fallbacks
     PROVIDER_ORDER = {
@@ -536,9 +859,33 @@ class IndexOrchestrator:
         self._providers: Dict[str, IndexProvider] = {}
         self._register_providers()
 
-        # Track failures for circuit breaker pattern
-        self._failures: Dict[str, int] = {}
-        self._failure_threshold = 3
+        # Track provider health (imported here: services.providers imports the
+        # database layer, which imports this package)
+        from services.providers.circuit_breaker import CircuitBreaker
+        self._breaker = CircuitBreaker(
+            failure_threshold=self.BREAKER_FAILURE_THRESHOLD,
+            failure_window_seconds=self.BREAKER_FAILURE_WINDOW,
+            cooldown_seconds=self.BREAKER_COOLDOWN,
+            max_cooldown_seconds=self.BREAKER_MAX_COOLDOWN,
+        )
+
+        # Successful results per index: index_id -> (monotonic time, result)
+        self._cache: Dict[str, Tuple[float, IndexResult]] = {}
+        self._ttl_seconds = INDEX_PROVIDER_CACHE_TTL
+
+        # Provider attempts run here so a slow provider can be hedged with the next one
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='index-fetch')
+        self._hedge_delay = INDEX_PROVIDER_HEDGE_DELAY
+
+        # Last successful result per index, persisted so a restart starts warm
+        # and a total provider outage can still serve the previous list
+        self._disk_cache_path = INDEX_RESULTS_FILE
+        self._last_good: Optional[Dict[str, Dict]] = None
+        self._last_good_lock = threading.Lock()
+
+        # Fetches underway per index; concurrent callers wait on the same future
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
 
     def _register_providers(self):
         """Register all available index providers."""
@@ -551,6 +898,16 @@ class IndexOrchestrator:
         for p in providers:
             self._providers[p.name] = p
 
+        # Provider order and capabilities are fixed from here on, so resolve
+        # each index's fallback chain once instead of on every fetch
+        self._resolved_order: Dict[str, List[IndexProvider]] = {
+            index_id: [
+                self._providers[name] for name in names
+                if name in self._providers and self._providers[name].supports_index(index_id)
+            ]
+            for index_id, names in self.PROVIDER_ORDER.items()
+        }
+
     def get_provider(self, name: str) -> Optional[IndexProvider]:
         """Get a provider by name."""
         return self._providers.get(name)
@@ -569,24 +926,63 @@ class IndexOrchestrator:
 
     def get_providers_for_index(self, index_id: str) -> List[IndexProvider]:
         """Get providers that support an index, in priority order."""
-        order = self.PROVIDER_ORDER.get(index_id, [])
-        providers = []
+        return [p for p in self._resolved_order.get(index_id, ()) if p.is_available()]
 
-        for name in order:
-            if name in self._providers:
-                p = self._providers[name]
-                if p.is_available() and p.supports_index(index_id):
-                    providers.append(p)
+    def fetch_constituents(self, index_id: str, force_refresh: bool = False) -> IndexResult:
+        """
+        Fetch constituents for an index, trying providers in order (a provider
+        slower than INDEX_PROVIDER_HEDGE_DELAY is raced against the next one).
 
-        return providers
+        Returns result from first successful provider, reusing it for
+        INDEX_PROVIDER_CACHE_TTL seconds unless force_refresh is set.
+        If all fail, returns the last-known-good list flagged as stale
+        (source 'cache'), or an error with combined failure messages.
+        """
+        entry = self._cache.get(index_id)
+        if entry and not force_refresh and time.monotonic() - entry[0] < self._ttl_seconds:
+            return entry[1]
+
+        # Single-flight: a fetch already underway for this index (e.g. the UI and
+        # the scheduler refreshing together) is shared rather than repeated
+        with self._inflight_lock:
+            future = self._inflight.get(index_id)
+            owner = future is None
+            if owner:
+                future = self._inflight[index_id] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            result = self._fetch_uncached(index_id, force_refresh)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(index_id, None)
+        return result
 
-    def fetch_constituents(self, index_id: str) -> IndexResult:
+    def fetch_all(self, index_ids: List[str], force_refresh: bool = False) -> Dict[str, IndexResult]:
         """
-        Fetch constituents for an index, trying providers in order.
+        Fetch constituents for several indexes concurrently.
 
-        Returns result from first successful provider.
-        If all fail, returns error with combined failure messages.
+        The indexes are served by independent hosts, so refreshing them all
+        takes about as long as the slowest one rather than the sum.
         """
+        if not index_ids:
+            return {}
+        # A pool of its own: each fetch waits on provider attempts in self._executor
+        with ThreadPoolExecutor(max_workers=len(index_ids), thread_name_prefix='index-refresh') as pool:
+            futures = {
+                index_id: pool.submit(self.fetch_constituents, index_id, force_refresh)
+                for index_id in index_ids
+            }
+            return {index_id: future.result() for index_id, future in futures.items()}
+
+    def _fetch_uncached(self, index_id: str, force_refresh: bool = False) -> IndexResult:
+        """Run the provider fallback chain for an index (see fetch_constituents)."""
         providers = self.get_providers_for_index(index_id)
 
         try:
@@ -609,31 +1005,62 @@ class IndexOrchestrator:
             )
 
         errors = []
-        for provider in providers:
-            # Skip providers that have failed too many times
-            if self._failures.get(provider.name, 0) >= self._failure_threshold:
-                errors.append(f"{provider.name}: circuit breaker open")
+        remaining = list(providers)
+        in_flight = {}  # future -> provider
+
+        def start_next() -> bool:
+            """Start the next provider (its circuit is checked once the attempt runs)."""
+            if not remaining:
+                return False
+            provider = remaining.pop(0)
+            in_flight[self._executor.submit(self._attempt, provider, index_id, force_refresh)] = provider
+            return True
+
+        # Providers run in priority order, but one that hasn't answered within the
+        # hedge delay gets the next provider started alongside it; first success wins
+        start_next()
+        while in_flight:
+            done, _ = wait(in_flight, timeout=self._hedge_delay if remaining else None,
+                           return_when=FIRST_COMPLETED)
+            if not done:
+                start_next()
                 continue
 
+            failed = 0
+            for future in done:
+                provider = in_flight.pop(future)
+                result, error = future.result()
+                if result is None:
+                    errors.append(f"{provider.name}: {error}")
+                    failed += 1
+                    continue
+
+                # Slower attempts still record their outcome, but the result is ours;
+                # attempts cancelled before running never took a breaker reservation
+                for other in in_flight:
+                    other.cancel()
+                self._cache[index_id] = (time.monotonic(), result)
+                self._save_last_good(index_id, result)
+                try:
+                    from services.activity_log import activity_log
+                    activity_log.log("success", "index", f"{index_id}: {len(result.tickers)} tickers from {provider.name}")
+                except Exception:
+                    pass
+                return result
+
+            # A failed attempt hands its slot to the next provider right away
+            for _ in range(failed):
+                start_next()
+
+        stale = self._stale_result(index_id)
+        if stale:
             try:
-                result = provider.fetch_constituents(index_id)
-
-                if result.success and len(result.tickers) > 0:
-                    # Reset failure count on success
-                    self._failures[provider.name] = 0
-                    try:
-                        from services.activity_log import activity_log
-                        activity_log.log("success", "index", f"{index_id}: {len(result.tickers)} tickers from {provider.name}")
-                    except Exception:
-                        pass
-                    return result
-                else:
-                    errors.append(f"{provider.name}: {result.error or 'empty result'}")
-                    self._failures[provider.name] = self._failures.get(provider.name, 0) + 1
-
-            except Exception as e:
-                errors.append(f"{provider.name}: {str(e)}")
-                self._failures[provider.name] = self._failures.get(provider.name, 0) + 1
+                from services.activity_log import activity_log
+                activity_log.log("warning", "index", f"{index_id}: all providers failed, "
+                                 f"using last known list ({stale.metadata['age_hours']}h old)")
+            except Exception:
+                pass
+            return stale
 
         try:
             from services.activity_log import activity_log
@@ -647,12 +1074,113 @@ class IndexOrchestrator:
             error=f"All providers failed: {'; '.join(errors)}"
         )
 
+    def _attempt(self, provider: IndexProvider, index_id: str,
+                 force_refresh: bool = False) -> Tuple[Optional[IndexResult], Optional[str]]:
+        """
+        Run one provider fetch and record its outcome with the circuit breaker.
+
+        The circuit is checked here rather than at submit time: a half-open
+        circuit reserves its single test request in can_execute(), and only an
+        attempt that actually runs is guaranteed to release it again.
+
+        Returns:
+            (result, None) on a non-empty success, otherwise (None, error message)
+        """
+        # Skip providers whose circuit is open (or already being tested)
+        if not self._breaker.can_execute(provider.name):
+            return None, 'circuit breaker open'
+
+        try:
+            result = provider.fetch_constituents(index_id, force_refresh)
+        except Exception as e:
+            self._breaker.record_failure(provider.name)
+            return None, str(e)
+
+        if result.success and len(result.tickers) > 0:
+            self._breaker.record_success(provider.name)
+            return result, None
+        self._breaker.record_failure(provider.name)
+        return None, result.error or 'empty result'
+
+    def _load_last_good(self) -> Dict[str, Dict]:
+        """Load the last-known-good results from disk (once; caller holds _last_good_lock)."""
+        if self._last_good is None:
+            try:
+                with open(self._disk_cache_path, 'r') as f:
+                    self._last_good = json.load(f)
+            except (OSError, ValueError):
+                self._last_good = {}
+        return self._last_good
+
+    def _save_last_good(self, index_id: str, result: IndexResult):
+        """Persist a successful result as the index's last-known-good list."""
+        with self._last_good_lock:
+            self._load_last_good()[index_id] = {
+                'tickers': list(result.tickers),
+                'source': result.source,
+                'timestamp': time.time(),
+                'as_of_date': result.metadata.get('as_of_date'),
+            }
+            tmp_path = self._disk_cache_path + '.tmp'
+            try:
+                with open(tmp_path, 'w') as f:
+                    json.dump(self._last_good, f)
+                os.replace(tmp_path, self._disk_cache_path)
+            except OSError as e:
+                print(f"[IndexCache] Error saving: {e}")
+
+    def _stale_result(self, index_id: str) -> Optional[IndexResult]:
+        """The last-known-good list for an index, flagged stale (None if never fetched)."""
+        with self._last_good_lock:
+            entry = self._load_last_good().get(index_id)
+        if not entry:
+            return None
+        return IndexResult(
+            success=True,
+            tickers=list(entry['tickers']),
+            source='cache',
+            timestamp=datetime.fromtimestamp(entry['timestamp']),
+            metadata={
+                'stale': True,
+                'age_hours': round((time.time() - entry['timestamp']) / 3600, 1),
+                'original_source': entry['source'],
+                'as_of_date': entry.get('as_of_date'),
+                'count': len(entry['tickers']),
+            }
+        )
+
+    def warm_from_disk(self):
+        """Seed the in-memory cache with persisted results that are still within the TTL."""
+        with self._last_good_lock:
+            entries = dict(self._load_last_good())
+        now = time.time()
+        for index_id, entry in entries.items():
+            age = now - entry['timestamp']
+            if index_id in self._cache or not 0 <= age < self._ttl_seconds:
+                continue
+            result = IndexResult(
+                success=True,
+                tickers=list(entry['tickers']),
+                source=entry['source'],
+                timestamp=datetime.fromtimestamp(entry['timestamp']),
+                metadata={'count': len(entry['tickers']), 'as_of_date': entry.get('as_of_date'), 'cached': True}
+            )
+            # Backdate so the entry expires when it would have in the original process
+            self._cache[index_id] = (time.monotonic() - age, result)
+
+    def invalidate(self, index_id: Optional[str] = None):
+        """Drop cached constituents for one index (or all)."""
+        if index_id:
+            self._cache.pop(index_id, None)
+        else:
+            self._cache.clear()
+
     def reset_circuit_breaker(self, provider_name: Optional[str] = None):
-        """Reset failure counts for provider(s)."""
+        """Reset the circuit for provider(s) to closed."""
         if provider_name:
-            self._failures[provider_name] = 0
+            self._breaker.reset_provider(provider_name)
         else:
-            self._failures.clear()
+            self._breaker.reset_all()
 
     def get_index_info(self, index_id: str) -> Dict:
         """Get info about available providers for an index."""
@@ -663,9 +1191,10 @@ class IndexOrchestrator:
                 {
                     'name': p.name,
                     'display_name': p.display_name,
-                    'failures': self._failures.get(p.name, 0)
+                    'failures': status['failure_count'],
+                    'circuit_state': status['state']
                 }
-                for p in providers
+                for p, status in ((p, self._breaker.get_status(p.name)) for p in providers)
             ],
             'has_providers': len(providers) > 0
         }
@@ -683,9 +1212,20 @@ def get_index_orchestrator() -> IndexOrchestrator:
     global _orchestrator
     if _orchestrator is None:
         _orchestrator = IndexOrchestrator()
+        _orchestrator.warm_from_disk()
     return _orchestrator
 
 
+def fetch_all_index_tickers(index_ids: List[str]) -> Dict[str, List[str]]:
+    """
+    Convenience function to fetch constituents of several indexes at once.
+
+    Failed indexes map to an empty list (errors logged internally).
+    """
+    results = get_index_orchestrator().fetch_all(index_ids)
+    return {index_id: r.tickers if r.success else [] for index_id, r in results.items()}
+
+
 def fetch_index_tickers(index_id: str) -> List[str]:
     """
     Convenience function to fetch index constituents.
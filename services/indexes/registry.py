@@ -6,7 +6,8 @@ for fetching constituents from multiple sources with automatic fallback.
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Dict
+from types import MappingProxyType
+from typing import List, Optional, Dict, Mapping, Tuple
 from enum import Enum
 
 from .providers import (
@@ -49,52 +50,57 @@ class IndexRegistry:
     system for fetching constituents.
     """
 
-    _indexes: Dict[str, IndexDefinition] = {}
-    _initialized: bool = False
-
-    @classmethod
-    def _ensure_initialized(cls):
-        """Initialize registry if not already done."""
-        if not cls._initialized:
-            for index in INDEX_DEFINITIONS:
-                cls._indexes[index.id] = index
-            cls._initialized = True
+    # Definitions are static, so every lookup table is built once here and
+    # exposed read-only; the accessors below return them without copying
+    _indexes: Mapping[str, IndexDefinition] = MappingProxyType({d.id: d for d in INDEX_DEFINITIONS})
+    _ids: Tuple[str, ...] = tuple(_indexes)
+    _all_ids: Tuple[str, ...] = ('all',) + _ids
+    _display_names: Mapping[str, tuple] = MappingProxyType({
+        'all': ('All Indexes', 'All'),
+        **{d.id: (d.name, d.short_name) for d in INDEX_DEFINITIONS},
+    })
 
     @classmethod
     def get(cls, index_id: str) -> Optional[IndexDefinition]:
         """Get an index definition by ID."""
-        cls._ensure_initialized()
         return cls._indexes.get(index_id)
 
     @classmethod
-    def list_ids(cls) -> List[str]:
-        """Get list of all index IDs (excludes 'all')."""
-        cls._ensure_initialized()
-        return list(cls._indexes.keys())
+    def list_ids(cls) -> Tuple[str, ...]:
+        """Get all index IDs (excludes 'all')."""
+        return cls._ids
 
     @classmethod
-    def list_all_ids(cls) -> List[str]:
-        """Get list of all index IDs including 'all'."""
-        cls._ensure_initialized()
-        return ['all'] + list(cls._indexes.keys())
+    def list_all_ids(cls) -> Tuple[str, ...]:
+        """Get all index IDs including 'all'."""
+        return cls._all_ids
 
     @classmethod
-    def get_display_names(cls) -> Dict[str, tuple]:
-        """Get dict of index_id -> (name, short_name) for all indexes."""
-        cls._ensure_initialized()
-        result = {'all': ('All Indexes', 'All')}
-        for idx_id, idx_def in cls._indexes.items():
-            result[idx_id] = (idx_def.name, idx_def.short_name)
-        return result
+    def get_display_names(cls) -> Mapping[str, tuple]:
+        """Get read-only mapping of index_id -> (name, short_name) for all indexes."""
+        return cls._display_names
 
     @classmethod
-    def fetch_constituents(cls, index_id: str) -> IndexResult:
+    def fetch_constituents(cls, index_id: str, force_refresh: bool = False) -> IndexResult:
         """
         Fetch current constituents from providers with automatic fallback.
 
-        Returns IndexResult with tickers list and metadata.
+        Returns IndexResult with tickers list and metadata (cached results are
+        reused within the TTL unless force_refresh is set).
+        """
+        return get_index_orchestrator().fetch_constituents(index_id, force_refresh=force_refresh)
+
+    @classmethod
+    def fetch_all_constituents(cls, index_ids: Optional[List[str]] = None,
+                               force_refresh: bool = False) -> Dict[str, IndexResult]:
+        """
+        Fetch constituents for several indexes (default: all) concurrently.
+
+        Returns dict of index_id -> IndexResult.
         """
-        return get_index_orchestrator().fetch_constituents(index_id)
+        if index_ids is None:
+            index_ids = cls.list_ids()
+        return get_index_orchestrator().fetch_all(index_ids, force_refresh=force_refresh)
 
     @classmethod
     def get_provider_info(cls, index_id: str) -> Dict:
@@ -111,18 +117,18 @@ class IndexRegistry:
 # Convenience exports for backward compatibility
 # =============================================================================
 
-def get_valid_indices() -> List[str]:
-    """Get list of valid index IDs including 'all'."""
+def get_valid_indices() -> Tuple[str, ...]:
+    """Get valid index IDs including 'all'."""
     return IndexRegistry.list_all_ids()
 
 
-def get_individual_indices() -> List[str]:
-    """Get list of individual index IDs (excludes 'all')."""
+def get_individual_indices() -> Tuple[str, ...]:
+    """Get individual index IDs (excludes 'all')."""
     return IndexRegistry.list_ids()
 
 
-def get_index_names() -> Dict[str, tuple]:
-    """Get dict of index_id -> (name, short_name)."""
+def get_index_names() -> Mapping[str, tuple]:
+    """Get read-only mapping of index_id -> (name, short_name)."""
     return IndexRegistry.get_display_names()
 
 
@@ -45,6 +45,7 @@ class ProviderCircuit:
         failure_timestamps: Times of recent failures (for windowed counting)
         last_failure_time: When the circuit was opened
         half_open_request_in_flight: Whether a test request is active
+        cooldown: Current cooldown when backing off (0 = breaker default)
     """
     state: CircuitState = CircuitState.CLOSED
     failure_count: int = 0
@@ -52,6 +53,7 @@ class ProviderCircuit:
     last_failure_time: float = 0
     last_success_time: float = 0
     half_open_request_in_flight: bool = False
+    cooldown: float = 0
 
     def reset(self):
         """Reset to closed state."""
@@ -59,6 +61,7 @@ class ProviderCircuit:
         self.failure_count = 0
         self.failure_timestamps = []
         self.half_open_request_in_flight = False
+        self.cooldown = 0
 
 
 class CircuitBreaker:
@@ -72,6 +75,8 @@ class CircuitBreaker:
         failure_threshold: Number of failures before opening circuit
         failure_window_seconds: Time window for counting failures
         cooldown_seconds: How long to wait before retrying open circuit
+        max_cooldown_seconds: If set, each failed half-open test doubles the
+            provider's cooldown up to this cap (reset when it recovers)
     """
 
     def __init__(
@@ -79,10 +84,12 @@ class CircuitBreaker:
         failure_threshold: int = 3,
         failure_window_seconds: float = 300,  # 5 minutes
         cooldown_seconds: float = 120,  # 2 minutes
+        max_cooldown_seconds: Optional[float] = None,
     ):
         self.failure_threshold = failure_threshold
         self.failure_window_seconds = failure_window_seconds
         self.cooldown_seconds = cooldown_seconds
+        self.max_cooldown_seconds = max_cooldown_seconds
 
         # Provider name -> ProviderCircuit (dynamic, not hardcoded)
         self._circuits: Dict[str, ProviderCircuit] = {}
@@ -120,7 +127,7 @@ class CircuitBreaker:
                 # Check if cooldown has expired
                 time_since_failure = now - circuit.last_failure_time
 
-                if time_since_failure >= self.cooldown_seconds:
+                if time_since_failure >= (circuit.cooldown or self.cooldown_seconds):
                     # Transition to half-open, allow one test request
                     circuit.state = CircuitState.HALF_OPEN
                     circuit.half_open_request_in_flight = True
@@ -168,10 +175,13 @@ class CircuitBreaker:
             now = time.time()
 
             if circuit.state == CircuitState.HALF_OPEN:
-                # Test request failed, reopen circuit
+                # Test request failed, reopen circuit (backing off if configured)
                 circuit.state = CircuitState.OPEN
                 circuit.last_failure_time = now
                 circuit.half_open_request_in_flight = False
+                if self.max_cooldown_seconds:
+                    circuit.cooldown = min((circuit.cooldown or self.cooldown_seconds) * 2,
+                                           self.max_cooldown_seconds)
                 return
 
             # Add failure to window
@@ -202,7 +212,7 @@ class CircuitBreaker:
             }
 
             if circuit.state == CircuitState.OPEN:
-                remaining = self.cooldown_seconds - (now - circuit.last_failure_time)
+                remaining = (circuit.cooldown or self.cooldown_seconds) - (now - circuit.last_failure_time)
                 status["cooldown_remaining_seconds"] = max(0, remaining)
 
             return status
@@ -16,6 +16,7 @@ Key characteristics:
 See: https://github.com/piotryordanov/defeatbeta-api
 """
 
+from functools import lru_cache
 from typing import Dict, List
 from datetime import datetime
 
@@ -25,8 +26,9 @@ from .base import (
 )
 
 
+@lru_cache(maxsize=1)
 def _is_defeatbeta_available() -> bool:
-    """Check if defeatbeta-api package is installed."""
+    """Check if defeatbeta-api package is installed (checked once; a failed import is not cheap to retry)."""
     try:
         import defeatbeta_api
         return True
@@ -187,8 +187,12 @@ class IBKRPriceProvider(PriceProvider):
     Supports batch fetching for efficiency.
     """
 
+    # Seconds a TWS/Gateway port probe result is reused by is_available()
+    AVAILABILITY_TTL = 30
+
     def __init__(self):
         self._connection = get_ibkr_connection()
+        self._port_probe = None  # ((host, port), monotonic expiry, reachable)
 
     @property
     def name(self) -> str:
@@ -209,23 +213,36 @@ class IBKRPriceProvider(PriceProvider):
         Returns True if:
         1. ib_async or ib_insync is installed
         2. TWS/Gateway port is reachable
+
+        The registry asks on every price lookup, so the port probe (up to a
+        1s connect timeout) is reused for AVAILABILITY_TTL seconds per host/port.
         """
         # Check if module is available
         module, _ = _get_ib_module()
         if module is None:
             return False
 
+        if self._connection.is_connected():
+            return True
+
+        host, port, _ = self._connection._get_connection_params()
+        probe = self._port_probe
+        now = time.monotonic()
+        if probe and probe[0] == (host, port) and now < probe[1]:
+            return probe[2]
+
         # Check if port is reachable (without consuming client ID)
         import socket
-        host, port, _ = self._connection._get_connection_params()
         try:
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(1)
             result = sock.connect_ex((host, port))
             sock.close()
-            return result == 0
+            reachable = result == 0
         except Exception:
-            return False
+            reachable = False
+        self._port_probe = ((host, port), now + self.AVAILABILITY_TTL, reachable)
+        return reachable
 
     @property
     def rate_limit(self) -> float:
@@ -10,7 +10,7 @@ Includes:
 """
 
 import time
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
@@ -258,18 +258,14 @@ class DataOrchestrator:
         else:
             return timedelta(minutes=5)
 
-    def _get_cached_price(self, ticker: str) -> Optional[ProviderResult]:
-        """Get cached price from database if valid."""
-        import database as db
-        ticker = ticker.upper()
-
-        valuation = db.get_valuation(ticker)
+    def _price_cache_entry(self, valuation: Optional[Dict]) -> Optional[ProviderResult]:
+        """Build a cached price result from a valuation row if still valid."""
         if not valuation:
             return None
 
         current_price = valuation.get('current_price')
         updated_str = valuation.get('updated')
-        price_source = valuation.get('price_source', 'unknown')
+        price_source = valuation.get('price_source') or 'unknown'
 
         if not current_price or not updated_str:
             return None
@@ -292,6 +288,38 @@ class DataOrchestrator:
 
         return None
 
+    def _get_cached_price(self, ticker: str) -> Optional[ProviderResult]:
+        """Get cached price from database if valid."""
+        import database as db
+        return self._price_cache_entry(db.get_valuation(ticker.upper()))
+
+    def _get_cached_price_results(self, tickers: List[str]) -> Dict[str, ProviderResult]:
+        """Get valid cached prices for several tickers with a single database read."""
+        import database as db
+        rows = db.get_cached_price_rows(tickers)
+        results = {}
+        for ticker in tickers:
+            cached = self._price_cache_entry(rows.get(ticker))
+            if cached:
+                results[ticker] = cached
+        return results
+
+    def get_cached_prices(self, tickers: List[str]) -> Tuple[Dict[str, float], List[str]]:
+        """
+        Look up prices from the database cache only, without calling providers.
+
+        Args:
+            tickers: List of ticker symbols
+
+        Returns:
+            Tuple of (hits dict mapping ticker to price, list of tickers missing or stale)
+        """
+        tickers = [t.upper() for t in tickers]
+        cached = self._get_cached_price_results(tickers)
+        hits = {t: r.data for t, r in cached.items()}
+        misses = [t for t in tickers if t not in hits]
+        return hits, misses
+
     def _save_price_to_cache(self, ticker: str, price: float, source: str):
         """Save price to database cache."""
         import database as db
@@ -461,9 +489,10 @@ class DataOrchestrator:
         # Check database cache for each ticker (unless skipping)
         remaining = []
         if not skip_cache:
+            cached_results = self._get_cached_price_results(tickers)
             for ticker in tickers:
-                cached = self._get_cached_price(ticker)
-                if cached and cached.success:
+                cached = cached_results.get(ticker)
+                if cached:
                     results[ticker] = cached.data
                     sources[ticker] = cached.source
                 else:
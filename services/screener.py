@@ -30,7 +30,7 @@ from services.providers import get_orchestrator
 from services.valuation import get_validated_eps, calculate_valuation
 from services.indexes import (
     VALID_INDICES, INDIVIDUAL_INDICES, INDEX_NAMES,
-    fetch_index_tickers
+    fetch_index_tickers, fetch_all_index_tickers
 )
 from services.activity_log import activity_log
 from services.utils import sanitize_for_json
@@ -142,8 +142,8 @@ def run_screener(index_name='all'):
             result = db.refresh_index_membership(index_name, current_tickers)
             log.info(f"[Index] Synced {index_name}: {result['total']} current")
     else:
-        for idx in INDIVIDUAL_INDICES:
-            current_tickers = fetch_index_tickers(idx)
+        # Fetch every index's constituents concurrently, then sync each
+        for idx, current_tickers in fetch_all_index_tickers(INDIVIDUAL_INDICES).items():
             if current_tickers:
                 result = db.refresh_index_membership(idx, current_tickers)
                 log.info(f"[Index] Synced {idx}: {result['total']} current")
@@ -5,6 +5,7 @@ Provides:
 - Stock info fetching (PE ratio, market cap, sector, etc.)
 - Dividend fetching
 - Price fetching (delegates to provider orchestrator)
+- Cache-only price lookups
 
 All data fetching uses the pluggable provider system (see services/providers/).
 """
@@ -58,12 +59,13 @@ def get_failed_tickers():
     return list(_persistent_failures)
 
 
-def fetch_multiple_prices(tickers):
+def fetch_multiple_prices(tickers, skip_cache=False):
     """
     Fetch prices for multiple tickers using the provider orchestrator.
 
     Args:
         tickers: List of ticker symbols
+        skip_cache: If True, bypass the price cache (e.g. for known misses)
 
     Returns:
         Dict mapping ticker to price
@@ -73,11 +75,31 @@ def fetch_multiple_prices(tickers):
 
     try:
         orchestrator = get_orchestrator()
-        return orchestrator.fetch_prices(tickers)
+        return orchestrator.fetch_prices(tickers, skip_cache=skip_cache)
     except Exception:
         return {}
 
 
+def get_cached_prices(tickers):
+    """
+    Look up cached prices without touching the network.
+
+    Args:
+        tickers: List of ticker symbols
+
+    Returns:
+        Tuple of (dict mapping ticker to cached price, list of uncached tickers)
+    """
+    if not _HAS_PROVIDERS:
+        return {}, list(tickers)
+
+    try:
+        orchestrator = get_orchestrator()
+        return orchestrator.get_cached_prices(tickers)
+    except Exception:
+        return {}, list(tickers)
+
+
 def get_stock_info(ticker):
     """
     Get comprehensive stock info: price, dividends, 52w range, etc.
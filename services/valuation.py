@@ -9,9 +9,46 @@ Provides:
 
 import math
 from datetime import datetime, timedelta
+from functools import lru_cache
 from config import PE_RATIO_MULTIPLIER, RECOMMENDED_EPS_YEARS
 
 
+@lru_cache(maxsize=1024)
+def compute_valuation_metrics(eps_values, annual_dividend, current_price, fifty_two_week_high=None):
+    """
+    Compute the core valuation numbers from already-fetched inputs.
+
+    Formula: (Average EPS + Annual Dividend) x PE_RATIO_MULTIPLIER
+
+    Pure function (cached), shared by the valuation service and refresh routes.
+
+    Args:
+        eps_values: Tuple of annual EPS values
+        annual_dividend: Annual dividend per share
+        current_price: Current price (0/None if unknown)
+        fifty_two_week_high: Optional 52-week high for off-high percentage
+
+    Returns:
+        Tuple of (eps_avg, estimated_value, price_vs_value, off_high_pct), unrounded
+    """
+    eps_avg = None
+    estimated_value = None
+    price_vs_value = None
+    off_high_pct = None
+
+    if eps_values:
+        eps_avg = sum(eps_values) / len(eps_values)
+        estimated_value = (eps_avg + annual_dividend) * PE_RATIO_MULTIPLIER
+
+        if current_price and current_price > 0 and estimated_value > 0:
+            price_vs_value = ((current_price - estimated_value) / estimated_value) * 100
+
+    if fifty_two_week_high and current_price:
+        off_high_pct = ((current_price - fifty_two_week_high) / fifty_two_week_high) * 100
+
+    return eps_avg, estimated_value, price_vs_value, off_high_pct
+
+
 def get_validated_eps(ticker):
     """
     Get EPS data using the orchestrator (SEC EDGAR first, then yfinance fallback).
@@ -160,18 +197,9 @@ def calculate_valuation(ticker):
             }
 
         # Calculate valuation: (Average EPS over up to 8 years + Annual Dividend) x multiplier
-        eps_avg = None
-        estimated_value = None
-        price_vs_value = None
-
-        if len(eps_data) > 0:
-            eps_avg = sum(e['eps'] for e in eps_data) / len(eps_data)
-
-            # Formula: (Average EPS + Annual Dividend) x PE_RATIO_MULTIPLIER
-            estimated_value = (eps_avg + annual_dividend) * PE_RATIO_MULTIPLIER
-
-            if current_price and current_price > 0 and estimated_value > 0:
-                price_vs_value = ((current_price - estimated_value) / estimated_value) * 100
+        eps_avg, estimated_value, price_vs_value, _ = compute_valuation_metrics(
+            tuple(e['eps'] for e in eps_data), annual_dividend, current_price
+        )
 
         return {
             'ticker': ticker,
@@ -97,6 +97,15 @@ class ProgressManager {
             }
         });
 
+        this.eventSource.addEventListener('log_batch', (event) => {
+            try {
+                const logEntries = JSON.parse(event.data);
+                logEntries.forEach(logEntry => this.appendLogEntry(logEntry));
+            } catch (e) {
+                console.error('Error parsing log batch event:', e);
+            }
+        });
+
         this.eventSource.addEventListener('heartbeat', (event) => {
             // Connection is alive, no action needed
         });